@@ -0,0 +1,234 @@
+"""
+Adaptive (AIMD) request pacing per 2GIS host
+
+While responses are healthy the request rate grows additively; a 429/403,
+a captcha page or a latency spike cuts it multiplicatively. The pacer only
+decides the delay - the shared rate limiter enforces it. Per-host state is
+saved to a JSON file so the next run starts from the last known good rate.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+import config
+from page_classifier import looks_like_block_page
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses that mean "slow down"
+BACKOFF_STATUSES = {403, 429, 503}
+
+
+class _HostState:
+    __slots__ = ('rate', 'latency_ewma', 'samples', 'last_backoff', 'backoffs')
+
+    def __init__(self, rate: float, latency_ewma: Optional[float] = None):
+        self.rate = rate
+        self.latency_ewma = latency_ewma
+        self.samples = 0
+        self.last_backoff = 0.0
+        self.backoffs = 0
+
+
+class AdaptivePacer:
+    """
+    AIMD controller for the delay between requests to each host
+
+    Rates are in requests per second and stay within
+    [1/PACER_MAX_DELAY, 1/PACER_MIN_DELAY].
+    """
+
+    def __init__(self, state_path: Optional[str] = None):
+        """
+        Initialize pacer and load persisted state
+
+        Args:
+            state_path: JSON file for per-host state (None disables persistence)
+        """
+        self.state_path = state_path
+        self.min_rate = 1.0 / config.PACER_MAX_DELAY
+        self.max_rate = 1.0 / config.PACER_MIN_DELAY
+        self._lock = threading.Lock()
+        self._hosts: Dict[str, _HostState] = {}
+        self._load()
+
+    def _clamp(self, rate: float) -> float:
+        return min(self.max_rate, max(self.min_rate, rate))
+
+    def _get_state(self, host: str, default_delay: float) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = _HostState(self._clamp(1.0 / default_delay))
+            self._hosts[host] = state
+        return state
+
+    def get_delay(self, host: str, default_delay: float) -> float:
+        """
+        Get the current delay between requests to host
+
+        Args:
+            host: Target host
+            default_delay: Starting delay for a host we have no state for
+
+        Returns:
+            Delay in seconds (0 if default_delay is 0, i.e. throttling is off)
+        """
+        if default_delay <= 0:
+            return 0.0
+        with self._lock:
+            return 1.0 / self._get_state(host, default_delay).rate
+
+    def observe(
+        self,
+        host: str,
+        default_delay: float,
+        status: Optional[int],
+        latency: Optional[float],
+        html: Optional[str] = None
+    ) -> Optional[str]:
+        """
+        Feed one response into the controller
+
+        Args:
+            host: Target host
+            default_delay: Starting delay for a host we have no state for
+            status: HTTP status (None if unknown, e.g. a network error)
+            latency: Response time in seconds (None if unknown)
+            html: Response body, checked for captcha pages
+
+        Returns:
+            Backoff reason ('status_429', 'captcha', 'latency', ...) or None if healthy
+        """
+        if default_delay <= 0:
+            return None
+        with self._lock:
+            state = self._get_state(host, default_delay)
+
+            reason = None
+            if status in BACKOFF_STATUSES:
+                reason = f'status_{status}'
+            elif status is not None and status < 400 and looks_like_block_page(html):
+                reason = 'captcha'
+            elif latency is not None:
+                ewma = state.latency_ewma
+                if (
+                    ewma is not None
+                    and state.samples >= config.PACER_MIN_LATENCY_SAMPLES
+                    and latency > ewma * config.PACER_LATENCY_SPIKE_FACTOR
+                ):
+                    reason = 'latency'
+                # Spikes are not folded in, so one slow response can't hide the next
+                if reason is None:
+                    alpha = config.PACER_LATENCY_EWMA_ALPHA
+                    state.latency_ewma = latency if ewma is None else ewma + alpha * (latency - ewma)
+                    state.samples += 1
+
+            if reason is not None:
+                self._decrease(host, state, reason)
+            elif status is not None and status < 400:
+                state.rate = self._clamp(state.rate + config.PACER_RATE_STEP)
+                logger.debug(f"Pacer {host}: {state.rate * 60:.2f} req/min")
+            else:
+                return None
+
+        if reason is not None:
+            self.save()
+        return reason
+
+    def _decrease(self, host: str, state: _HostState, reason: str):
+        now = time.time()
+        # Responses to requests already in flight carry the same signal;
+        # back off once per current interval, not once per response
+        if now - state.last_backoff < 1.0 / state.rate:
+            return
+        old_rate = state.rate
+        state.rate = self._clamp(state.rate * config.PACER_BACKOFF_FACTOR)
+        state.last_backoff = now
+        state.backoffs += 1
+        logger.warning(
+            f"Pacer {host}: backing off ({reason}) "
+            f"{old_rate * 60:.2f} -> {state.rate * 60:.2f} req/min "
+            f"(delay {1.0 / state.rate:.1f}s)"
+        )
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """
+        Get current pacing per host
+
+        Returns:
+            Dictionary host -> {delay, rate_per_min, latency_ewma_ms, backoffs}
+        """
+        with self._lock:
+            return {
+                host: {
+                    'delay': round(1.0 / state.rate, 2),
+                    'rate_per_min': round(state.rate * 60, 2),
+                    'latency_ewma_ms': round(state.latency_ewma * 1000, 1) if state.latency_ewma is not None else None,
+                    'backoffs': state.backoffs
+                }
+                for host, state in self._hosts.items()
+            }
+
+    def _load(self):
+        if not self.state_path or not os.path.exists(self.state_path):
+            return
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read pacer state {self.state_path}: {e}")
+            return
+
+        cutoff = time.time() - config.PACER_STATE_MAX_AGE
+        for host, entry in saved.items():
+            # Conditions change; don't trust a rate learned long ago
+            if entry.get('updated', 0) < cutoff:
+                continue
+            self._hosts[host] = _HostState(self._clamp(entry['rate']), entry.get('latency_ewma'))
+        if self._hosts:
+            logger.info(f"Loaded pacer state for {len(self._hosts)} host(s) from {self.state_path}")
+
+    def save(self):
+        """Persist per-host state (atomic replace, so concurrent readers never see a partial file)"""
+        if not self.state_path:
+            return
+        with self._lock:
+            now = time.time()
+            data = {
+                host: {'rate': state.rate, 'latency_ewma': state.latency_ewma, 'updated': now}
+                for host, state in self._hosts.items()
+            }
+        try:
+            directory = os.path.dirname(self.state_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f'{self.state_path}.{os.getpid()}.{threading.get_ident()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not save pacer state {self.state_path}: {e}")
+
+
+_shared_pacer: Optional[AdaptivePacer] = None
+_shared_lock = threading.Lock()
+
+
+def get_pacer() -> Optional[AdaptivePacer]:
+    """
+    Get the process-wide pacer
+
+    Returns:
+        Shared AdaptivePacer, or None if config.ADAPTIVE_PACING is off
+    """
+    global _shared_pacer
+    if not config.ADAPTIVE_PACING:
+        return None
+    with _shared_lock:
+        if _shared_pacer is None:
+            _shared_pacer = AdaptivePacer(config.PACER_STATE_PATH)
+        return _shared_pacer
@@ -0,0 +1,147 @@
+"""
+Asyncio HTTP fetch engine for 2GIS search pages
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# httpx gives us asyncio keep-alive pools and HTTP/2; fall back to
+# requests in worker threads when it is not installed
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401 - only needed so httpx can negotiate HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+class FetchError(Exception):
+    """Raised when an HTTP fetch fails (network error or bad status)"""
+
+    def __init__(self, message: str, status: Optional[int] = None):
+        super().__init__(message)
+        self.status = status
+
+
+class AsyncFetchEngine:
+    """
+    Async HTTP client with one keep-alive connection pool per host
+
+    Use as an async context manager; all pools are closed on exit.
+    """
+
+    def __init__(
+        self,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = None,
+        max_connections_per_host: int = None,
+        http2: bool = None
+    ):
+        """
+        Initialize fetch engine
+
+        Args:
+            headers: Default request headers
+            timeout: Request timeout in seconds (default from config)
+            max_connections_per_host: Pool size per host (default from config)
+            http2: Negotiate HTTP/2 when available (default from config)
+        """
+        self.headers = dict(headers or {})
+        self.timeout = timeout if timeout is not None else config.DEFAULT_TIMEOUT
+        self.max_connections_per_host = max_connections_per_host or config.MAX_CONNECTIONS_PER_HOST
+        http2 = config.HTTP2_ENABLED if http2 is None else http2
+        self.http2 = http2 and HTTP2_AVAILABLE
+        self._clients: Dict[str, 'httpx.AsyncClient'] = {}
+        self._session: Optional[requests.Session] = None
+
+    async def __aenter__(self):
+        if not HTTPX_AVAILABLE:
+            logger.warning("httpx not installed - async engine will use requests in threads")
+            self._session = requests.Session()
+            self._session.headers.update(self.headers)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    def _get_client(self, host: str) -> 'httpx.AsyncClient':
+        """Get (or create) the connection pool for a host"""
+        client = self._clients.get(host)
+        if client is None:
+            client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=self.timeout,
+                http2=self.http2,
+                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.max_connections_per_host,
+                    max_keepalive_connections=self.max_connections_per_host
+                )
+            )
+            self._clients[host] = client
+            logger.debug(f"Opened connection pool for {host} (http2={self.http2})")
+        return client
+
+    async def get_text(self, url: str, headers: Optional[Dict[str, str]] = None) -> str:
+        """
+        GET a URL and return the body decoded as UTF-8
+
+        Args:
+            url: URL to fetch
+            headers: Extra headers for this request
+
+        Returns:
+            Response body text
+
+        Raises:
+            FetchError: On network errors or non-2xx status
+        """
+        if self._session is not None:
+            return await asyncio.to_thread(self._get_text_requests, url, headers)
+
+        client = self._get_client(urlparse(url).hostname)
+        try:
+            response = await client.get(url, headers=headers)
+        except httpx.HTTPError as e:
+            raise FetchError(str(e)) from e
+
+        if response.status_code >= 400:
+            raise FetchError(f"HTTP {response.status_code} for {url}", response.status_code)
+
+        # Explicitly set encoding to UTF-8 for Russian content
+        response.encoding = 'utf-8'
+        return response.text
+
+    def _get_text_requests(self, url: str, headers: Optional[Dict[str, str]]) -> str:
+        try:
+            response = self._session.get(url, headers=headers, timeout=self.timeout)
+        except requests.exceptions.RequestException as e:
+            raise FetchError(str(e)) from e
+
+        if response.status_code >= 400:
+            raise FetchError(f"HTTP {response.status_code} for {url}", response.status_code)
+
+        response.encoding = 'utf-8'
+        return response.text
+
+    async def close(self):
+        """Close all connection pools"""
+        for client in self._clients.values():
+            await client.aclose()
+        self._clients = {}
+        if self._session is not None:
+            self._session.close()
+            self._session = None
@@ -0,0 +1,82 @@
+"""
+Shared helpers for the benchmark scripts
+"""
+
+import statistics
+import sys
+import threading
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, List
+
+SCRAPER_DIR = Path(__file__).resolve().parent.parent
+REPO_ROOT = SCRAPER_DIR.parent
+
+# Make the flat scraper modules importable (same approach as api/ and 2gis_web_app/)
+sys.path.insert(0, str(SCRAPER_DIR))
+
+FIXTURE_DIRS = [
+    REPO_ROOT / 'cache' / 'search',
+    REPO_ROOT / 'api' / 'cache' / 'search',
+    REPO_ROOT / '2gis_web_app' / 'cache' / 'search',
+    SCRAPER_DIR / 'cache' / 'search',
+]
+
+
+def fixture_pages() -> List[Path]:
+    """Return every committed search page fixture"""
+    pages = []
+    for directory in FIXTURE_DIRS:
+        pages.extend(sorted(directory.rglob('*.html')))
+    return pages
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Summarize timing samples (seconds) as milliseconds"""
+    ordered = sorted(samples)
+    p95_index = max(0, int(round(0.95 * len(ordered))) - 1)
+    return {
+        'n': len(samples),
+        'mean_ms': statistics.mean(samples) * 1000,
+        'median_ms': statistics.median(samples) * 1000,
+        'p95_ms': ordered[p95_index] * 1000,
+        'min_ms': ordered[0] * 1000,
+    }
+
+
+def print_row(label: str, samples: List[float]):
+    stats = summarize(samples)
+    print(
+        f"{label:<32} n={stats['n']:<4} mean={stats['mean_ms']:9.2f} ms  "
+        f"median={stats['median_ms']:9.2f} ms  p95={stats['p95_ms']:9.2f} ms"
+    )
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    """Static file handler that does not log every request"""
+
+    def log_message(self, format, *args):
+        pass
+
+
+class LocalServer:
+    """Serve a directory over HTTP on localhost in a background thread"""
+
+    def __init__(self, directory: Path = None, handler_class=QuietHandler):
+        handler = partial(handler_class, directory=str(directory)) if directory else handler_class
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), handler)
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.httpd.shutdown()
+        self.httpd.server_close()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Per-page latency: launch-per-call Playwright vs the long-lived BrowserPool
+
+Serves the committed search page fixtures from a local HTTP server and
+fetches them N times through each path.
+
+Usage:
+    python benchmarks/bench_browser_pool.py --pages 20
+"""
+
+import argparse
+import time
+
+from _common import LocalServer, fixture_pages, print_row
+
+import config
+from browser_pool import BrowserPool
+from playwright.sync_api import sync_playwright
+
+USER_AGENT = config.USER_AGENTS[0]
+
+
+def render(page, url: str, settle_ms: int) -> str:
+    page.goto(url, wait_until='load', timeout=60000)
+    if settle_ms:
+        page.wait_for_timeout(settle_ms)
+    return page.content()
+
+
+def fetch_launch_per_call(url: str, settle_ms: int) -> str:
+    """The previous TwoGISScraper._fetch_page_playwright_sync behaviour"""
+    with sync_playwright() as p:
+        browser = p.chromium.launch(headless=True, args=config.BROWSER_LAUNCH_ARGS)
+        context = browser.new_context(
+            user_agent=USER_AGENT,
+            viewport={'width': 1920, 'height': 1080},
+            locale='ru-RU',
+            timezone_id='Europe/Moscow'
+        )
+        html = render(context.new_page(), url, settle_ms)
+        browser.close()
+        return html
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pages', type=int, default=20, help='Fetches per path')
+    parser.add_argument('--settle-ms', type=int, default=0,
+                        help='Post-load wait, identical for both paths (scraper uses 3000)')
+    parser.add_argument('--max-pages-per-browser', type=int, default=config.BROWSER_MAX_PAGES)
+    args = parser.parse_args()
+
+    fixtures = fixture_pages()
+    directory = fixtures[0].parent
+    names = [f.name for f in fixtures if f.parent == directory]
+
+    with LocalServer(directory) as server:
+        urls = [f'{server.base_url}/{names[i % len(names)]}' for i in range(args.pages)]
+
+        legacy = []
+        for url in urls:
+            start = time.perf_counter()
+            fetch_launch_per_call(url, args.settle_ms)
+            legacy.append(time.perf_counter() - start)
+
+        pool = BrowserPool(
+            user_agent_factory=lambda: USER_AGENT,
+            max_pages_per_browser=args.max_pages_per_browser
+        )
+        pooled = []
+        try:
+            for url in urls:
+                start = time.perf_counter()
+                pool.run('127.0.0.1', render, url, args.settle_ms, timeout=120)
+                pooled.append(time.perf_counter() - start)
+        finally:
+            pool.close()
+
+    print(f"\n{args.pages} fetches of {len(names)} fixture page(s), settle={args.settle_ms} ms\n")
+    print_row('launch-per-call', legacy)
+    print_row('browser pool (all)', pooled)
+    if len(pooled) > 1:
+        print_row('browser pool (warm)', pooled[1:])
+    print(f"\nBrowser launches: launch-per-call={len(legacy)}, pool={pool.launch_count}")
+    print(f"Total: launch-per-call={sum(legacy):.2f}s, pool={sum(pooled):.2f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Memory per business: Business records vs the plain dictionaries they replace
+
+Parses every profile of every committed search page fixture (repeated to
+reach --count businesses) and measures the traced memory retained by the
+resulting list, as Business records and as to_dict() dictionaries.
+
+Usage:
+    python benchmarks/bench_business_memory.py
+    python benchmarks/bench_business_memory.py --count 100000
+"""
+
+import argparse
+import gc
+import tracemalloc
+
+from _common import fixture_pages
+
+from parser import SEARCH_STATE_PATHS, TwoGISParser
+
+
+def build(profiles, count: int, as_dicts: bool):
+    """Return (businesses, retained bytes)"""
+    gc.collect()
+    tracemalloc.start()
+    businesses = []
+    while len(businesses) < count:
+        for firm_id, profile in profiles:
+            business = TwoGISParser._parse_business_profile(firm_id, profile)
+            businesses.append(business.to_dict() if as_dicts else business)
+            if len(businesses) == count:
+                break
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return businesses, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--count', type=int, default=20000)
+    args = parser.parse_args()
+
+    profiles = []
+    for path in fixture_pages():
+        state = TwoGISParser.extract_initial_state(path.read_text(encoding='utf-8'), SEARCH_STATE_PATHS)
+        profiles.extend(state['data']['entity']['profile'].items())
+    print(f"{len(profiles)} fixture profiles, building {args.count} businesses\n")
+
+    results = {}
+    for label, as_dicts in (('dict', True), ('Business', False)):
+        businesses, retained = build(profiles, args.count, as_dicts)
+        results[label] = retained
+        print(f"{label:<10} {retained / args.count:8.0f} bytes/business  "
+              f"{retained / 1024 / 1024:7.1f} MB total")
+        del businesses
+
+    print(f"\nBusiness records use {results['Business'] / results['dict']:.0%} of the dictionary memory")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Disk usage and read/write latency of CacheManager storage formats
+
+Writes every committed search page fixture into a temporary cache with
+each format/level and reads it back.
+
+Usage:
+    python benchmarks/bench_cache_compression.py
+    python benchmarks/bench_cache_compression.py --runs 5 --formats gzip:1 gzip:6 zstd:3
+"""
+
+import argparse
+import tempfile
+import time
+
+from _common import fixture_pages, print_row
+
+from cache_manager import ZSTD_AVAILABLE, CacheManager
+
+DEFAULT_FORMATS = ['none', 'gzip:1', 'gzip:6', 'gzip:9'] + (
+    ['zstd:3', 'zstd:10', 'zstd:19'] if ZSTD_AVAILABLE else []
+)
+
+
+def bench_format(pages, compression: str, level, runs: int):
+    """Return (bytes on disk, write samples, read samples) for one format"""
+    writes, reads = [], []
+    with tempfile.TemporaryDirectory() as cache_dir:
+        cache = CacheManager(cache_dir, compression=compression, compression_level=level)
+        for _ in range(runs):
+            for url, html in pages:
+                start = time.perf_counter()
+                cache.set(url, html)
+                writes.append(time.perf_counter() - start)
+            for url, html in pages:
+                start = time.perf_counter()
+                assert cache.get(url) == html
+                reads.append(time.perf_counter() - start)
+        _, size = cache.index.totals()
+    return size, writes, reads
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--formats', nargs='+', default=DEFAULT_FORMATS,
+                        help="Formats as name[:level] (none, gzip:6, zstd:3, ...)")
+    args = parser.parse_args()
+
+    pages = [(f'fixture://{path}', path.read_text(encoding='utf-8')) for path in fixture_pages()]
+    print(f"{len(pages)} fixture pages, zstandard {'available' if ZSTD_AVAILABLE else 'not installed'}\n")
+
+    baseline = None
+    for spec in args.formats:
+        compression, _, level = spec.partition(':')
+        size, writes, reads = bench_format(pages, compression, int(level) if level else None, args.runs)
+        baseline = baseline or size
+        print(f"{spec:<8} {size / 1024 / 1024:8.2f} MB on disk ({size / baseline:6.1%} of uncompressed)")
+        print_row('  write', writes)
+        print_row('  read', reads)
+
+
+if __name__ == '__main__':
+    main()
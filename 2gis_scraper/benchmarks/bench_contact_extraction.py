@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Contact links from rendered profile HTML: BeautifulSoup vs link_scanner
+
+Times the HTML fallback of ProfileEnricher._extract_contact_info on
+profile_page.html (BeautifulSoup html.parser over the whole page before,
+link_scanner now) and checks the scanner sees exactly the <a href> list
+BeautifulSoup does on that page and every search page fixture.
+
+Usage:
+    python benchmarks/bench_contact_extraction.py
+    python benchmarks/bench_contact_extraction.py --runs 50
+"""
+
+import argparse
+import re
+import time
+
+from _common import SCRAPER_DIR, fixture_pages, print_row
+
+from bs4 import BeautifulSoup
+
+from link_scanner import SKIP_LINK_MARKERS, _soup_hrefs, extract_link_contacts, iter_anchor_hrefs
+from profile_scraper import ProfileEnricher
+
+PROFILE_PAGE = SCRAPER_DIR / 'profile_page.html'
+
+
+def legacy_link_contacts(html: str):
+    """The pre-scanner HTML fallback (profile_scraper.py before link_scanner)"""
+    contact_info = {'phone': None, 'website': None}
+    soup = BeautifulSoup(html, 'html.parser')
+    phone_links = soup.find_all('a', href=re.compile(r'tel:'))
+    if phone_links:
+        contact_info['phone'] = phone_links[0].get('href', '').replace('tel:', '').strip() or None
+    for link in soup.find_all('a', href=True):
+        href = link.get('href', '')
+        if href and not any(x in href for x in SKIP_LINK_MARKERS) and href.startswith('http'):
+            contact_info['website'] = href
+            break
+    return contact_info
+
+
+def time_calls(func, html: str, runs: int):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(html)
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=20)
+    args = parser.parse_args()
+
+    pages = [PROFILE_PAGE] + fixture_pages()
+    mismatched = 0
+    for path in pages:
+        html = path.read_text(encoding='utf-8')
+        if (list(iter_anchor_hrefs(html)) != _soup_hrefs(html)
+                or extract_link_contacts(html) != legacy_link_contacts(html)):
+            mismatched += 1
+            print(f"MISMATCH {path}")
+    print(f"Equivalence: {len(pages) - mismatched}/{len(pages)} pages with identical links and contacts\n")
+
+    html = PROFILE_PAGE.read_text(encoding='utf-8')
+    print(f"{PROFILE_PAGE.name}: {len(html) / 1024:.0f} KB\n")
+
+    enricher = ProfileEnricher(cache_enabled=False)
+
+    print_row('BeautifulSoup links', time_calls(legacy_link_contacts, html, args.runs))
+    print_row('link_scanner links', time_calls(extract_link_contacts, html, args.runs))
+    print_row('_extract_contact_info', time_calls(enricher._extract_contact_info, html, args.runs))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Enrichment throughput vs ProfileEnricher concurrency
+
+Serves profile_page.html from a local HTTP server and enriches the same
+synthetic business list at several concurrency levels.
+
+Usage:
+    python benchmarks/bench_enrichment_concurrency.py --businesses 24 --levels 1 2 4 8
+"""
+
+import argparse
+import asyncio
+import time
+
+from _common import SCRAPER_DIR, LocalServer
+
+from profile_scraper import ProfileEnricher
+
+
+class LocalProfileEnricher(ProfileEnricher):
+    """ProfileEnricher pointed at the local stand-in server"""
+
+    base_url = ''
+
+    def _build_profile_url(self, city, business_id, tld=None):
+        return f'{self.base_url}/profile_page.html?id={business_id}'
+
+
+async def run_level(base_url: str, businesses: int, concurrency: int, delay: float) -> float:
+    LocalProfileEnricher.base_url = base_url
+    items = [{'id': str(70000001000000000 + i), 'name': f'Business {i}'} for i in range(businesses)]
+
+    async with LocalProfileEnricher(delay=delay, concurrency=concurrency) as enricher:
+        start = time.perf_counter()
+        await enricher.enrich_businesses(items, city='dubai')
+        return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--businesses', type=int, default=24)
+    parser.add_argument('--levels', type=int, nargs='+', default=[1, 2, 4, 8])
+    parser.add_argument('--delay', type=float, default=0.0,
+                        help='Rate limiter delay (0 measures pure concurrency scaling)')
+    args = parser.parse_args()
+
+    with LocalServer(SCRAPER_DIR) as server:
+        results = []
+        for level in args.levels:
+            elapsed = asyncio.run(run_level(server.base_url, args.businesses, level, args.delay))
+            results.append((level, elapsed))
+
+    print(f"\n{args.businesses} businesses, delay={args.delay}s\n")
+    base = results[0][1]
+    for level, elapsed in results:
+        print(
+            f"concurrency={level:<3} total={elapsed:7.2f}s  "
+            f"throughput={args.businesses / elapsed:6.2f}/s  speedup={base / elapsed:5.2f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
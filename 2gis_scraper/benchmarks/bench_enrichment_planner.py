@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Enrichment time vs share of businesses already complete in search data
+
+Serves profile_page.html from a local HTTP server and enriches a synthetic
+business list in which a given fraction already has phone and website (as
+when search pages carry contacts). The contact cache is disabled, so every
+saved visit comes from the planner.
+
+Usage:
+    python benchmarks/bench_enrichment_planner.py --businesses 24 --complete 0 0.5 0.9
+"""
+
+import argparse
+import asyncio
+import time
+
+from _common import SCRAPER_DIR, LocalServer
+from bench_enrichment_concurrency import LocalProfileEnricher
+
+
+def make_businesses(count: int, complete: float):
+    items = [{'id': str(70000001000000000 + i), 'name': f'Business {i}'} for i in range(count)]
+    for item in items[:round(count * complete)]:
+        item['phone'] = '+971 4 000 0000'
+        item['website'] = 'https://example.com'
+    return items
+
+
+async def run(base_url: str, businesses: int, complete: float, concurrency: int, delay: float):
+    LocalProfileEnricher.base_url = base_url
+    items = make_businesses(businesses, complete)
+
+    async with LocalProfileEnricher(delay=delay, concurrency=concurrency, cache_enabled=False) as enricher:
+        start = time.perf_counter()
+        await enricher.enrich_businesses(items, city='dubai')
+        return time.perf_counter() - start, enricher.last_plan
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--businesses', type=int, default=24)
+    parser.add_argument('--complete', type=float, nargs='+', default=[0.0, 0.25, 0.5, 0.9],
+                        help='Fractions of businesses that already have phone and website')
+    parser.add_argument('--concurrency', type=int, default=1)
+    parser.add_argument('--delay', type=float, default=0.0)
+    args = parser.parse_args()
+
+    with LocalServer(SCRAPER_DIR) as server:
+        results = []
+        for complete in args.complete:
+            elapsed, plan = asyncio.run(run(server.base_url, args.businesses, complete, args.concurrency, args.delay))
+            results.append((complete, elapsed, plan))
+
+    print(f"\n{args.businesses} businesses, concurrency={args.concurrency}, delay={args.delay}s\n")
+    base = results[0][1]
+    for complete, elapsed, plan in results:
+        print(
+            f"complete={complete:4.0%}  visits={len(plan.visit):<4} saved={plan.visits_saved:<4} "
+            f"total={elapsed:7.2f}s  time vs first={elapsed / base:5.2f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+initialState extraction: legacy DOTALL regex + unicode_escape vs state_scanner
+
+Times locating and unescaping the JSON.parse('...') literal (and the full
+json.loads) on every committed search page fixture, and checks both paths
+produce the same businesses once the legacy latin-1 mojibake is repaired.
+
+Usage:
+    python benchmarks/bench_initial_state.py
+    python benchmarks/bench_initial_state.py --runs 20
+"""
+
+import argparse
+import json
+import re
+import time
+
+from _common import fixture_pages, print_row
+
+from models import to_dicts
+from parser import TwoGISParser
+from state_scanner import scan_initial_state
+
+LEGACY_PATTERN = r'var initialState = JSON\.parse\(\'(.+?)\'\);'
+
+
+def legacy_literal(html: str) -> str:
+    """The pre-scanner extraction (parser.py before PARSER_VERSION 2)"""
+    match = re.search(LEGACY_PATTERN, html, re.DOTALL)
+    return match.group(1).encode().decode('unicode_escape')
+
+
+def repair(value):
+    """Undo the legacy latin-1 mojibake everywhere (the old parser only fixed name/address)"""
+    if isinstance(value, str):
+        try:
+            return value.encode('latin-1').decode('utf-8')
+        except (UnicodeDecodeError, UnicodeEncodeError):
+            return value
+    if isinstance(value, list):
+        return [repair(v) for v in value]
+    if isinstance(value, dict):
+        return {k: repair(v) for k, v in value.items()}
+    return value
+
+
+def time_calls(func, pages, runs: int):
+    samples = []
+    for _ in range(runs):
+        for html in pages:
+            start = time.perf_counter()
+            func(html)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    pages = [path.read_text(encoding='utf-8') for path in fixture_pages()]
+    print(f"{len(pages)} fixture pages, {sum(map(len, pages)) / len(pages) / 1024:.0f} KB average\n")
+
+    mismatched = 0
+    for html in pages:
+        legacy = to_dicts(TwoGISParser.extract_businesses(json.loads(legacy_literal(html))))
+        current = to_dicts(TwoGISParser.extract_businesses(json.loads(scan_initial_state(html))))
+        if repair(legacy) != current:
+            mismatched += 1
+    print(f"Equivalence: {len(pages) - mismatched}/{len(pages)} pages identical after repairing legacy output\n")
+
+    print_row('legacy literal', time_calls(legacy_literal, pages, args.runs))
+    print_row('scanner literal', time_calls(scan_initial_state, pages, args.runs))
+    print_row('legacy literal + json.loads', time_calls(lambda h: json.loads(legacy_literal(h)), pages, args.runs))
+    print_row('extract_initial_state', time_calls(TwoGISParser.extract_initial_state, pages, args.runs))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+JSON backend comparison: stdlib json vs orjson
+
+Times json_backend.loads on the initialState of every committed search page
+fixture, dumps/loads of the committed output/businesses.json (pretty and
+compact, as DataExporter and the parsed-result cache use them), and checks
+both backends decode to identical objects.
+
+Usage:
+    python benchmarks/bench_json_backend.py
+    python benchmarks/bench_json_backend.py --runs 20
+"""
+
+import argparse
+import time
+
+from _common import SCRAPER_DIR, fixture_pages, print_row
+
+import json_backend
+from state_scanner import scan_initial_state
+
+BUSINESSES_JSON = SCRAPER_DIR / 'output' / 'businesses.json'
+
+
+def time_calls(func, inputs, runs: int):
+    samples = []
+    for _ in range(runs):
+        for value in inputs:
+            start = time.perf_counter()
+            func(value)
+            samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    backends = ['json'] + (['orjson'] if json_backend.ORJSON_AVAILABLE else [])
+    states = [scan_initial_state(path.read_text(encoding='utf-8')) for path in fixture_pages()]
+    businesses = json_backend.loads(BUSINESSES_JSON.read_text(encoding='utf-8'))
+    print(
+        f"{len(states)} initialState documents ({sum(map(len, states)) / len(states) / 1024:.0f} KB average), "
+        f"{len(businesses)} businesses in {BUSINESSES_JSON.name}; "
+        f"orjson {'available' if json_backend.ORJSON_AVAILABLE else 'not installed'}\n"
+    )
+
+    decoded = {}
+    for backend in backends:
+        json_backend.set_backend(backend)
+        decoded[backend] = [json_backend.loads(state) for state in states]
+        print(backend)
+        print_row('  loads initialState', time_calls(json_backend.loads, states, args.runs))
+        print_row('  dumps businesses (indent=2)',
+                  time_calls(lambda b: json_backend.dumps(b, indent=2), [businesses], args.runs * 10))
+        print_row('  dumps businesses (compact)', time_calls(json_backend.dumps, [businesses], args.runs * 10))
+        text = json_backend.dumps(businesses)
+        print_row('  loads businesses', time_calls(json_backend.loads, [text], args.runs * 10))
+
+    if len(backends) > 1:
+        identical = decoded['json'] == decoded['orjson']
+        print(f"\nDecoded initialState identical across backends: {identical}")
+
+
+if __name__ == '__main__':
+    main()
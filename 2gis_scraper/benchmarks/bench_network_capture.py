@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Rendered-HTML parsing vs catalog JSON network capture
+
+Starts a local stand-in for 2GIS: /search/<fixture> serves a committed
+search page that also requests /3.0/items, and /3.0/items serves the same
+businesses as catalog API JSON (built from the fixture's initialState).
+Both fetch paths must yield identical businesses; the script reports
+wall time and Python CPU time per page for each.
+
+Usage:
+    python benchmarks/bench_network_capture.py --pages 10
+"""
+
+import argparse
+import json
+import sys
+import time
+from http.server import BaseHTTPRequestHandler
+from urllib.parse import urlparse
+
+from _common import LocalServer, fixture_pages, print_row
+
+import config
+from browser_pool import BrowserPool
+from network_capture import CatalogResponseMatcher, capture_catalog_sync
+from parser import TwoGISParser
+
+STANDIN_PATTERNS = [r'/\d+\.\d+/items']
+
+FETCH_SCRIPT = b"<script>fetch('/3.0/items?q=standin').catch(() => {});</script></body>"
+
+
+def build_fixtures():
+    """Map fixture name -> (page HTML bytes, catalog JSON bytes)"""
+    fixtures = {}
+    for path in fixture_pages():
+        html = path.read_text(encoding='utf-8')
+        state = TwoGISParser.extract_initial_state(html)
+        if not state:
+            continue
+        profiles = state.get('data', {}).get('entity', {}).get('profile', {})
+        items = []
+        for firm_id, profile in profiles.items():
+            item = dict(profile.get('data', profile))
+            item['id'] = firm_id
+            items.append(item)
+        payload = {'meta': {'code': 200}, 'result': {'items': items, 'total': len(items)}}
+        page = html.encode('utf-8').replace(b'</body>', FETCH_SCRIPT, 1)
+        fixtures[path.stem] = (page, json.dumps(payload).encode('utf-8'))
+    return fixtures
+
+
+def make_handler(fixtures, current):
+    class StandInHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            path = urlparse(self.path).path
+            if path.startswith('/search/'):
+                body, content_type = fixtures[path.rsplit('/', 1)[-1]][0], 'text/html; charset=utf-8'
+                current['name'] = path.rsplit('/', 1)[-1]
+            elif path.endswith('/items'):
+                body, content_type = fixtures[current['name']][1], 'application/json'
+            else:
+                self.send_response(404)
+                self.end_headers()
+                return
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return StandInHandler
+
+
+def dom_path(page, url):
+    page.goto(url, wait_until='load', timeout=60000)
+    html = page.content()
+    state = TwoGISParser.extract_initial_state(html)
+    return TwoGISParser.extract_businesses(state) if state else []
+
+
+def capture_path(page, url):
+    payload = capture_catalog_sync(page, url, CatalogResponseMatcher(patterns=STANDIN_PATTERNS))
+    return TwoGISParser.extract_businesses_from_catalog(payload) if payload else None
+
+
+def timed(pool, func, url):
+    wall, cpu = time.perf_counter(), time.process_time()
+    result = pool.run('127.0.0.1', func, url, timeout=120)
+    return result, time.perf_counter() - wall, time.process_time() - cpu
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--pages', type=int, default=10)
+    args = parser.parse_args()
+
+    fixtures = build_fixtures()
+    names = sorted(fixtures)
+    current = {'name': names[0]}
+    pool = BrowserPool(user_agent_factory=lambda: config.USER_AGENTS[0])
+
+    results = {'dom': ([], []), 'capture': ([], [])}
+    mismatches = 0
+    try:
+        with LocalServer(handler_class=make_handler(fixtures, current)) as server:
+            for i in range(args.pages):
+                url = f'{server.base_url}/search/{names[i % len(names)]}'
+                dom, dom_wall, dom_cpu = timed(pool, dom_path, url)
+                captured, cap_wall, cap_cpu = timed(pool, capture_path, url)
+
+                if captured is None or sorted(dom, key=lambda b: b['id']) != sorted(captured, key=lambda b: b['id']):
+                    mismatches += 1
+                    print(f"MISMATCH on {url}", file=sys.stderr)
+
+                results['dom'][0].append(dom_wall)
+                results['dom'][1].append(dom_cpu)
+                results['capture'][0].append(cap_wall)
+                results['capture'][1].append(cap_cpu)
+    finally:
+        pool.close()
+
+    print(f"\n{args.pages} pages from {len(names)} fixtures\n")
+    for label, (wall, cpu) in results.items():
+        print_row(f'{label} wall', wall)
+        print_row(f'{label} python cpu', cpu)
+    print(f"\nIdentical businesses: {args.pages - mismatches}/{args.pages}")
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == '__main__':
+    main()
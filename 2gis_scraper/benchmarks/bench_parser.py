@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Parser throughput and peak memory per stage
+
+Runs each TwoGISParser stage over every committed search page fixture and
+reports pages/sec, MB/sec (of page HTML) and peak traced allocation. Run
+check_parser_equivalence.py alongside: a faster stage is only worth having
+if it still produces the reference output.
+
+Usage:
+    python benchmarks/bench_parser.py
+    python benchmarks/bench_parser.py --runs 20
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from _common import fixture_pages
+
+from parser import SEARCH_STATE_PATHS, TwoGISParser
+
+
+def build_stages(pages):
+    """Stage label -> function of the page index (stage inputs are prepared up front)"""
+    full_states = [TwoGISParser.extract_initial_state(html) for html in pages]
+    states = [TwoGISParser.extract_initial_state(html, SEARCH_STATE_PATHS) for html in pages]
+    return {
+        'extract_initial_state (full)': lambda i: TwoGISParser.extract_initial_state(pages[i]),
+        'extract_initial_state (paths)': lambda i: TwoGISParser.extract_initial_state(pages[i], SEARCH_STATE_PATHS),
+        'extract_businesses (full state)': lambda i: TwoGISParser.extract_businesses(full_states[i]),
+        'extract_businesses (paths)': lambda i: TwoGISParser.extract_businesses(states[i]),
+        'detect_total_pages (state)': lambda i: TwoGISParser.detect_total_pages(pages[i], states[i]),
+        'detect_total_pages (html only)': lambda i: TwoGISParser.detect_total_pages(pages[i]),
+        'parse_search_page': lambda i: TwoGISParser.parse_search_page(pages[i]),
+    }
+
+
+def peak_kb(func, index: int) -> float:
+    """Peak traced allocation (KB) during one call, result included"""
+    tracemalloc.start()
+    try:
+        func(index)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    pages = [path.read_text(encoding='utf-8') for path in fixture_pages()]
+    total_mb = sum(len(html.encode('utf-8')) for html in pages) / 1024 / 1024
+    print(f"{len(pages)} fixture pages, {total_mb:.1f} MB of HTML, {args.runs} runs\n")
+    print(f"{'stage':<34}{'pages/s':>10}{'MB/s':>10}{'ms/page':>10}{'peak KB (median / max)':>26}")
+
+    for label, func in build_stages(pages).items():
+        start = time.perf_counter()
+        for _ in range(args.runs):
+            for index in range(len(pages)):
+                func(index)
+        elapsed = time.perf_counter() - start
+
+        peaks = sorted(peak_kb(func, index) for index in range(len(pages)))
+        pages_per_second = len(pages) * args.runs / elapsed
+        print(
+            f"{label:<34}{pages_per_second:>10.1f}{total_mb * args.runs / elapsed:>10.1f}"
+            f"{1000 / pages_per_second:>10.2f}{peaks[len(peaks) // 2]:>13,.0f} / {peaks[-1]:,.0f}"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Per-profile field extraction time
+
+Collects every business profile from the committed search page fixtures
+(plus the full profile in profile_page.html) and times
+TwoGISParser._parse_business_profile and each field extractor on them.
+Output equivalence is checked by check_parser_equivalence.py.
+
+Usage:
+    python benchmarks/bench_profile_fields.py
+    python benchmarks/bench_profile_fields.py --runs 200
+"""
+
+import argparse
+import time
+
+from _common import SCRAPER_DIR, fixture_pages
+
+from parser import SEARCH_STATE_PATHS, TwoGISParser
+
+FIELD_EXTRACTORS = {
+    'address': TwoGISParser._extract_address,
+    'coordinates': TwoGISParser._extract_coordinates,
+    'phone': TwoGISParser._extract_phone,
+    'website': TwoGISParser._extract_website,
+    'rating': TwoGISParser._extract_rating,
+    'review_count': TwoGISParser._extract_review_count,
+    'rubric': TwoGISParser._extract_rubric,
+    'schedule': TwoGISParser._extract_schedule,
+    'attributes': TwoGISParser._extract_attributes,
+}
+
+
+def load_profiles():
+    """(firm_id, profile) for every profile in the fixtures"""
+    profiles = []
+    pages = fixture_pages() + [SCRAPER_DIR / 'profile_page.html']
+    for path in pages:
+        state = TwoGISParser.extract_initial_state(path.read_text(encoding='utf-8'), SEARCH_STATE_PATHS)
+        entity = ((state or {}).get('data') or {}).get('entity') or {}
+        profiles.extend((entity.get('profile') or {}).items())
+    return profiles
+
+
+def per_profile_us(func, args_list, runs: int, repeats: int = 5) -> float:
+    """Best of several repeats (least disturbed by other processes)"""
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(runs):
+            for args in args_list:
+                func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best / (runs * len(args_list)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=100)
+    args = parser.parse_args()
+
+    profiles = load_profiles()
+    data = [(profile.get('data', profile),) for _, profile in profiles]
+    print(f"{len(profiles)} profiles, {args.runs} runs\n")
+
+    total = per_profile_us(TwoGISParser._parse_business_profile, profiles, args.runs)
+    print(f"{'_parse_business_profile':<26}{total:8.2f} us/profile")
+    for field, extractor in FIELD_EXTRACTORS.items():
+        print(f"  {field:<24}{per_profile_us(extractor, data, args.runs):8.2f} us/profile")
+
+
+if __name__ == '__main__':
+    main()
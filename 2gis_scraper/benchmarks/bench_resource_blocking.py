@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Bytes transferred and page-load time with and without ResourceBlocker
+
+By default loads profile_page.html from a local server (its CSS, fonts,
+images, analytics and tiles still point at the real CDNs). Pass --url to
+measure live 2GIS profile pages instead.
+
+Usage:
+    python benchmarks/bench_resource_blocking.py --runs 5
+    python benchmarks/bench_resource_blocking.py --url https://2gis.ae/dubai/firm/70000001067039360
+"""
+
+import argparse
+import re
+import statistics
+import time
+from urllib.parse import urlparse
+
+from _common import SCRAPER_DIR, LocalServer
+
+import config
+from browser_pool import BrowserPool
+from resource_blocker import ResourceBlocker
+
+
+def measure(page, url: str):
+    """Load url and return (bytes transferred, load seconds, request count)"""
+    finished = []
+    page.on('requestfinished', finished.append)
+
+    start = time.perf_counter()
+    page.goto(url, wait_until='load', timeout=60000)
+    elapsed = time.perf_counter() - start
+
+    total = 0
+    for request in finished:
+        try:
+            sizes = request.sizes()
+            total += sizes['responseHeadersSize'] + sizes['responseBodySize']
+        except Exception:
+            pass
+    return total, elapsed, len(finished)
+
+
+def run(urls, runs: int, blocker):
+    pool = BrowserPool(user_agent_factory=lambda: config.USER_AGENTS[0], size=1)
+    if blocker is not None:
+        pool.add_context_hook(blocker.apply_sync)
+
+    samples = []
+    try:
+        for _ in range(runs):
+            for url in urls:
+                samples.append(pool.run(urlparse(url).hostname, measure, url, timeout=120))
+    finally:
+        pool.close()
+    return samples
+
+
+def report(label: str, samples):
+    kb = statistics.mean(s[0] for s in samples) / 1024
+    load_ms = statistics.mean(s[1] for s in samples) * 1000
+    requests = statistics.mean(s[2] for s in samples)
+    print(f"{label:<18} {kb:10.1f} KB/page  {load_ms:9.1f} ms/page  {requests:6.1f} requests/page")
+    return kb, load_ms
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--url', nargs='+', help='Pages to load (default: local profile_page.html)')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    blocker = ResourceBlocker()
+    if args.url:
+        unblocked = run(args.url, args.runs, None)
+        blocked = run(args.url, args.runs, blocker)
+    else:
+        with LocalServer(SCRAPER_DIR) as server:
+            # Local documents are not on the allowlist, so allow the stand-in host too
+            blocker.allowed_patterns.append(re.compile(r'^http://127\.0\.0\.1'))
+            urls = [f'{server.base_url}/profile_page.html']
+            unblocked = run(urls, args.runs, None)
+            blocked = run(urls, args.runs, blocker)
+
+    print()
+    kb_before, ms_before = report('without blocking', unblocked)
+    kb_after, ms_after = report('with blocking', blocked)
+    print(f"\nBlocked requests: {blocker.get_stats()}")
+    print(
+        f"Per 1000 profiles: {(kb_before - kb_after) * 1000 / 1024:.1f} MB saved "
+        f"({kb_before * 1000 / 1024:.1f} -> {kb_after * 1000 / 1024:.1f} MB), "
+        f"{(ms_before - ms_after) / 60:.1f} min of page-load time saved"  # ms/page * 1000 pages -> min
+    )
+
+
+if __name__ == '__main__':
+    main()
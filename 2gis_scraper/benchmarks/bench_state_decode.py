@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Full initialState decode vs subtree-only decode (decode_subtrees)
+
+Times each strategy on every committed search page fixture and reports its
+peak traced allocation, and checks that the subtree decode yields the same
+businesses and page count as the full tree.
+
+Usage:
+    python benchmarks/bench_state_decode.py
+    python benchmarks/bench_state_decode.py --runs 20
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+
+from _common import fixture_pages, print_row
+
+import json_backend
+from parser import SEARCH_STATE_PATHS, TwoGISParser
+from state_scanner import decode_subtrees, scan_initial_state
+
+STRATEGIES = {
+    'full json.loads': json.loads,
+    'subtrees': lambda text: decode_subtrees(text, SEARCH_STATE_PATHS),
+}
+if json_backend.ORJSON_AVAILABLE:
+    import orjson
+    STRATEGIES['full orjson.loads'] = orjson.loads
+
+
+def peak_kb(func, text: str) -> float:
+    """Peak traced allocation (KB) while decoding, result included"""
+    tracemalloc.start()
+    try:
+        func(text)
+        return tracemalloc.get_traced_memory()[1] / 1024
+    finally:
+        tracemalloc.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    pages = [path.read_text(encoding='utf-8') for path in fixture_pages()]
+    texts = [scan_initial_state(html) for html in pages]
+    print(f"{len(texts)} initialState documents, {sum(map(len, texts)) / len(texts) / 1024:.0f} KB average\n")
+
+    mismatched = 0
+    for html, text in zip(pages, texts):
+        full, partial = json.loads(text), decode_subtrees(text, SEARCH_STATE_PATHS)
+        if (TwoGISParser.extract_businesses(full) != TwoGISParser.extract_businesses(partial)
+                or TwoGISParser.detect_total_pages(html, full) != TwoGISParser.detect_total_pages(html, partial)):
+            mismatched += 1
+    print(f"Equivalence: {len(texts) - mismatched}/{len(texts)} pages identical\n")
+
+    for label, func in STRATEGIES.items():
+        samples = []
+        for _ in range(args.runs):
+            for text in texts:
+                start = time.perf_counter()
+                func(text)
+                samples.append(time.perf_counter() - start)
+        print_row(label, samples)
+        peaks = sorted(peak_kb(func, text) for text in texts)
+        print(f"{'':<32} peak memory median={peaks[len(peaks) // 2]:,.0f} KB  max={peaks[-1]:,.0f} KB")
+
+
+if __name__ == '__main__':
+    main()
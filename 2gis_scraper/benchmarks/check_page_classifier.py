@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Check classify_page verdicts against what the parser finds
+
+For every committed search page fixture, classifies the page itself
+(expects PAGE_OK), a copy with data.entity.profile emptied (a results page
+with no businesses - expects PAGE_EMPTY) and a captcha interstitial
+(expects PAGE_BLOCKED), and checks each OK/EMPTY verdict agrees with the
+number of businesses TwoGISParser.parse_search_page extracts.
+
+Exits with status 1 on any mismatch.
+
+Usage:
+    python benchmarks/check_page_classifier.py
+"""
+
+import json
+import logging
+import sys
+
+from _common import REPO_ROOT, fixture_pages
+
+from page_classifier import PAGE_BLOCKED, PAGE_EMPTY, PAGE_OK, classify_page
+from parser import TwoGISParser
+from state_scanner import find_initial_state_literal, scan_initial_state
+
+BLOCK_PAGE = '<html><head><title>Captcha</title></head><body>Please solve the captcha</body></html>'
+
+
+def without_businesses(html: str) -> str:
+    """The same page with an empty data.entity.profile map"""
+    state = json.loads(scan_initial_state(html))
+    state['data']['entity']['profile'] = {}
+    # Compact like the real pages, re-escaped for the single-quoted JSON.parse literal
+    text = json.dumps(state, ensure_ascii=False, separators=(',', ':'))
+    literal = text.replace('\\', '\\\\').replace("'", "\\'")
+    start, end = find_initial_state_literal(html)
+    return html[:start] + literal + html[end:]
+
+
+def main():
+    # The parser logs every page it reads
+    logging.disable(logging.WARNING)
+
+    failures = 0
+    pages = fixture_pages()
+    for path in pages:
+        name = path.relative_to(REPO_ROOT).as_posix()
+        html = path.read_text(encoding='utf-8')
+        cases = (
+            ('page', html, PAGE_OK),
+            ('no businesses', without_businesses(html), PAGE_EMPTY),
+            ('captcha', BLOCK_PAGE, PAGE_BLOCKED),
+        )
+        for label, variant, expected in cases:
+            verdict = classify_page(variant)
+            if verdict != expected:
+                failures += 1
+                print(f"FAIL {name} [{label}]: {verdict} != {expected}")
+                continue
+            if verdict in (PAGE_OK, PAGE_EMPTY):
+                found = len(TwoGISParser.parse_search_page(variant).businesses)
+                if (found > 0) != (verdict == PAGE_OK):
+                    failures += 1
+                    print(f"FAIL {name} [{label}]: {verdict} but the parser found {found} businesses")
+
+    if failures:
+        print(f"{failures} mismatches")
+    else:
+        print(f"{len(pages)} fixtures x 3 cases: all verdicts as expected")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
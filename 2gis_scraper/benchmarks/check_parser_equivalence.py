@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Differential check: every parser path against the reference path
+
+The reference is the plainest route through the parser: the whole
+initialState decoded with the stdlib json module, then extract_businesses
+and detect_total_pages. Each candidate in CANDIDATES (subtree decoding,
+the JSON backend, parse_search_page, ...) must produce identical businesses
+and page count on every committed search page fixture.
+
+The reference output itself is pinned in parser_golden.json (one digest per
+fixture), so a change in parser behaviour shows up here even when all paths
+agree. A fixture missing from the golden file, or a pinned fixture that no
+longer exists, is a failure too (so moved fixtures can't silently go
+unchecked). After an intended change (bump PARSER_VERSION) or a fixture
+change, refresh it with --update-golden.
+
+Exits with status 1 on any difference.
+
+Usage:
+    python benchmarks/check_parser_equivalence.py
+    python benchmarks/check_parser_equivalence.py --update-golden
+"""
+
+import argparse
+import hashlib
+import json
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from _common import REPO_ROOT, fixture_pages
+
+import json_backend
+from models import to_dicts
+from parser import PARSER_VERSION, SEARCH_STATE_PATHS, TwoGISParser
+from state_scanner import scan_initial_state
+
+GOLDEN_FILE = Path(__file__).resolve().parent / 'parser_golden.json'
+
+# (business dictionaries, total pages)
+ParseOutput = Tuple[List[Dict], Optional[int]]
+
+
+def reference(html: str) -> ParseOutput:
+    """Full stdlib decode, then the extraction functions"""
+    state = json.loads(scan_initial_state(html))
+    return to_dicts(TwoGISParser.extract_businesses(state)), TwoGISParser.detect_total_pages(html, state)
+
+
+def _from_state(html: str, state: Optional[Dict]) -> ParseOutput:
+    return to_dicts(TwoGISParser.extract_businesses(state)), TwoGISParser.detect_total_pages(html, state)
+
+
+def _with_backend(backend: str, paths=None):
+    def run(html: str) -> ParseOutput:
+        previous = json_backend.get_backend()
+        json_backend.set_backend(backend)
+        try:
+            return _from_state(html, TwoGISParser.extract_initial_state(html, paths))
+        finally:
+            json_backend.set_backend(previous)
+    return run
+
+
+def _parse_search_page(html: str) -> ParseOutput:
+    result = TwoGISParser.parse_search_page(html)
+    return to_dicts(result.businesses), result.total_pages
+
+
+def _cache_round_trip(html: str) -> ParseOutput:
+    # What TwoGISScraper serves from its parsed-result cache
+    result = TwoGISParser.parse_search_page(html)
+    restored = type(result).from_dict(json_backend.loads(json_backend.dumps(result.to_dict())))
+    return to_dicts(restored.businesses), restored.total_pages
+
+
+# Candidate label -> function of the page HTML; add faster paths here
+CANDIDATES = {
+    'extract_initial_state (json, full)': _with_backend('json'),
+    'extract_initial_state (json, paths)': _with_backend('json', SEARCH_STATE_PATHS),
+    'parse_search_page': _parse_search_page,
+    'parsed-result cache round trip': _cache_round_trip,
+}
+if json_backend.ORJSON_AVAILABLE:
+    CANDIDATES['extract_initial_state (orjson, full)'] = _with_backend('orjson')
+    CANDIDATES['extract_initial_state (orjson, paths)'] = _with_backend('orjson', SEARCH_STATE_PATHS)
+
+
+def digest(output: ParseOutput) -> str:
+    """Stable digest of a parse output"""
+    canonical = json.dumps(output, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def describe_difference(expected: ParseOutput, actual: ParseOutput) -> str:
+    """First difference between two outputs, for the report"""
+    if expected[1] != actual[1]:
+        return f"total pages {actual[1]!r} != {expected[1]!r}"
+    if len(expected[0]) != len(actual[0]):
+        return f"{len(actual[0])} businesses != {len(expected[0])}"
+    for index, (want, got) in enumerate(zip(expected[0], actual[0])):
+        for key in sorted(set(want) | set(got)):
+            if want.get(key) != got.get(key):
+                return f"business #{index} ({want.get('id')}) '{key}': {got.get(key)!r} != {want.get(key)!r}"
+    return "outputs differ"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--update-golden', action='store_true', help='Rewrite parser_golden.json from the reference')
+    args = parser.parse_args()
+
+    golden = json.loads(GOLDEN_FILE.read_text(encoding='utf-8')) if GOLDEN_FILE.exists() else {}
+    pinned = golden.get('pages', {})
+    digests = {}
+    failures = 0
+
+    pages = fixture_pages()
+    for path in pages:
+        name = path.relative_to(REPO_ROOT).as_posix()
+        html = path.read_text(encoding='utf-8')
+        expected = reference(html)
+        digests[name] = digest(expected)
+
+        if not args.update_golden:
+            if name not in pinned:
+                failures += 1
+                print(f"FAIL {name}: not pinned in {GOLDEN_FILE.name} (run with --update-golden)")
+            elif pinned[name] != digests[name]:
+                failures += 1
+                print(f"FAIL {name}: reference output changed since {GOLDEN_FILE.name} was written")
+
+        for label, candidate in CANDIDATES.items():
+            actual = candidate(html)
+            if actual != expected:
+                failures += 1
+                print(f"FAIL {name} [{label}]: {describe_difference(expected, actual)}")
+
+    if args.update_golden:
+        GOLDEN_FILE.write_text(
+            json.dumps({'parser_version': PARSER_VERSION, 'pages': digests}, indent=2, sort_keys=True) + '\n',
+            encoding='utf-8'
+        )
+        print(f"Wrote {len(digests)} digests to {GOLDEN_FILE.name}")
+    else:
+        for name in sorted(set(pinned) - set(digests)):
+            failures += 1
+            print(f"FAIL {name}: pinned in {GOLDEN_FILE.name} but the fixture is missing")
+
+    if failures:
+        print(f"{failures} differences")
+    else:
+        print(f"{len(pages)} fixtures x {len(CANDIDATES)} candidate paths: all identical to the reference")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,233 @@
+"""
+Long-lived Playwright browser pool for 2GIS page fetches
+"""
+
+import logging
+import queue
+import threading
+import concurrent.futures
+from typing import Any, Callable, Dict, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+try:
+    from playwright.sync_api import sync_playwright
+    PLAYWRIGHT_AVAILABLE = True
+except ImportError:
+    PLAYWRIGHT_AVAILABLE = False
+
+
+class _BrowserWorker:
+    """Browser state owned by a single pool thread (sync Playwright is thread-bound)"""
+
+    def __init__(self, pool: 'BrowserPool', index: int):
+        self.pool = pool
+        self.index = index
+        self.playwright = None
+        self.browser = None
+        self.contexts: Dict[str, Any] = {}
+        self.pages_served = 0
+
+    def _ensure_browser(self):
+        """Launch Chromium on first use or after a recycle"""
+        if self.browser is not None and self.browser.is_connected():
+            return
+
+        self.shutdown()
+        self.playwright = sync_playwright().start()
+        self.browser = self.playwright.chromium.launch(
+            headless=self.pool.headless,
+            args=self.pool.launch_args
+        )
+        self.pages_served = 0
+        self.pool._record_launch()
+        logger.info(f"[BROWSER POOL] Worker {self.index} launched Chromium")
+
+    def _get_context(self, host: str):
+        """Get (or create) the browser context for a 2GIS host"""
+        context = self.contexts.get(host)
+        if context is None:
+            context = self.browser.new_context(
+                user_agent=self.pool.user_agent_factory(),
+                viewport={'width': 1920, 'height': 1080},
+                locale='ru-RU',
+                timezone_id='Europe/Moscow'
+            )
+            for hook in self.pool.context_hooks:
+                hook(context)
+            self.contexts[host] = context
+            logger.debug(f"[BROWSER POOL] Worker {self.index} created context for {host}")
+        return context
+
+    def run(self, host: str, func: Callable, args: tuple) -> Any:
+        """Lease a page for host, run func(page, *args) and return the page"""
+        self._ensure_browser()
+        page = self._get_context(host).new_page()
+        try:
+            return func(page, *args)
+        finally:
+            try:
+                page.close()
+            except Exception as e:
+                logger.debug(f"[BROWSER POOL] Error closing page: {e}")
+
+            self.pages_served += 1
+            if self.pages_served >= self.pool.max_pages_per_browser:
+                logger.info(
+                    f"[BROWSER POOL] Worker {self.index} recycling browser "
+                    f"after {self.pages_served} pages"
+                )
+                self.shutdown()
+
+    def shutdown(self):
+        """Close contexts, browser and the Playwright runtime"""
+        for context in self.contexts.values():
+            try:
+                context.close()
+            except Exception:
+                pass
+        self.contexts = {}
+
+        if self.browser is not None:
+            try:
+                self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+
+        if self.playwright is not None:
+            try:
+                self.playwright.stop()
+            except Exception:
+                pass
+            self.playwright = None
+
+
+class BrowserPool:
+    """
+    Pool of reusable Chromium browsers for synchronous callers
+
+    Each worker thread owns one browser and one context per 2GIS host.
+    Callers lease a fresh page inside that context for each fetch, and
+    browsers are recycled after a configurable number of pages.
+    """
+
+    def __init__(
+        self,
+        user_agent_factory: Callable[[], str],
+        size: int = None,
+        max_pages_per_browser: int = None,
+        headless: bool = True,
+        launch_args: Optional[list] = None
+    ):
+        """
+        Initialize browser pool (browsers launch lazily on first fetch)
+
+        Args:
+            user_agent_factory: Callable returning a User-Agent per new context
+            size: Number of browser workers (default from config)
+            max_pages_per_browser: Pages served before a browser is recycled
+            headless: Run browsers in headless mode
+            launch_args: Chromium command-line arguments
+        """
+        if not PLAYWRIGHT_AVAILABLE:
+            raise RuntimeError("Playwright is not installed")
+
+        self.user_agent_factory = user_agent_factory
+        self.size = size or config.BROWSER_POOL_SIZE
+        self.max_pages_per_browser = max_pages_per_browser or config.BROWSER_MAX_PAGES
+        self.headless = headless
+        self.launch_args = list(launch_args or config.BROWSER_LAUNCH_ARGS)
+        self.context_hooks: list = []
+
+        self._jobs: queue.Queue = queue.Queue()
+        self._threads: list = []
+        self._lock = threading.Lock()
+        self._closed = False
+        self.launch_count = 0
+
+    def _record_launch(self):
+        with self._lock:
+            self.launch_count += 1
+
+    def _start_workers(self):
+        """Start worker threads on first use"""
+        with self._lock:
+            if self._threads:
+                return
+            for i in range(self.size):
+                thread = threading.Thread(
+                    target=self._worker_loop,
+                    args=(i,),
+                    name=f'browser-pool-{i}',
+                    daemon=True
+                )
+                thread.start()
+                self._threads.append(thread)
+        logger.info(f"[BROWSER POOL] Started {self.size} worker(s)")
+
+    def _worker_loop(self, index: int):
+        worker = _BrowserWorker(self, index)
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                worker.shutdown()
+                break
+
+            host, func, args, future = job
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                future.set_result(worker.run(host, func, args))
+            except Exception as e:
+                # A crashed browser should not poison the next lease
+                if worker.browser is not None and not worker.browser.is_connected():
+                    worker.shutdown()
+                future.set_exception(e)
+
+    def submit(self, host: str, func: Callable, *args) -> concurrent.futures.Future:
+        """
+        Schedule func(page, *args) on a pooled page for host
+
+        Args:
+            host: 2GIS host the page belongs to (e.g. '2gis.ae')
+            func: Callable receiving a leased Playwright page
+            *args: Extra arguments for func
+
+        Returns:
+            Future resolving to func's return value
+        """
+        if self._closed:
+            raise RuntimeError("Browser pool is closed")
+
+        self._start_workers()
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        self._jobs.put((host, func, args, future))
+        return future
+
+    def run(self, host: str, func: Callable, *args, timeout: float = None) -> Any:
+        """Run func(page, *args) on a pooled page and wait for the result"""
+        return self.submit(host, func, *args).result(timeout=timeout)
+
+    def add_context_hook(self, hook: Callable):
+        """Register a callable applied to every new browser context"""
+        self.context_hooks.append(hook)
+
+    def close(self):
+        """Shut down all workers and their browsers"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            threads = list(self._threads)
+
+        for _ in threads:
+            self._jobs.put(None)
+        for thread in threads:
+            thread.join(timeout=30)
+
+        if threads:
+            logger.info(f"[BROWSER POOL] Closed ({self.launch_count} browser launches)")
@@ -0,0 +1,194 @@
+"""
+SQLite metadata index for CacheManager
+
+One row per cached entry, plus a totals row kept up to date by triggers
+so cache stats never have to walk the directory.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import unquote, urlparse
+
+logger = logging.getLogger(__name__)
+
+# /{city}/search/{query}[/page/{n}]
+SEARCH_PATH_PATTERN = re.compile(r'^/([^/]+)/search/([^/]+)(?:/page/(\d+))?')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    url TEXT,
+    city TEXT,
+    query TEXT,
+    page INTEGER,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    fetched_at REAL NOT NULL,
+    last_access REAL NOT NULL,
+    content_hash TEXT
+);
+CREATE INDEX IF NOT EXISTS entries_city_query ON entries (city, query, page);
+CREATE INDEX IF NOT EXISTS entries_fetched_at ON entries (fetched_at);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+
+CREATE TABLE IF NOT EXISTS totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    size INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO totals (id, entries, size) VALUES (0, 0, 0);
+
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE totals SET entries = entries + 1, size = size + NEW.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE totals SET entries = entries - 1, size = size - OLD.size WHERE id = 0;
+END;
+CREATE TRIGGER IF NOT EXISTS entries_resize AFTER UPDATE OF size ON entries BEGIN
+    UPDATE totals SET size = size - OLD.size + NEW.size WHERE id = 0;
+END;
+"""
+
+
+def parse_search_url(url: str) -> Tuple[Optional[str], Optional[str], Optional[int]]:
+    """
+    Extract city, query and page from a 2GIS search URL (cache-key suffixes ignored)
+
+    Args:
+        url: Search URL, e.g. https://2gis.ae/dubai/search/cafe/page/2#parsed-v1
+
+    Returns:
+        Tuple of (city, query, page), all None if url is not a search URL
+    """
+    match = SEARCH_PATH_PATTERN.match(urlparse(url).path)
+    if not match:
+        return None, None, None
+    city, query, page = match.groups()
+    return unquote(city), unquote(query), int(page) if page else 1
+
+
+class CacheIndex:
+    """Metadata for every entry in one cache directory"""
+
+    def __init__(self, db_path: str):
+        """
+        Open (or create) the index
+
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30, isolation_level=None, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        # WAL lets readers in other processes run while one process writes
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.executescript(SCHEMA)
+
+    def record(
+        self,
+        key: str,
+        url: Optional[str],
+        path: str,
+        size: int,
+        fetched_at: float,
+        content_hash: Optional[str] = None,
+        last_access: Optional[float] = None
+    ):
+        """Insert or update an entry"""
+        city, query, page = parse_search_url(url) if url else (None, None, None)
+        with self._lock:
+            self._conn.execute(
+                """
+                INSERT INTO entries (key, url, city, query, page, path, size, fetched_at, last_access, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (key) DO UPDATE SET
+                    url = COALESCE(excluded.url, url), city = COALESCE(excluded.city, city),
+                    query = COALESCE(excluded.query, query), page = COALESCE(excluded.page, page),
+                    path = excluded.path, size = excluded.size, fetched_at = excluded.fetched_at,
+                    last_access = excluded.last_access, content_hash = excluded.content_hash
+                """,
+                (key, url, city, query, page, path, size, fetched_at,
+                 last_access if last_access is not None else fetched_at, content_hash)
+            )
+
+    def touch(self, key: str, timestamp: float):
+        """Record an access (drives LRU eviction)"""
+        with self._lock:
+            self._conn.execute('UPDATE entries SET last_access = ? WHERE key = ?', (timestamp, key))
+
+    def remove(self, keys: List[str]):
+        """Delete entries by key"""
+        with self._lock:
+            self._conn.executemany('DELETE FROM entries WHERE key = ?', [(k,) for k in keys])
+
+    def totals(self) -> Tuple[int, int]:
+        """
+        Get entry count and total size (O(1), maintained by triggers)
+
+        Returns:
+            Tuple of (entries, bytes)
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT entries, size FROM totals WHERE id = 0').fetchone()
+        return row['entries'], row['size']
+
+    def expired(self, fetched_before: float) -> List[Tuple[str, str]]:
+        """Get (key, path) of entries written before a timestamp"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT key, path FROM entries WHERE fetched_at < ?', (fetched_before,)
+            ).fetchall()
+        return [(row['key'], row['path']) for row in rows]
+
+    def least_recently_used(self, limit: int) -> List[Tuple[str, str, int]]:
+        """Get (key, path, size) of the least recently accessed entries"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT key, path, size FROM entries ORDER BY last_access LIMIT ?', (limit,)
+            ).fetchall()
+        return [(row['key'], row['path'], row['size']) for row in rows]
+
+    def find(self, city: Optional[str] = None, query: Optional[str] = None) -> List[Dict]:
+        """
+        List indexed entries, optionally filtered by city and/or query
+
+        Args:
+            city: City as it appears in the URL (e.g. 'dubai')
+            query: Search query
+
+        Returns:
+            List of entry dictionaries ordered by city, query, page
+        """
+        sql = 'SELECT url, city, query, page, path, size, fetched_at, last_access, content_hash FROM entries'
+        conditions, params = [], []
+        if city is not None:
+            conditions.append('city = ?')
+            params.append(city)
+        if query is not None:
+            conditions.append('query = ?')
+            params.append(query)
+        if conditions:
+            sql += ' WHERE ' + ' AND '.join(conditions)
+        sql += ' ORDER BY city, query, page'
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def paths(self) -> List[str]:
+        """Get the payload path of every entry"""
+        with self._lock:
+            rows = self._conn.execute('SELECT path FROM entries').fetchall()
+        return [row['path'] for row in rows]
+
+    def clear(self):
+        """Delete every entry"""
+        with self._lock:
+            self._conn.execute('DELETE FROM entries')
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
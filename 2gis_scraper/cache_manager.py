@@ -3,31 +3,140 @@ Cache management for 2GIS scraper to avoid redundant requests
 """
 
 import os
+import gzip
+import time
 import hashlib
 import logging
+import re
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
+
+import config
+from cache_index import CacheIndex
+from file_lock import FileLock
 
 logger = logging.getLogger(__name__)
 
+# zstd compresses and decompresses faster than gzip at similar ratios
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+# File suffix per storage format; plain .html is the legacy uncompressed format
+CACHE_SUFFIXES = {
+    'zstd': '.html.zst',
+    'gzip': '.html.gz',
+    'none': '.html',
+}
+DEFAULT_LEVELS = {'zstd': 3, 'gzip': 6}
+
+# 2GIS page URLs quoted in a cached page (candidates for the URL it was fetched from)
+_PAGE_URL = re.compile(r'https?://2gis\.[a-z.]+/[^"\'<>\s\\]+')
+
+
+def _resolve_compression(compression: str) -> str:
+    """Map 'auto' (and unavailable zstd) to a concrete format"""
+    if compression == 'auto':
+        return 'zstd' if ZSTD_AVAILABLE else 'gzip'
+    if compression == 'zstd' and not ZSTD_AVAILABLE:
+        logger.warning("zstandard not installed - caching with gzip instead")
+        return 'gzip'
+    if compression not in CACHE_SUFFIXES:
+        raise ValueError(f"Unknown cache compression '{compression}'")
+    return compression
+
+
+def read_cache_file(path: Path) -> str:
+    """
+    Read one cache payload file in any storage format (format taken from the suffix)
+
+    Args:
+        path: Payload file
+
+    Returns:
+        Cached text
+    """
+    data = path.read_bytes()
+    if path.name.endswith(CACHE_SUFFIXES['zstd']):
+        if not ZSTD_AVAILABLE:
+            raise RuntimeError("zstandard not installed")
+        data = zstandard.ZstdDecompressor().decompress(data)
+    elif path.name.endswith(CACHE_SUFFIXES['gzip']):
+        data = gzip.decompress(data)
+    return data.decode('utf-8')
+
+
+def recover_url(cache_key: str, html: str) -> Optional[str]:
+    """
+    Find the URL a cache entry was stored under among the URLs in its page
+
+    Args:
+        cache_key: Entry key (MD5 of the URL)
+        html: Cached page
+
+    Returns:
+        The URL whose key is cache_key, or None if the page does not contain it
+    """
+    for match in _PAGE_URL.finditer(html):
+        url = match.group(0)
+        if hashlib.md5(url.encode('utf-8')).hexdigest() == cache_key:
+            return url
+    return None
+
 
 class CacheManager:
     """Manages HTML response caching for the scraper"""
 
-    def __init__(self, cache_dir: str = 'cache/search', enabled: bool = True):
+    def __init__(
+        self,
+        cache_dir: str = 'cache/search',
+        enabled: bool = True,
+        compression: str = None,
+        compression_level: int = None,
+        ttl: Optional[float] = None,
+        stale_window: Optional[float] = None,
+        max_size_mb: Optional[float] = None,
+        sweep_interval: Optional[float] = None
+    ):
         """
         Initialize cache manager
 
         Args:
             cache_dir: Directory to store cached files
             enabled: Whether caching is enabled
+            compression: 'auto', 'zstd', 'gzip' or 'none' (default from config)
+            compression_level: Codec level (default from config, else codec default)
+            ttl: Seconds an entry stays fresh (None = forever)
+            stale_window: Seconds past ttl an entry may still be served stale
+                (default from config)
+            max_size_mb: Evict least recently used entries above this size
+                (default from config, None = unbounded)
+            sweep_interval: Minimum seconds between background sweeps
+                (default from config)
         """
         self.cache_dir = Path(cache_dir)
         self.enabled = enabled
+        self.compression = _resolve_compression(compression or config.CACHE_COMPRESSION)
+        level = compression_level if compression_level is not None else config.CACHE_COMPRESSION_LEVEL
+        self.compression_level = level if level is not None else DEFAULT_LEVELS.get(self.compression)
+        self.suffix = CACHE_SUFFIXES[self.compression]
+        self.ttl = ttl
+        self.stale_window = stale_window if stale_window is not None else config.CACHE_STALE_WINDOW
+        self.max_size_mb = max_size_mb if max_size_mb is not None else config.CACHE_MAX_SIZE_MB
+        self.sweep_interval = sweep_interval if sweep_interval is not None else config.CACHE_SWEEP_INTERVAL
+        self._last_sweep = 0.0
+        self._sweep_lock = threading.Lock()
+        self.index: Optional[CacheIndex] = None
 
         if self.enabled:
             # Create cache directory if it doesn't exist
             self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Files of the old flat layout are read in place, never moved or
+            # deleted implicitly (see migrate_flat_entries)
+            self.index = CacheIndex(str(self.cache_dir / config.CACHE_INDEX_FILE))
             logger.info(f"Cache manager initialized: {self.cache_dir}")
 
     def _generate_cache_key(self, url: str) -> str:
@@ -42,46 +151,194 @@ class CacheManager:
         """
         return hashlib.md5(url.encode('utf-8')).hexdigest()
 
-    def _get_cache_path(self, url: str) -> Path:
+    def _shard_dir(self, cache_key: str) -> Path:
+        """Two levels of 256 subdirectories keep each directory small"""
+        return self.cache_dir / cache_key[:2] / cache_key[2:4]
+
+    def _get_cache_path(self, url: str, suffix: str = None) -> Path:
         """
         Get cache file path for URL
 
         Args:
             url: Request URL
+            suffix: Storage format suffix (default: the configured format)
 
         Returns:
             Path to cache file
         """
         cache_key = self._generate_cache_key(url)
-        return self.cache_dir / f"{cache_key}.html"
+        return self._shard_dir(cache_key) / f"{cache_key}{suffix or self.suffix}"
 
-    def get(self, url: str) -> Optional[str]:
+    def _candidate_paths(self, url: str, legacy: bool = True):
         """
-        Retrieve cached HTML for URL
+        Cache paths to try on read: configured format first, then the
+        other formats, then (with legacy) the flat unsharded layout of older caches
+        """
+        cache_key = self._generate_cache_key(url)
+        suffixes = [self.suffix] + [s for s in CACHE_SUFFIXES.values() if s != self.suffix]
+        directories = (self._shard_dir(cache_key), self.cache_dir) if legacy else (self._shard_dir(cache_key),)
+        for directory in directories:
+            for suffix in suffixes:
+                yield directory / f"{cache_key}{suffix}"
+
+    def fill_lock(self, url: str) -> FileLock:
+        """
+        Lock taken while fetching url, so concurrent misses across threads
+        and processes fetch it once (single-flight)
+
+        Locks are striped by key prefix to keep the number of lock files bounded.
 
         Args:
             url: Request URL
 
         Returns:
-            Cached HTML content or None if not found/disabled
+            Unacquired FileLock
+        """
+        cache_key = self._generate_cache_key(url)
+        return FileLock(str(self.cache_dir / '.locks' / f"{cache_key[:3]}.lock"))
+
+    def _relative(self, path: Path) -> str:
+        return str(path.relative_to(self.cache_dir))
+
+    def _encode(self, html: str) -> bytes:
+        data = html.encode('utf-8')
+        if self.compression == 'zstd':
+            return zstandard.ZstdCompressor(level=self.compression_level).compress(data)
+        if self.compression == 'gzip':
+            # mtime=0 keeps output deterministic for identical pages
+            return gzip.compress(data, compresslevel=self.compression_level, mtime=0)
+        return data
+
+    @staticmethod
+    def _decode(path: Path) -> str:
+        return read_cache_file(path)
+
+    def flat_files(self) -> List[Path]:
+        """Cache files of the old flat layout (read in place, not in the index)"""
+        suffixes = tuple(CACHE_SUFFIXES.values())
+        return sorted(f for f in self.cache_dir.glob('*.html*') if f.name.endswith(suffixes))
+
+    def migrate_flat_entries(self) -> int:
+        """
+        Move files of the old flat layout into shards and index them
+
+        Only on request (main.py --migrate-cache): the flat files may be
+        someone else's (e.g. committed fixtures), so they are otherwise
+        read where they are. The URL is recovered from the page where
+        possible, so find() and reparse --city/--query see the entry.
+
+        Returns:
+            Number of files migrated
         """
         if not self.enabled:
-            return None
+            return 0
 
-        cache_path = self._get_cache_path(url)
+        migrated = 0
+        for cache_file in self.flat_files():
+            cache_key = cache_file.name.split('.', 1)[0]
+            target = self._shard_dir(cache_key) / cache_file.name
+            try:
+                url = recover_url(cache_key, read_cache_file(cache_file))
+                target.parent.mkdir(parents=True, exist_ok=True)
+                os.replace(cache_file, target)
+                stat = target.stat()
+            except (OSError, ValueError, RuntimeError) as e:
+                logger.warning(f"Could not migrate cache file {cache_file}: {e}")
+                continue
+            self.index.record(
+                cache_key, url, self._relative(target), stat.st_size,
+                fetched_at=stat.st_mtime, last_access=stat.st_atime
+            )
+            migrated += 1
+        if migrated:
+            logger.info(f"Migrated {migrated} flat cache files in {self.cache_dir}")
+        return migrated
+
+    def _is_expired(self, age: float) -> bool:
+        """Too old to serve even stale"""
+        return self.ttl is not None and age > self.ttl + self.stale_window
 
-        if cache_path.exists():
+    def lookup(self, url: str) -> Tuple[Optional[str], bool]:
+        """
+        Retrieve cached HTML for URL, including stale entries
+
+        Entry age is the file's mtime (write time); reads update the
+        index's last_access, which drives LRU eviction.
+
+        Args:
+            url: Request URL
+
+        Returns:
+            Tuple of (cached HTML or None, True if the entry is past its TTL)
+        """
+        if not self.enabled:
+            return None, False
+
+        for cache_path in self._candidate_paths(url):
             try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    html = f.read()
-                logger.debug(f"Cache HIT: {url}")
-                return html
+                stat = cache_path.stat()
+            except FileNotFoundError:
+                continue
+
+            now = time.time()
+            age = now - stat.st_mtime
+            if self._is_expired(age):
+                logger.debug(f"Cache EXPIRED: {url}")
+                return None, False
+
+            try:
+                html = self._decode(cache_path)
+                self.index.touch(self._generate_cache_key(url), now)
             except Exception as e:
                 logger.warning(f"Error reading cache for {url}: {e}")
-                return None
-        else:
-            logger.debug(f"Cache MISS: {url}")
+                return None, False
+
+            stale = self.ttl is not None and age > self.ttl
+            logger.debug(f"Cache {'STALE' if stale else 'HIT'}: {url}")
+            return html, stale
+
+        logger.debug(f"Cache MISS: {url}")
+        return None, False
+
+    def get(self, url: str, allow_stale: bool = False) -> Optional[str]:
+        """
+        Retrieve cached HTML for URL
+
+        Args:
+            url: Request URL
+            allow_stale: Also return entries past their TTL (within the stale window)
+
+        Returns:
+            Cached HTML content or None if not found/expired/disabled
+        """
+        html, stale = self.lookup(url)
+        if stale and not allow_stale:
             return None
+        return html
+
+    def delete(self, url: str) -> bool:
+        """
+        Remove URL from cache (all storage formats)
+
+        Args:
+            url: Request URL
+
+        Returns:
+            True if an entry was removed
+        """
+        if not self.enabled:
+            return False
+
+        removed = False
+        # An explicit delete also removes the URL's flat-layout file
+        for cache_path in self._candidate_paths(url):
+            try:
+                cache_path.unlink()
+                removed = True
+            except FileNotFoundError:
+                pass
+        self.index.remove([self._generate_cache_key(url)])
+        return removed
 
     def set(self, url: str, html: str) -> bool:
         """
@@ -100,17 +357,107 @@ class CacheManager:
         cache_path = self._get_cache_path(url)
 
         try:
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                f.write(html)
+            data = self._encode(html)
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename, so readers in other processes
+            # never see a partially written entry
+            tmp_path = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                tmp_path.write_bytes(data)
+                os.replace(tmp_path, cache_path)
+            finally:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            # Drop copies in other formats so they can't shadow the new entry
+            # (a flat-layout file is checked after the shard, so it can stay)
+            for other_path in self._candidate_paths(url, legacy=False):
+                if other_path != cache_path and other_path.exists():
+                    other_path.unlink()
+            self.index.record(
+                self._generate_cache_key(url), url, self._relative(cache_path), len(data),
+                fetched_at=time.time(),
+                content_hash=hashlib.sha1(html.encode('utf-8')).hexdigest()
+            )
             logger.debug(f"Cached: {url}")
+            self._maybe_sweep()
             return True
         except Exception as e:
             logger.warning(f"Error caching {url}: {e}")
             return False
 
+    def _maybe_sweep(self):
+        """Start a background sweep if the last one was long enough ago"""
+        if self.ttl is None and self.max_size_mb is None:
+            return
+        now = time.time()
+        with self._sweep_lock:
+            if now - self._last_sweep < self.sweep_interval:
+                return
+            self._last_sweep = now
+        threading.Thread(target=self.sweep, name='cache-sweeper', daemon=True).start()
+
+    def _remove_entries(self, entries: List[Tuple[str, str]]) -> int:
+        """Delete (key, relative path) entries from disk and index"""
+        for _, path in entries:
+            try:
+                (self.cache_dir / path).unlink()
+            except FileNotFoundError:
+                pass  # Removed concurrently or by hand
+        self.index.remove([key for key, _ in entries])
+        return len(entries)
+
+    def sweep(self) -> int:
+        """
+        Delete expired entries, then evict least recently used ones above max size
+
+        Returns:
+            Number of files deleted
+        """
+        if not self.enabled:
+            return 0
+
+        expired = 0
+        if self.ttl is not None:
+            cutoff = time.time() - self.ttl - self.stale_window
+            expired = self._remove_entries(self.index.expired(cutoff))
+
+        evicted = 0
+        if self.max_size_mb is not None:
+            limit = self.max_size_mb * 1024 * 1024
+            _, total = self.index.totals()
+            while total > limit:
+                batch = []
+                for key, path, size in self.index.least_recently_used(100):
+                    if total <= limit:
+                        break
+                    batch.append((key, path))
+                    total -= size
+                if not batch:
+                    break
+                evicted += self._remove_entries(batch)
+
+        if expired or evicted:
+            logger.info(f"Cache sweep {self.cache_dir}: {expired} expired, {evicted} evicted")
+        return expired + evicted
+
+    def find(self, city: Optional[str] = None, query: Optional[str] = None) -> List[Dict]:
+        """
+        List cached search pages, e.g. everything for city='dubai'
+
+        Args:
+            city: City as it appears in the URL
+            query: Search query
+
+        Returns:
+            List of entry dictionaries (url, city, query, page, path, size, fetched_at, ...)
+        """
+        if not self.enabled:
+            return []
+        return self.index.find(city, query)
+
     def clear(self) -> int:
         """
-        Clear all cached files
+        Clear all cached files (indexed entries and old flat-layout files)
 
         Returns:
             Number of files deleted
@@ -120,9 +467,20 @@ class CacheManager:
 
         deleted = 0
         try:
-            for cache_file in self.cache_dir.glob('*.html'):
-                cache_file.unlink()
-                deleted += 1
+            for path in self.index.paths():
+                try:
+                    (self.cache_dir / path).unlink()
+                    deleted += 1
+                except FileNotFoundError:
+                    pass
+            self.index.clear()
+            # Served by lookup() too, so an explicit clear removes them as well
+            for path in self.flat_files():
+                try:
+                    path.unlink()
+                    deleted += 1
+                except FileNotFoundError:
+                    pass
             logger.info(f"Cleared {deleted} cached files")
             return deleted
         except Exception as e:
@@ -131,7 +489,8 @@ class CacheManager:
 
     def get_stats(self) -> dict:
         """
-        Get cache statistics
+        Get cache statistics (from the index, plus old flat-layout files
+        in the top directory - no walk of the shards)
 
         Returns:
             Dictionary with cache stats
@@ -143,12 +502,18 @@ class CacheManager:
                 'total_size_mb': 0
             }
 
-        cached_files = list(self.cache_dir.glob('*.html'))
-        total_size = sum(f.stat().st_size for f in cached_files)
+        total_files, total_size = self.index.totals()
+        for path in self.flat_files():
+            try:
+                total_size += path.stat().st_size
+                total_files += 1
+            except FileNotFoundError:
+                pass
 
         return {
             'enabled': True,
-            'total_files': len(cached_files),
+            'total_files': total_files,
             'total_size_mb': round(total_size / (1024 * 1024), 2),
-            'cache_dir': str(self.cache_dir)
+            'cache_dir': str(self.cache_dir),
+            'compression': self.compression
         }
@@ -2,6 +2,10 @@
 Configuration settings for 2GIS scraper
 """
 
+import logging
+import os
+import tempfile
+
 # City to TLD mapping for 2GIS regions
 CITY_TLD_MAP = {
     # Russia
@@ -68,11 +72,117 @@ USER_AGENTS = [
 DEFAULT_DELAY = 8  # Seconds between requests (increased to avoid rate limiting)
 DEFAULT_TIMEOUT = 60  # Request timeout in seconds (increased for reliability)
 MAX_RETRIES = 3  # Maximum retry attempts for failed requests
+
+# Shared per-host rate limiting (token bucket refilled at 1/delay per second)
+RATE_LIMIT_BURST = 1  # Requests allowed back-to-back before pacing kicks in
+# 'memory' shares buckets within a process, 'sqlite' across every process on the node
+RATE_LIMIT_BACKEND = os.getenv('TWOGIS_RATE_LIMIT_BACKEND', 'memory')
+RATE_LIMIT_DB_PATH = os.getenv(
+    'TWOGIS_RATE_LIMIT_DB',
+    os.path.join(tempfile.gettempdir(), '2gis_rate_limit.sqlite')
+)
+
+# Adaptive (AIMD) pacing: DEFAULT_DELAY / --delay is only the starting point
+ADAPTIVE_PACING = True
+PACER_MIN_DELAY = 2  # Never go faster than this (seconds between requests)
+PACER_MAX_DELAY = 120  # Never back off beyond this
+PACER_RATE_STEP = 0.005  # Additive increase per healthy response (requests/second)
+PACER_BACKOFF_FACTOR = 0.5  # Multiplicative decrease on 429/403, captcha or latency spike
+PACER_LATENCY_SPIKE_FACTOR = 3.0  # Spike = latency above this multiple of the running average
+PACER_LATENCY_EWMA_ALPHA = 0.2
+PACER_MIN_LATENCY_SAMPLES = 5  # Samples before latency spikes are trusted
+PACER_STATE_PATH = os.getenv(
+    'TWOGIS_PACER_STATE',
+    os.path.join(tempfile.gettempdir(), '2gis_pacer_state.json')
+)
+PACER_STATE_MAX_AGE = 24 * 3600  # Ignore persisted rates older than this (seconds)
+# Lowercase markers of captcha / access-denied pages served with status 200
+BLOCK_PAGE_MARKERS = ['captcha', 'доступ ограничен', 'access denied', 'too many requests']
+
 CACHE_ENABLED = True  # Enable HTML response caching
+CACHE_COMPRESSION = 'auto'  # 'auto' (zstd if installed, else gzip), 'zstd', 'gzip' or 'none'
+CACHE_COMPRESSION_LEVEL = None  # None = codec default (zstd 3, gzip 6)
+CACHE_TTL_SEARCH = 7 * 24 * 3600  # Search pages are fresh for a week (None = forever)
+CACHE_TTL_PROFILE = 30 * 24 * 3600  # Contacts change less often than listings
+CACHE_TTL_EMPTY = 3600  # Empty result pages are re-checked after an hour
+CACHE_STALE_WINDOW = 7 * 24 * 3600  # Past TTL, serve stale and refresh in background for this long
+CACHE_STALE_WHILE_REVALIDATE = True
+REVALIDATE_SHUTDOWN_TIMEOUT = 10  # Seconds close() waits for a running background refresh (queued ones are dropped)
+CACHE_MAX_SIZE_MB = 1024  # Per cache directory; least recently used entries are evicted (None = unbounded)
+CACHE_SWEEP_INTERVAL = 600  # Seconds between background expiry/eviction sweeps
+CACHE_INDEX_FILE = 'index.sqlite'  # Metadata index inside each cache directory
+CACHE_LOCK_TIMEOUT = 180  # Max seconds to wait for another worker fetching the same URL
+
+# Async HTTP engine settings
+SEARCH_CONCURRENCY = 4  # Search pages in flight at once (rate limiter still applies)
+# Pages scraped per query when no max_pages/--pages is given (None = every detected page;
+# broad queries report hundreds)
+_auto_max_pages = os.getenv('TWOGIS_AUTO_MAX_PAGES', '20').strip()
+try:
+    AUTO_MAX_PAGES = int(_auto_max_pages) if _auto_max_pages.lower() not in ('', 'none', '0') else None
+except ValueError:
+    logging.getLogger(__name__).warning(
+        f"Invalid TWOGIS_AUTO_MAX_PAGES={_auto_max_pages!r}, using the default of 20"
+    )
+    AUTO_MAX_PAGES = 20
+MAX_CONNECTIONS_PER_HOST = 4  # Keep-alive pool size per 2GIS host
+HTTP2_ENABLED = True  # Negotiate HTTP/2 when the h2 package is installed
+
+# Playwright browser pool settings (USE_PLAYWRIGHT=true)
+BROWSER_POOL_SIZE = 1  # Number of long-lived browsers
+BROWSER_MAX_PAGES = 50  # Pages served before a browser is recycled
+BROWSER_LAUNCH_ARGS = [
+    '--no-sandbox',
+    '--disable-setuid-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled'
+]
+
+# Page readiness settings (replace fixed post-load sleeps)
+READINESS_MAX_WAIT_MS_SEARCH = 3000  # Upper bound after 'load' for search pages
+READINESS_MAX_WAIT_MS_PROFILE = 5000  # Upper bound after 'load' for profile pages
+READINESS_POLL_MS = 100  # How often the readiness predicate is evaluated
+CATALOG_API_PATTERNS = [  # JS-compatible regexes for 2GIS catalog API requests
+    r'catalog\.api\.2gis\.[a-z.]+/\d+\.\d+/items',
+]
+
+# Network capture settings (Playwright mode): read catalog API JSON from the
+# page's network traffic instead of parsing rendered HTML
+NETWORK_CAPTURE = False
+NETWORK_CAPTURE_TIMEOUT_MS = 15000  # Give up and fall back to HTML after this
+
+# Resource blocking for Playwright contexts (search pages and profiles)
+BLOCK_RESOURCES = True
+BLOCKED_RESOURCE_TYPES = ['image', 'media', 'font', 'stylesheet']
+BLOCKED_URL_PATTERNS = [
+    r'tile\d*\.maps\.2gis\.com',  # Map tiles
+    r'mc\.yandex\.ru',  # Yandex Metrika
+    r'google-analytics\.com|googletagmanager\.com|doubleclick\.net',
+    r'top-fwz1\.mail\.ru',
+    r'stat\.api\.2gis\.',  # 2GIS usage statistics
+    r'sentry',
+]
+ALLOWED_URL_PATTERNS = CATALOG_API_PATTERNS + [
+    r'2gis\.[a-z.]+/[^?#]+/(search|firm)/',  # Search and profile documents
+]
+
+# Profile enrichment settings
+ENRICH_CONCURRENCY = 3  # Worker pages enriching in parallel (overall rate still bounded by delay)
+ENRICH_CONTACT_FIELDS = ('phone', 'website')  # Businesses with all of these from search need no profile visit
 
 # Output settings
 DEFAULT_OUTPUT_DIR = 'output'
-DEFAULT_CACHE_DIR = 'cache/search'
+# Point the CLI, API and web app at one cache with TWOGIS_CACHE_ROOT (absolute path)
+CACHE_ROOT = os.getenv('TWOGIS_CACHE_ROOT', 'cache')
+DEFAULT_CACHE_DIR = os.path.join(CACHE_ROOT, 'search')
+PARSED_CACHE_DIR = os.path.join(CACHE_ROOT, 'parsed')  # Extracted businesses + pagination per search URL
+EMPTY_CACHE_DIR = os.path.join(CACHE_ROOT, 'empty')  # Negative cache for result pages with no businesses
+PROFILE_CACHE_DIR = os.path.join(CACHE_ROOT, 'profiles')  # Contact info per firm ID (TTL: CACHE_TTL_PROFILE)
+PROFILE_CACHE_STORE_PAYLOAD = False  # Also keep the raw catalog item captured for each firm
+
+# JSON backend for parsing, cache payloads and export: 'auto' (orjson if installed),
+# 'orjson' or 'json' (force the stdlib for byte-identical output everywhere)
+JSON_BACKEND = os.getenv('TWOGIS_JSON_BACKEND', 'auto')
 
 # Data extraction settings
 EXTRACT_PHOTOS = False  # Set to True to extract photo URLs
@@ -0,0 +1,122 @@
+"""
+Decide which businesses need a profile page visit
+
+Search payloads often carry a firm's phone and website already
+(TwoGISParser._parse_business_profile reads them from the contact groups),
+and visiting the profile page then only re-reads what we have. The planner
+sorts every business into one of:
+
+- complete: all ENRICH_CONTACT_FIELDS present - no visit
+- cached: contact info fetched within CACHE_TTL_PROFILE - applied from cache
+- visit: a field is missing and the cache has nothing fresh (or only stale)
+- unidentified: no firm ID, so there is no profile page to visit
+"""
+
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import config
+
+# Firm ID -> fresh cached contact info, or None
+CachedContacts = Callable[[str], Optional[Dict]]
+
+
+def missing_contacts(business: Dict, fields: Sequence[str] = None) -> List[str]:
+    """
+    Contact fields a business does not have yet
+
+    Args:
+        business: Business dictionary (or record)
+        fields: Fields to check (default: config.ENRICH_CONTACT_FIELDS)
+
+    Returns:
+        Names of the empty fields, in the given order
+    """
+    if fields is None:
+        fields = config.ENRICH_CONTACT_FIELDS
+    return [field for field in fields if not business.get(field)]
+
+
+class EnrichmentPlan:
+    """
+    Per-business enrichment decisions, as indexes into the planned list
+
+    Attributes:
+        complete: Businesses that already have every contact field
+        cached: (index, cached contact info) for businesses served from cache
+        visit: Businesses whose profile page has to be visited
+        unidentified: Businesses without a firm ID
+    """
+
+    __slots__ = ('total', 'complete', 'cached', 'visit', 'unidentified')
+
+    def __init__(self, total: int):
+        self.total = total
+        self.complete: List[int] = []
+        self.cached: List[Tuple[int, Dict]] = []
+        self.visit: List[int] = []
+        self.unidentified: List[int] = []
+
+    @property
+    def visits_saved(self) -> int:
+        """Profile page visits avoided (complete search data or cache)"""
+        return len(self.complete) + len(self.cached)
+
+    def get_stats(self) -> Dict:
+        """Counts for logs and API responses"""
+        return {
+            'businesses': self.total,
+            'already_complete': len(self.complete),
+            'from_cache': len(self.cached),
+            'to_visit': len(self.visit),
+            'no_id': len(self.unidentified),
+            'visits_saved': self.visits_saved,
+        }
+
+    def summary(self) -> str:
+        """One-line description of the plan"""
+        return (
+            f"{self.total} businesses: {len(self.complete)} already complete, "
+            f"{len(self.cached)} from contact cache, {len(self.visit)} to visit "
+            f"({self.visits_saved} visits saved)"
+        )
+
+
+def plan_enrichment(
+    businesses: Sequence[Dict],
+    get_cached: Optional[CachedContacts] = None,
+    fields: Sequence[str] = None
+) -> EnrichmentPlan:
+    """
+    Decide for each business whether its profile page needs a visit
+
+    Complete businesses are settled before the cache is read, so they cost
+    no cache lookup either.
+
+    Args:
+        businesses: Business dictionaries from search results
+        get_cached: Lookup of fresh cached contacts by firm ID (None = no cache)
+        fields: Contact fields a business must have to skip the visit
+            (default: config.ENRICH_CONTACT_FIELDS)
+
+    Returns:
+        EnrichmentPlan
+    """
+    plan = EnrichmentPlan(len(businesses))
+
+    for index, business in enumerate(businesses):
+        if not missing_contacts(business, fields):
+            plan.complete.append(index)
+            continue
+
+        business_id = business.get('id')
+        if not business_id:
+            plan.unidentified.append(index)
+            continue
+
+        cached = get_cached(business_id) if get_cached is not None else None
+        if cached is not None:
+            plan.cached.append((index, cached))
+        else:
+            plan.visit.append(index)
+
+    return plan
@@ -2,13 +2,13 @@
 Data export and lead filtering for 2GIS scraper
 """
 
-import json
 import logging
 from pathlib import Path
 from typing import List, Dict, Optional
 import pandas as pd
 
 import config
+import json_backend
 
 logger = logging.getLogger(__name__)
 
@@ -129,53 +129,61 @@ class DataExporter:
         if not businesses:
             return pd.DataFrame()
 
-        # Flatten nested fields for CSV export
-        flattened = []
-        for business in businesses:
-            flat = {
-                'id': business.get('id'),
-                'name': business.get('name'),
-                'address': business.get('address'),
-                'phone': business.get('phone'),
-                'website': business.get('website'),
-                'rating': business.get('rating'),
-                'review_count': business.get('review_count'),
-                'rubric': ', '.join(business.get('rubric', [])),
-                'has_website': 'Yes' if business.get('website') else 'No',
-                'has_phone': 'Yes' if business.get('phone') else 'No',
-            }
+        df = pd.DataFrame([self.flatten_business(business) for business in businesses])
+        return df
 
-            # Add coordinates
-            coords = business.get('coordinates')
-            if coords:
-                flat['latitude'] = coords.get('lat')
-                flat['longitude'] = coords.get('lon')
-            else:
-                flat['latitude'] = None
-                flat['longitude'] = None
-
-            # Add schedule info
-            schedule = business.get('schedule')
-            if schedule:
-                if schedule.get('type') == '24/7':
-                    flat['hours'] = '24/7'
-                else:
-                    flat['hours'] = schedule.get('comments', 'See details')
-            else:
-                flat['hours'] = None
+    @staticmethod
+    def flatten_business(business: Dict) -> Dict:
+        """
+        Flatten nested fields of one business into a CSV row
+
+        Args:
+            business: Business record or dictionary
+
+        Returns:
+            Flat dictionary (one CSV row)
+        """
+        flat = {
+            'id': business.get('id'),
+            'name': business.get('name'),
+            'address': business.get('address'),
+            'phone': business.get('phone'),
+            'website': business.get('website'),
+            'rating': business.get('rating'),
+            'review_count': business.get('review_count'),
+            'rubric': ', '.join(business.get('rubric', [])),
+            'has_website': 'Yes' if business.get('website') else 'No',
+            'has_phone': 'Yes' if business.get('phone') else 'No',
+        }
 
-            # Add attribute summary
-            attributes = business.get('attributes', [])
-            if attributes:
-                attr_names = [attr.get('name') for attr in attributes if attr.get('name')]
-                flat['attributes'] = '; '.join(attr_names[:5])  # Limit to 5 for readability
+        # Add coordinates
+        coords = business.get('coordinates')
+        if coords:
+            flat['latitude'] = coords.get('lat')
+            flat['longitude'] = coords.get('lon')
+        else:
+            flat['latitude'] = None
+            flat['longitude'] = None
+
+        # Add schedule info
+        schedule = business.get('schedule')
+        if schedule:
+            if schedule.get('type') == '24/7':
+                flat['hours'] = '24/7'
             else:
-                flat['attributes'] = None
+                flat['hours'] = schedule.get('comments', 'See details')
+        else:
+            flat['hours'] = None
 
-            flattened.append(flat)
+        # Add attribute summary
+        attributes = business.get('attributes', [])
+        if attributes:
+            attr_names = [attr.get('name') for attr in attributes if attr.get('name')]
+            flat['attributes'] = '; '.join(attr_names[:5])  # Limit to 5 for readability
+        else:
+            flat['attributes'] = None
 
-        df = pd.DataFrame(flattened)
-        return df
+        return flat
 
     def export_csv(
         self,
@@ -246,7 +254,7 @@ class DataExporter:
         indent = 2 if pretty else None
 
         with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(businesses, f, ensure_ascii=False, indent=indent)
+            json_backend.dump(businesses, f, indent=indent)
 
         logger.info(f"Exported {len(businesses)} businesses to {output_path}")
         return str(output_path)
@@ -381,3 +389,7 @@ class DataExporter:
         print(f"With rating: {stats['with_rating']}")
         print(f"Average rating: {stats['avg_rating']}" if stats['avg_rating'] else "")
         print("="*50 + "\n")
+
+
+# CSV header, in flatten_business order (derived from it, so the two can't drift apart)
+CSV_COLUMNS = tuple(DataExporter.flatten_business({}))
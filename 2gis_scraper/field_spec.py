@@ -0,0 +1,426 @@
+"""
+Declarative field extraction for nested JSON (2GIS business profiles)
+
+A field is an ordered list of alternatives; the first one that yields a value
+wins. Each alternative is a Source (one key path, optionally filtered and
+transformed) or a Collect (several sources gathered into one list or joined
+string). compile_spec() turns a {field: Field} spec into one function per
+field, and compile_record() into a single function for all of them, once,
+at import time. Each function is composed from small closures specialised
+to its source (a key lookup, a list loop, a filter), so extraction runs the
+same nested lookups and loops a hand-written extractor would, without
+reading the spec again per call.
+
+    PHONE = Field(
+        Source(('contacts', EACH), where={'type': 'phone'}, pick=('text', 'value')),
+        Source(('phone',), accept=lambda v: isinstance(v, str) and bool(v)),
+    )
+"""
+
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+# Path step: every item of a list
+EACH = '*'
+
+# Returned by value functions (and used internally) for "no value here, keep looking"
+SKIP = object()
+
+Extractor = Callable[[Any], Any]
+
+
+class Source:
+    """
+    One place a value can come from
+
+    Args:
+        path: Keys to follow from the profile; EACH iterates a list
+        where: Filter on the node at the end of the path: a type (isinstance),
+            a callable, or a {key: value or tuple of values} mapping (the node
+            must be a dict)
+        pick: Take the first of these keys present in the node (None if none is)
+        value: Transform the node (or picked value); may return SKIP
+        convert: Like value, but a ValueError/TypeError gives None (e.g. float)
+        accept: Final test on the value; rejected values are skipped
+        expand: In a Collect, value(node, collected) appends any number of
+            values to the collected list itself
+        unique: In a Collect, skip values already collected
+    """
+
+    __slots__ = ('path', 'where', 'pick', 'value', 'convert', 'accept', 'expand', 'unique')
+
+    def __init__(
+        self,
+        path: Tuple[str, ...],
+        where: Union[Callable[[Any], bool], Mapping[str, Any], None] = None,
+        pick: Optional[Tuple[str, ...]] = None,
+        value: Optional[Callable[[Any], Any]] = None,
+        convert: Optional[Callable[[Any], Any]] = None,
+        accept: Optional[Callable[[Any], bool]] = None,
+        expand: bool = False,
+        unique: bool = False
+    ):
+        self.path = tuple(path)
+        self.where = where
+        self.pick = pick
+        self.value = value
+        self.convert = convert
+        self.accept = accept
+        self.expand = expand
+        self.unique = unique
+
+
+class Collect:
+    """
+    Gather the values of several sources, in order
+
+    Args:
+        sources: Sources whose every match is collected
+        join: Join the values with this separator instead of returning a list
+
+    An empty result does not count as a value (the next alternative is tried).
+    """
+
+    __slots__ = ('sources', 'join')
+
+    def __init__(self, *sources: Source, join: Optional[str] = None):
+        self.sources = sources
+        self.join = join
+
+
+class Field:
+    """
+    Ordered alternatives for one output field
+
+    Args:
+        alternatives: Source/Collect tried in order; the first value wins
+        default: Value when no alternative yields one (a callable is called,
+            e.g. list for a fresh empty list)
+    """
+
+    __slots__ = ('alternatives', 'default')
+
+    def __init__(self, *alternatives: Union[Source, Collect], default: Any = None):
+        self.alternatives = alternatives
+        self.default = default
+
+
+def _identity(node):
+    return node
+
+
+def _walk_first(path: Tuple[str, ...], leaf: Optional[Extractor]) -> Optional[Extractor]:
+    """
+    Function of a node following path to the first leaf value (or SKIP)
+
+    Runs of plain keys become one lookup step; EACH returns from inside the
+    loop, so the first value found anywhere ends every loop. A leaf of None
+    takes the node as it is (and so does the result for an empty path).
+    """
+    if not path:
+        return leaf
+    if path[0] == EACH:
+        inner = _walk_first(path[1:], leaf)
+
+        def each(node):
+            if isinstance(node, list):
+                for item in node:
+                    if inner is None:
+                        return item
+                    value = inner(item)
+                    if value is not SKIP:
+                        return value
+            return SKIP
+        return each
+
+    count = path.index(EACH) if EACH in path else len(path)
+    keys, inner = path[:count], _walk_first(path[count:], leaf)
+    if len(keys) == 1:
+        key = keys[0]
+
+        def lookup(node):
+            if isinstance(node, dict):
+                node = node.get(key, SKIP)
+                if node is not SKIP and inner is not None:
+                    return inner(node)
+                return node
+            return SKIP
+        return lookup
+
+    def lookup_path(node):
+        for key in keys:
+            if not isinstance(node, dict):
+                return SKIP
+            node = node.get(key, SKIP)
+        if node is not SKIP and inner is not None:
+            return inner(node)
+        return node
+    return lookup_path
+
+
+def _walk_all(path: Tuple[str, ...], add: Callable[[Any, list], None]) -> Callable[[Any, list], None]:
+    """Like _walk_first, but calls add(node, collected) for every node at the end of path"""
+    if not path:
+        return add
+    if path[0] == EACH:
+        inner = _walk_all(path[1:], add)
+
+        def each(node, collected):
+            if isinstance(node, list):
+                for item in node:
+                    inner(item, collected)
+        return each
+
+    count = path.index(EACH) if EACH in path else len(path)
+    keys, inner = path[:count], _walk_all(path[count:], add)
+
+    def lookup_path(node, collected):
+        for key in keys:
+            if not isinstance(node, dict):
+                return
+            node = node.get(key, SKIP)
+        if node is not SKIP:
+            inner(node, collected)
+    return lookup_path
+
+
+def _where_test(where: Any) -> Optional[Callable[[Any], bool]]:
+    """Source.where as a predicate (None = no filter)"""
+    if where is None:
+        return None
+    if isinstance(where, type):
+        return lambda node: isinstance(node, where)
+    if callable(where):
+        return where
+
+    # A tuple, not a set: the value may be unhashable
+    tests = tuple(
+        (key, tuple(allowed), True) if isinstance(allowed, (tuple, list, set, frozenset)) else (key, allowed, False)
+        for key, allowed in where.items()
+    )
+    if len(tests) == 1:
+        key, allowed, many = tests[0]
+        if many:
+            return lambda node: isinstance(node, dict) and node.get(key) in allowed
+        return lambda node: isinstance(node, dict) and node.get(key) == allowed
+
+    def matches(node):
+        if not isinstance(node, dict):
+            return False
+        for key, allowed, many in tests:
+            value = node.get(key)
+            if not (value in allowed if many else value == allowed):
+                return False
+        return True
+    return matches
+
+
+def _leaf(source: Source, skip_where: bool = False) -> Optional[Extractor]:
+    """
+    The where/pick/convert/value/accept steps for the node at the end of a
+    source's path, as one function returning SKIP when there is no value
+
+    Returns None when there are no steps. For expand sources the value
+    function is left to the caller, and with skip_where so is the filter.
+    The common step combinations get a function of their own, so a leaf
+    costs one call.
+    """
+    where = None if skip_where else _where_test(source.where)
+    pick, convert, accept = source.pick, source.convert, source.accept
+    value = None if source.expand else source.value
+
+    if pick is None and convert is None:
+        if where is None and value is None:
+            if accept is None:
+                return None
+            return lambda node: node if accept(node) else SKIP
+        if where is None and accept is None:
+            return value
+        if value is None and accept is None:
+            return lambda node: node if where(node) else SKIP
+        if accept is None:
+            return lambda node: value(node) if where(node) else SKIP
+
+    def leaf(node):
+        if where is not None and not where(node):
+            return SKIP
+        if pick is not None:
+            if not isinstance(node, dict):
+                return SKIP
+            for key in pick:
+                if key in node:
+                    node = node[key]
+                    break
+            else:
+                node = None
+        if convert is not None:
+            try:
+                node = convert(node)
+            except (ValueError, TypeError):
+                node = None
+        if value is not None:
+            node = value(node)
+            if node is SKIP:
+                return SKIP
+        if accept is not None and not accept(node):
+            return SKIP
+        return node
+    return leaf
+
+
+def _first(source: Source) -> Extractor:
+    """Function of the profile returning the source's first value, or SKIP"""
+    if source.expand:
+        raise ValueError("expand only applies to sources inside a Collect")
+    return _walk_first(source.path, _leaf(source)) or _identity
+
+
+def _collector(source: Source) -> Callable[[Any, list], None]:
+    """Function of (profile, collected) appending every value of the source"""
+    expand = source.value if source.expand else None
+    unique = source.unique
+
+    if source.path and source.path[-1] == EACH:
+        # The usual case, every matching item of a list, as a single loop
+        # (with a type filter checked inline rather than through a call)
+        where_type = source.where if isinstance(source.where, type) else None
+        leaf = _leaf(source, skip_where=where_type is not None)
+
+        def add_items(node, collected):
+            if isinstance(node, list):
+                for item in node:
+                    if where_type is not None and not isinstance(item, where_type):
+                        continue
+                    if leaf is not None:
+                        item = leaf(item)
+                        if item is SKIP:
+                            continue
+                    if expand is not None:
+                        expand(item, collected)
+                    elif not unique or item not in collected:
+                        collected.append(item)
+        return _walk_all(source.path[:-1], add_items)
+
+    leaf = _leaf(source) or _identity
+
+    def add(node, collected):
+        node = leaf(node)
+        if node is SKIP:
+            return
+        if expand is not None:
+            expand(node, collected)
+        elif not unique or node not in collected:
+            collected.append(node)
+    return _walk_all(source.path, add)
+
+
+def _collect(collect: Collect) -> Extractor:
+    """Function of the profile returning the collected list (or joined string), or SKIP if empty"""
+    collectors = tuple(_collector(source) for source in collect.sources)
+    join = collect.join
+
+    def gather(profile):
+        collected = []
+        for collector in collectors:
+            collector(profile, collected)
+        if not collected:
+            return SKIP
+        return join.join(collected) if join is not None else collected
+    return gather
+
+
+def _alternatives(field: Field) -> Tuple[Tuple[Optional[str], Optional[Extractor]], ...]:
+    """
+    (first key, function) per alternative of a field
+
+    When a source's path starts with a key, that key is looked up by the
+    caller and the function takes the child (None: the child is the value),
+    so an alternative whose branch is absent costs no call at all.
+    Otherwise the key is None and the function takes the profile.
+    """
+    compiled = []
+    for alternative in field.alternatives:
+        if isinstance(alternative, Collect):
+            compiled.append((None, _collect(alternative)))
+        elif alternative.path and alternative.path[0] != EACH:
+            _first(alternative)  # Validates the source
+            compiled.append((alternative.path[0], _walk_first(alternative.path[1:], _leaf(alternative))))
+        else:
+            compiled.append((None, _first(alternative)))
+    return tuple(compiled)
+
+
+def _record_extractor(fields: Tuple[Field, ...]) -> Callable[[Any], Tuple]:
+    """Function of the profile returning every field's value, in order"""
+    compiled = tuple(
+        (_alternatives(field), field.default if callable(field.default) else None, field.default)
+        for field in fields
+    )
+
+    def extract_record(profile):
+        is_dict = isinstance(profile, dict)
+        values = []
+        for alternatives, make_default, default in compiled:
+            for key, alternative in alternatives:
+                if key is None:
+                    value = alternative(profile)
+                elif not is_dict:
+                    continue
+                else:
+                    value = profile.get(key, SKIP)
+                    if value is SKIP:
+                        continue
+                    if alternative is not None:
+                        value = alternative(value)
+                if value is not SKIP:
+                    break
+            else:
+                value = make_default() if make_default is not None else default
+            values.append(value)
+        return tuple(values)
+    return extract_record
+
+
+def compile_field(field: Field, name: str = 'field') -> Extractor:
+    """
+    Compile one Field into a function of the profile
+
+    Args:
+        field: Field spec
+        name: Field name (used for the function's name)
+
+    Returns:
+        Function returning the first alternative's value, or the default
+    """
+    record = _record_extractor((field,))
+
+    def extract(profile):
+        return record(profile)[0]
+
+    extract.__name__ = extract.__qualname__ = f'extract_{name}' if name.isidentifier() else 'extract'
+    return extract
+
+
+def compile_spec(spec: Mapping[str, Field]) -> Dict[str, Extractor]:
+    """
+    Compile a {field name: Field} spec into one extractor per field
+
+    Args:
+        spec: Field specs, in output order
+
+    Returns:
+        {field name: extractor}, same order
+    """
+    return {name: compile_field(field, name) for name, field in spec.items()}
+
+
+def compile_record(spec: Mapping[str, Field]) -> Callable[[Any], Tuple]:
+    """
+    Compile a spec into a single function extracting every field
+
+    Args:
+        spec: Field specs, in output order
+
+    Returns:
+        Function returning a tuple of the field values, in spec order
+    """
+    return _record_extractor(tuple(spec.values()))
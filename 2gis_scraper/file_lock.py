@@ -0,0 +1,87 @@
+"""
+Advisory file locks shared by threads and processes on one machine
+"""
+
+import asyncio
+import os
+import time
+from typing import Optional
+
+# flock is POSIX-only; elsewhere locks degrade to no-ops (per-process behaviour)
+try:
+    import fcntl
+    FCNTL_AVAILABLE = True
+except ImportError:
+    FCNTL_AVAILABLE = False
+
+
+class FileLock:
+    """
+    Exclusive flock() on a lock file
+
+    Each acquire opens its own file description, so two threads of one
+    process exclude each other just like two processes do.
+    """
+
+    def __init__(self, path: str, poll_interval: float = 0.05):
+        """
+        Args:
+            path: Lock file (created if missing, never deleted)
+            poll_interval: Seconds between attempts while waiting
+        """
+        self.path = path
+        self.poll_interval = poll_interval
+        self._fd: Optional[int] = None
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Take the lock
+
+        Args:
+            timeout: Seconds to wait (None waits forever, 0 tries once)
+
+        Returns:
+            True if the lock is held, False on timeout
+        """
+        if not FCNTL_AVAILABLE:
+            return True
+
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                self._fd = fd
+                return True
+            except BlockingIOError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    os.close(fd)
+                    return False
+                time.sleep(self.poll_interval)
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        """Asynchronous version of acquire (polls, so the event loop keeps running)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.acquire(timeout=0):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            await asyncio.sleep(self.poll_interval)
+        return True
+
+    def release(self):
+        """Release the lock (no-op if not held)"""
+        if self._fd is None:
+            return
+        try:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
@@ -0,0 +1,116 @@
+"""
+JSON encoding/decoding through the fastest available backend
+
+orjson is used when installed (config.JSON_BACKEND = 'auto'); the stdlib json
+module is the fallback. Set JSON_BACKEND (or TWOGIS_JSON_BACKEND) to 'json'
+to force byte-identical output across machines.
+"""
+
+import json
+import logging
+from typing import IO, Any, Optional, Union
+
+import config
+
+logger = logging.getLogger(__name__)
+
+# orjson parses and serializes several times faster than the stdlib
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+JSON_BACKENDS = ('orjson', 'json')
+
+# orjson.JSONDecodeError subclasses this, so callers only need one except clause
+JSONDecodeError = json.JSONDecodeError
+
+
+def _resolve_backend(backend: str) -> str:
+    """Map 'auto' (and unavailable orjson) to a concrete backend"""
+    if backend == 'auto':
+        return 'orjson' if ORJSON_AVAILABLE else 'json'
+    if backend == 'orjson' and not ORJSON_AVAILABLE:
+        logger.warning("orjson not installed - using the json module instead")
+        return 'json'
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{backend}'")
+    return backend
+
+
+_backend = _resolve_backend(config.JSON_BACKEND)
+
+
+def get_backend() -> str:
+    """Get the active backend name ('orjson' or 'json')"""
+    return _backend
+
+
+def set_backend(backend: str) -> str:
+    """
+    Switch backend at runtime
+
+    Args:
+        backend: 'auto', 'orjson' or 'json'
+
+    Returns:
+        The backend actually in use
+    """
+    global _backend
+    _backend = _resolve_backend(backend)
+    return _backend
+
+
+def _default(obj: Any) -> Any:
+    """Serialize records (models.Business etc.) through their to_dict()"""
+    to_dict = getattr(obj, 'to_dict', None)
+    if to_dict is None:
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    return to_dict()
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse a JSON document
+
+    Args:
+        data: JSON text (str or UTF-8 bytes)
+
+    Returns:
+        Decoded Python object
+    """
+    if _backend == 'orjson':
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects lone surrogates that the json module accepts
+            pass
+    return json.loads(data)
+
+
+def dumps(obj: Any, indent: Optional[int] = None) -> str:
+    """
+    Serialize to JSON text, keeping non-ASCII characters (ensure_ascii=False)
+
+    Args:
+        obj: Object to serialize
+        indent: None for compact output, else spaces per level (orjson only does 2)
+
+    Returns:
+        JSON string
+    """
+    if _backend == 'orjson' and indent in (None, 2):
+        try:
+            return orjson.dumps(
+                obj, default=_default, option=orjson.OPT_INDENT_2 if indent else 0
+            ).decode('utf-8')
+        except TypeError:
+            # Integers beyond 64 bits, non-str keys, ... - the json module copes
+            pass
+    return json.dumps(obj, ensure_ascii=False, indent=indent, default=_default)
+
+
+def dump(obj: Any, fp: IO[str], indent: Optional[int] = None):
+    """Serialize to an open text file (see dumps)"""
+    fp.write(dumps(obj, indent=indent))
@@ -100,7 +100,7 @@ Supported cities:
         '--pages',
         type=int,
         default=None,
-        help='Maximum pages to scrape per query (default: auto-detect all)'
+        help=f'Maximum pages to scrape per query (default: auto-detect, at most {config.AUTO_MAX_PAGES or "all"})'
     )
     parser.add_argument(
         '--delay',
@@ -118,11 +118,28 @@ Supported cities:
         action='store_true',
         help='Clear cache before scraping'
     )
+    parser.add_argument(
+        '--migrate-cache',
+        action='store_true',
+        help='Move search cache files of the old flat layout into shards and index them'
+    )
+    parser.add_argument(
+        '--capture-network',
+        action='store_true',
+        default=config.NETWORK_CAPTURE,
+        help='With USE_PLAYWRIGHT=true, read catalog API JSON from network traffic instead of rendered HTML'
+    )
     parser.add_argument(
         '--enrich-contacts',
         action='store_true',
         help='Visit each business page to get phone/website (SLOW but accurate for lead filtering)'
     )
+    parser.add_argument(
+        '--enrich-concurrency',
+        type=int,
+        default=config.ENRICH_CONCURRENCY,
+        help=f'Parallel browser pages for --enrich-contacts (default: {config.ENRICH_CONCURRENCY})'
+    )
 
     # Filtering options
     parser.add_argument(
@@ -191,12 +208,14 @@ Supported cities:
     setup_logging(level=args.log_level, log_to_file=args.log_file)
     logger = logging.getLogger(__name__)
 
+    scraper = None
     try:
         # Initialize scraper
         cache_enabled = not args.no_cache
         scraper = TwoGISScraper(
             cache_enabled=cache_enabled,
-            delay=args.delay
+            delay=args.delay,
+            capture_network=args.capture_network
         )
 
         # Clear cache if requested
@@ -204,6 +223,10 @@ Supported cities:
             deleted = scraper.clear_cache()
             logger.info(f"Cleared cache: {deleted} files deleted")
 
+        if args.migrate_cache:
+            migrated = scraper.cache.migrate_flat_entries()
+            logger.info(f"Migrated cache: {migrated} flat files moved into shards")
+
         # Initialize exporter
         exporter = DataExporter(output_dir=args.output_dir)
 
@@ -240,8 +263,14 @@ Supported cities:
             logger.info("\n" + "="*50)
             logger.info("ENRICHING WITH CONTACT INFORMATION")
             logger.info("="*50)
-            logger.info(f"Visiting {len(all_businesses)} business pages to extract phone/website...")
-            logger.info(f"This will take approximately {len(all_businesses) * args.delay:.0f} seconds")
+            # Businesses whose search data already has phone and website are skipped
+            # (cached firms too - the enricher logs the final plan)
+            from enrichment_planner import plan_enrichment
+            plan = plan_enrichment(all_businesses)
+            to_visit = len(plan.visit)
+            logger.info(f"Visiting up to {to_visit} of {plan.total} business pages to extract phone/website "
+                        f"({len(plan.complete)} already complete)...")
+            logger.info(f"This will take at most about {to_visit * args.delay:.0f} seconds")
             logger.info("="*50 + "\n")
 
             from profile_scraper import enrich_businesses
@@ -249,7 +278,9 @@ Supported cities:
                 all_businesses,
                 city=args.city,
                 headless=True,
-                delay=args.delay
+                delay=args.delay,
+                concurrency=args.enrich_concurrency,
+                cache_enabled=not args.no_cache
             )
 
         # Print summary
@@ -321,6 +352,17 @@ Supported cities:
         if cache_stats['enabled']:
             print(f"\nCache: {cache_stats['total_files']} files, {cache_stats['total_size_mb']} MB")
 
+        # Show how long Playwright pages actually needed to become ready
+        readiness = scraper.get_readiness_stats()
+        if readiness['count']:
+            print(f"Page readiness: {readiness['count']} pages, median {readiness['p50_ms']} ms, "
+                  f"p95 {readiness['p95_ms']} ms ({readiness['reasons']})")
+
+        # Show adaptive request pacing
+        for host, pacing in scraper.get_pacing_stats().items():
+            print(f"Pacing {host}: {pacing['rate_per_min']} req/min (delay {pacing['delay']}s, "
+                  f"{pacing['backoffs']} backoffs)")
+
         print("\n✓ Scraping complete!\n")
 
     except KeyboardInterrupt:
@@ -331,6 +373,10 @@ Supported cities:
         logger.error(f"Fatal error: {e}", exc_info=True)
         sys.exit(1)
 
+    finally:
+        if scraper is not None:
+            scraper.close()
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,218 @@
+"""
+Compact business records produced by TwoGISParser
+
+Each record is a __slots__ class that also implements the mapping protocol,
+so code written against the old business dictionaries (business.get('phone'),
+business['website'] = ..., 'rating' in business) keeps working unchanged.
+Use to_dict() where plain dictionaries are needed (JSON, API responses).
+"""
+
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional
+
+
+def _plain(value: Any) -> Any:
+    """Convert records (and lists of them) to plain dictionaries"""
+    if isinstance(value, _Record):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [_plain(item) for item in value]
+    return value
+
+
+def to_dicts(businesses: List[Any]) -> List[Dict[str, Any]]:
+    """
+    Convert a list of businesses to plain dictionaries
+
+    Args:
+        businesses: Business records and/or dictionaries
+
+    Returns:
+        List of dictionaries (dictionaries in the input are passed through)
+    """
+    return [_plain(business) for business in businesses]
+
+
+class _Record(MutableMapping):
+    """
+    Fixed-field record with a dict-compatible interface
+
+    Fields are the class's __slots__ (minus 'extra'); keys outside them are
+    kept in a lazily created 'extra' dictionary so ad-hoc additions still work.
+    """
+
+    __slots__ = ('extra',)
+    _fields: tuple = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._fields = tuple(cls.__slots__)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._fields:
+            return getattr(self, key)
+        extra = getattr(self, 'extra', None)
+        if extra and key in extra:
+            return extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value: Any):
+        if key in self._fields:
+            setattr(self, key, value)
+            return
+        if getattr(self, 'extra', None) is None:
+            self.extra = {}
+        self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        if key in self._fields:
+            raise TypeError(f"{type(self).__name__} field '{key}' cannot be deleted")
+        extra = getattr(self, 'extra', None)
+        if not extra or key not in extra:
+            raise KeyError(key)
+        del extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._fields
+        extra = getattr(self, 'extra', None)
+        if extra:
+            yield from extra
+
+    def __len__(self) -> int:
+        extra = getattr(self, 'extra', None)
+        return len(self._fields) + (len(extra) if extra else 0)
+
+    def __contains__(self, key: object) -> bool:
+        if key in self._fields:
+            return True
+        extra = getattr(self, 'extra', None)
+        return bool(extra) and key in extra
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Faster than the MutableMapping default, which goes through __getitem__ + KeyError
+        if key in self._fields:
+            return getattr(self, key)
+        extra = getattr(self, 'extra', None)
+        return extra.get(key, default) if extra else default
+
+    def copy(self) -> Dict[str, Any]:
+        """Shallow copy as a plain dictionary (like dict.copy)"""
+        return dict(self.items())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain (JSON-serializable) dictionary, nested records included"""
+        return {key: _plain(self[key]) for key in self}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.to_dict()!r})"
+
+
+class Coordinates(_Record):
+    """Latitude/longitude of a business"""
+
+    __slots__ = ('lat', 'lon')
+
+    def __init__(self, lat: Optional[float], lon: Optional[float]):
+        self.lat = lat
+        self.lon = lon
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> Optional['Coordinates']:
+        return cls(data.get('lat'), data.get('lon')) if data else None
+
+
+class Schedule(_Record):
+    """Working hours of a business"""
+
+    __slots__ = ('type', 'hours', 'comments', 'is_24_7')
+
+    def __init__(self, type: str, hours: Any, comments: str = '', is_24_7: bool = False):
+        self.type = type
+        self.hours = hours
+        self.comments = comments
+        self.is_24_7 = is_24_7
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> Optional['Schedule']:
+        if not data:
+            return None
+        return cls(data.get('type'), data.get('hours'), data.get('comments', ''), data.get('is_24_7', False))
+
+
+class Attribute(_Record):
+    """One business attribute (WiFi, parking, delivery, ...)"""
+
+    __slots__ = ('category', 'name', 'value')
+
+    def __init__(self, category: str, name: str, value: Any):
+        self.category = category
+        self.name = name
+        self.value = value
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Attribute':
+        return cls(data.get('category'), data.get('name'), data.get('value'))
+
+
+class Business(_Record):
+    """One business listing"""
+
+    __slots__ = (
+        'id', 'name', 'address', 'coordinates', 'phone', 'website',
+        'rating', 'review_count', 'rubric', 'schedule', 'attributes',
+    )
+
+    def __init__(
+        self,
+        id: str,
+        name: str = '',
+        address: str = '',
+        coordinates: Optional[Coordinates] = None,
+        phone: Optional[str] = None,
+        website: Optional[str] = None,
+        rating: Optional[float] = None,
+        review_count: Optional[int] = None,
+        rubric: Optional[List[str]] = None,
+        schedule: Optional[Schedule] = None,
+        attributes: Optional[List[Attribute]] = None
+    ):
+        self.id = id
+        self.name = name
+        self.address = address
+        self.coordinates = coordinates
+        self.phone = phone
+        self.website = website
+        self.rating = rating
+        self.review_count = review_count
+        self.rubric = rubric if rubric is not None else []
+        self.schedule = schedule
+        self.attributes = attributes if attributes is not None else []
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Business':
+        """
+        Build from a business dictionary (e.g. a cached or exported one)
+
+        Args:
+            data: Dictionary with the keys to_dict() produces; unknown keys go to extra
+
+        Returns:
+            Business
+        """
+        business = cls(
+            id=data.get('id'),
+            name=data.get('name', ''),
+            address=data.get('address', ''),
+            coordinates=Coordinates.from_dict(data.get('coordinates')),
+            phone=data.get('phone'),
+            website=data.get('website'),
+            rating=data.get('rating'),
+            review_count=data.get('review_count'),
+            rubric=data.get('rubric'),
+            schedule=Schedule.from_dict(data.get('schedule')),
+            attributes=[Attribute.from_dict(attr) for attr in data.get('attributes') or []],
+        )
+        for key, value in data.items():
+            if key not in cls._fields:
+                business[key] = value
+        return business
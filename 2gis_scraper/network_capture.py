@@ -0,0 +1,133 @@
+"""
+Capture 2GIS catalog API JSON straight from Playwright network traffic
+
+Instead of rendering the whole page and regex-parsing page.content(),
+we wait for the catalog API response the page requests, read its JSON
+body and stop the navigation as soon as it has arrived.
+"""
+
+import logging
+import re
+from typing import Dict, List, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+try:
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    PlaywrightTimeoutError = TimeoutError
+
+
+class CatalogResponseMatcher:
+    """Decides whether a network response is a catalog API payload we want"""
+
+    def __init__(self, patterns: Optional[List[str]] = None, url_contains: Optional[str] = None):
+        """
+        Args:
+            patterns: URL regexes (default config.CATALOG_API_PATTERNS)
+            url_contains: Extra substring the URL must contain (e.g. a firm ID)
+        """
+        self.regexes = [re.compile(p) for p in (patterns or config.CATALOG_API_PATTERNS)]
+        self.url_contains = url_contains
+
+    def __call__(self, response) -> bool:
+        if response.status != 200:
+            return False
+        url = response.url
+        if self.url_contains and self.url_contains not in url:
+            return False
+        return any(regex.search(url) for regex in self.regexes)
+
+
+def _valid_payload(payload) -> bool:
+    return isinstance(payload, dict) and isinstance(payload.get('result'), dict)
+
+
+def capture_catalog_sync(
+    page,
+    url: str,
+    matcher: CatalogResponseMatcher,
+    timeout_ms: int = None
+) -> Optional[Dict]:
+    """
+    Navigate a sync Playwright page and return the catalog JSON it loads
+
+    Args:
+        page: Playwright sync page
+        url: Page URL to navigate to
+        matcher: Response matcher
+        timeout_ms: How long to wait for the payload (default from config)
+
+    Returns:
+        Parsed catalog payload or None if none arrived in time
+    """
+    timeout_ms = timeout_ms or config.NETWORK_CAPTURE_TIMEOUT_MS
+    try:
+        with page.expect_response(matcher, timeout=timeout_ms) as response_info:
+            page.goto(url, wait_until='commit', timeout=60000)
+        payload = response_info.value.json()
+    except PlaywrightTimeoutError:
+        logger.info(f"[CAPTURE] No catalog response within {timeout_ms} ms: {url}")
+        return None
+    except Exception as e:
+        logger.warning(f"[CAPTURE] Capture failed for {url}: {e}")
+        return None
+
+    # We have what we need, stop loading the rest of the page
+    try:
+        page.evaluate('window.stop()')
+    except Exception:
+        pass
+
+    if not _valid_payload(payload):
+        logger.warning(f"[CAPTURE] Unexpected catalog payload shape: {url}")
+        return None
+
+    logger.info(f"[CAPTURE] Catalog payload captured: {url}")
+    return payload
+
+
+async def capture_catalog(
+    page,
+    url: str,
+    matcher: CatalogResponseMatcher,
+    timeout_ms: int = None
+) -> Optional[Dict]:
+    """
+    Navigate an async Playwright page and return the catalog JSON it loads
+
+    Args:
+        page: Playwright async page
+        url: Page URL to navigate to
+        matcher: Response matcher
+        timeout_ms: How long to wait for the payload (default from config)
+
+    Returns:
+        Parsed catalog payload or None if none arrived in time
+    """
+    timeout_ms = timeout_ms or config.NETWORK_CAPTURE_TIMEOUT_MS
+    try:
+        async with page.expect_response(matcher, timeout=timeout_ms) as response_info:
+            await page.goto(url, wait_until='commit', timeout=60000)
+        response = await response_info.value
+        payload = await response.json()
+    except PlaywrightTimeoutError:
+        logger.info(f"[CAPTURE] No catalog response within {timeout_ms} ms: {url}")
+        return None
+    except Exception as e:
+        logger.warning(f"[CAPTURE] Capture failed for {url}: {e}")
+        return None
+
+    try:
+        await page.evaluate('window.stop()')
+    except Exception:
+        pass
+
+    if not _valid_payload(payload):
+        logger.warning(f"[CAPTURE] Unexpected catalog payload shape: {url}")
+        return None
+
+    logger.info(f"[CAPTURE] Catalog payload captured: {url}")
+    return payload
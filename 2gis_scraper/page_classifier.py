@@ -0,0 +1,58 @@
+"""
+Cheap classification of fetched search pages before they are cached
+
+Uses substring checks only - no regex over the whole page, no JSON parsing.
+"""
+
+from typing import Optional
+
+import config
+
+PAGE_OK = 'ok'  # initialState with at least one business profile
+PAGE_EMPTY = 'empty'  # Valid page, genuinely no results
+PAGE_BLOCKED = 'blocked'  # Captcha / access-denied interstitial
+PAGE_INVALID = 'invalid'  # No initialState and no block marker (broken or unknown page)
+
+INITIAL_STATE_MARKER = 'var initialState'
+# The businesses map (data.entity.profile); other branches such as
+# search.profile and region.profile are present even on pages with no results
+PROFILE_MARKER = '"entity":{"profile":{"'
+
+
+def looks_like_block_page(html: Optional[str]) -> bool:
+    """
+    Check whether a 200 response is actually a captcha / access-denied page
+
+    Args:
+        html: Response body
+
+    Returns:
+        True if the page has a block marker and no listing data
+    """
+    if not html or 'initialState' in html:
+        return False
+    lowered = html.lower()
+    return any(marker in lowered for marker in config.BLOCK_PAGE_MARKERS)
+
+
+def classify_page(html: Optional[str]) -> str:
+    """
+    Classify a fetched search page
+
+    Args:
+        html: Response body
+
+    Returns:
+        One of PAGE_OK, PAGE_EMPTY, PAGE_BLOCKED, PAGE_INVALID
+    """
+    if not html:
+        return PAGE_INVALID
+
+    start = html.find(INITIAL_STATE_MARKER)
+    if start == -1:
+        return PAGE_BLOCKED if looks_like_block_page(html) else PAGE_INVALID
+
+    # Profiles are keyed by firm ID, so a non-empty map has '"entity":{"profile":{"<id>"'
+    if html.find(PROFILE_MARKER, start) == -1:
+        return PAGE_EMPTY
+    return PAGE_OK
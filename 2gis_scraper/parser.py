@@ -3,39 +3,261 @@ JSON extraction and business data parsing for 2GIS
 """
 
 import re
-import json
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import json_backend
+from field_spec import EACH, SKIP, Collect, Field, Source, compile_record, compile_spec
+from models import Attribute, Business, Coordinates, Schedule
+from state_scanner import decode_subtrees, scan_initial_state
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever extraction output changes; invalidates the parsed-result cache
+PARSER_VERSION = 5
+
+# initialState branches read from search result pages (profiles + pagination)
+SEARCH_STATE_PATHS = (
+    ('data', 'entity', 'profile'),
+    ('data', 'context'),
+    ('data', 'search', 'profile'),
+)
+
+
+# 2GIS partner/affiliate sites that aren't real business websites; a URL is
+# rejected when its host is one of these or a subdomain of one
+BLACKLISTED_WEBSITE_HOSTS = frozenset({
+    'otello.ru',
+    '2gis.ru',
+    '2gis.ae',
+    '2gis.kz',
+    '2gis.kg',
+    '2gis.cz',
+    '2gis.cl',
+    '2gis.it',
+})
+
+# Host of an absolute, protocol-relative or scheme-less URL
+_URL_HOST = re.compile(r'\s*(?:[a-zA-Z][a-zA-Z0-9+.-]*://|//)?(?:[^@/?#\s]*@)?([^:/?#\s]*)')
+
+# adm_div levels used to build an address (country is skipped)
+ADDRESS_DIV_TYPES = ('city', 'district', 'division', 'district_area')
+
+
+def is_valid_website(url: str) -> bool:
+    """Check if URL is a real business website (not a 2GIS partner site)"""
+    if not url or not isinstance(url, str):
+        return False
+    host = _URL_HOST.match(url).group(1).lower().rstrip('.')
+    # Check the host and each parent domain against the blacklist
+    while True:
+        if host in BLACKLISTED_WEBSITE_HOSTS:
+            return False
+        dot = host.find('.')
+        if dot == -1:
+            return True
+        host = host[dot + 1:]
+
+
+def _non_empty_str(value) -> bool:
+    return isinstance(value, str) and bool(value)
+
+
+def _has_lat_lon(node) -> bool:
+    return isinstance(node, dict) and 'lat' in node and 'lon' in node
+
+
+def _coordinates(node: Dict) -> Coordinates:
+    return Coordinates(node.get('lat'), node.get('lon'))
+
+
+def _centroid(geometry: Dict) -> Optional[Coordinates]:
+    centroid = geometry['centroid']
+    # A non-dict centroid (WKT string) means no usable coordinates
+    return _coordinates(centroid) if isinstance(centroid, dict) else None
+
+
+def _rubric_name(rubric):
+    if isinstance(rubric, dict):
+        return rubric.get('name') or SKIP
+    if isinstance(rubric, str):
+        return rubric
+    return SKIP
+
+
+def _schedule(schedule: Dict) -> Schedule:
+    is_24_7 = schedule.get('is_24_7', False)
+    if is_24_7:
+        return Schedule('24/7', 'Open 24 hours', is_24_7=True)
+    return Schedule('regular', schedule.get('working_hours', {}), schedule.get('comment', ''), is_24_7)
+
+
+def _attribute(item: Dict) -> Attribute:
+    return Attribute('General', item.get('name', ''), item['tag'] if 'tag' in item else item.get('value', True))
+
+
+def _add_group_attributes(group: Dict, attributes: List[Attribute]):
+    items = group.get('attributes')
+    if isinstance(items, list):
+        group_name = group.get('name', 'General')
+        # One call per group, not per attribute: this is the hottest loop of a profile
+        for item in items:
+            if isinstance(item, dict):
+                attributes.append(Attribute(
+                    group_name, item.get('name', ''), item['tag'] if 'tag' in item else item.get('value', True)
+                ))
+
+
+# contact_groups on catalog API items, then org.contact_groups
+_GROUP_CONTACTS = (
+    ('contact_groups', EACH, 'contacts', EACH),
+    ('org', 'contact_groups', EACH, 'contacts', EACH),
+)
+_CONTACT_VALUE = ('text', 'value')
+_PHONE_CONTACT = {'type': 'phone'}
+_WEBSITE_CONTACT = {'type': ('website', 'url')}
+
+# Business field -> where to find it in a profile, in order of preference.
+# Fields without a Business slot are kept in Business.extra.
+PROFILE_FIELDS = {
+    'name': Field(Source(('name',)), default=''),
+    'address': Field(
+        Source(('address_name',), accept=bool),
+        Source(('address', 'name'), accept=bool),
+        # Build from components: adm_div levels, then address component comments
+        Collect(
+            Source(('adm_div', EACH), where={'type': ADDRESS_DIV_TYPES}, pick=('name',), accept=bool),
+            Source(
+                ('address', 'components', EACH),
+                where=lambda c: isinstance(c, dict) and c.get('type') != 'location',
+                pick=('comment',),
+                accept=bool,
+                unique=True
+            ),
+            join=', '
+        ),
+        default=''
+    ),
+    'coordinates': Field(
+        # point is the most common in search results
+        Source(('point',), where=_has_lat_lon, value=_coordinates),
+        Source(('geometry',), where=lambda g: isinstance(g, dict) and 'centroid' in g, value=_centroid),
+        Source(('geometry',), where=_has_lat_lon, value=_coordinates),
+    ),
+    # Phone and website are often NOT available on search result pages,
+    # only on the full business profile page
+    'phone': Field(
+        Source(('contacts', EACH), where=_PHONE_CONTACT, pick=_CONTACT_VALUE),
+        Source(('phone',), accept=_non_empty_str),
+        *(Source(path, where=_PHONE_CONTACT, pick=_CONTACT_VALUE) for path in _GROUP_CONTACTS),
+    ),
+    'website': Field(
+        Source(('contacts', EACH), where=_WEBSITE_CONTACT, pick=_CONTACT_VALUE, accept=is_valid_website),
+        Source(('website',), accept=is_valid_website),
+        *(Source(path, where=_WEBSITE_CONTACT, pick=_CONTACT_VALUE, accept=is_valid_website) for path in _GROUP_CONTACTS),
+        Source(('links', EACH), where={'type': 'website'}, pick=('url',), accept=is_valid_website),
+    ),
+    'rating': Field(Source(('reviews', 'general_rating'), convert=float)),
+    'review_count': Field(Source(('reviews', 'general_review_count'), convert=int)),
+    'rubric': Field(
+        # Note: field is 'rubrics' (plural) not 'rubric'
+        Collect(Source(('rubrics', EACH), value=_rubric_name)),
+        # Primary attribute groups when there are no rubrics
+        Collect(Source(
+            ('attribute_groups', EACH),
+            where=lambda g: isinstance(g, dict) and bool(g.get('is_primary')),
+            pick=('name',),
+            accept=bool
+        )),
+        default=list
+    ),
+    'schedule': Field(Source(('schedule',), where=lambda s: isinstance(s, dict) and bool(s), value=_schedule)),
+    'attributes': Field(
+        Collect(
+            Source(('attribute_groups', EACH), where=dict, value=_add_group_attributes, expand=True),
+            Source(('attributes', EACH), where=dict, value=_attribute),
+        ),
+        default=list
+    ),
+}
+
+PROFILE_EXTRACTORS = compile_spec(PROFILE_FIELDS)
+
+# Business(...) positional arguments after id, all extracted in one call;
+# a slot without a spec gets None
+_extract_business_slots = compile_record({name: PROFILE_FIELDS.get(name, Field()) for name in Business._fields[1:]})
+_EXTRA_EXTRACTORS = tuple((name, extract) for name, extract in PROFILE_EXTRACTORS.items() if name not in Business._fields)
+
+
+class SearchPageResult:
+    """Everything parsed from one search results page"""
+
+    __slots__ = ('businesses', 'total_items', 'items_per_page', 'total_pages', 'warnings')
+
+    def __init__(
+        self,
+        businesses: Optional[List[Business]] = None,
+        total_items: Optional[int] = None,
+        items_per_page: Optional[int] = None,
+        total_pages: Optional[int] = None,
+        warnings: Optional[List[str]] = None
+    ):
+        """
+        Args:
+            businesses: Businesses on this page
+            total_items: Results for the whole search, if the page reports it
+            items_per_page: Results per page, if known
+            total_pages: Page count for the whole search, if detected
+            warnings: Problems met while fetching or parsing this page
+        """
+        self.businesses = businesses if businesses is not None else []
+        self.total_items = total_items
+        self.items_per_page = items_per_page
+        self.total_pages = total_pages
+        self.warnings = warnings if warnings is not None else []
+
+    def to_dict(self) -> Dict:
+        """Plain dictionary (JSON-serializable)"""
+        data = {slot: getattr(self, slot) for slot in self.__slots__}
+        data['businesses'] = [business.to_dict() for business in self.businesses]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'SearchPageResult':
+        """Rebuild from to_dict() output"""
+        result = cls(**{slot: data.get(slot) for slot in cls.__slots__})
+        result.businesses = [Business.from_dict(business) for business in result.businesses]
+        return result
+
+    def __repr__(self) -> str:
+        return (
+            f"SearchPageResult(businesses={len(self.businesses)}, total_items={self.total_items}, "
+            f"total_pages={self.total_pages}, warnings={len(self.warnings)})"
+        )
+
 
 class TwoGISParser:
     """Extracts and parses business data from 2GIS HTML pages"""
 
     @staticmethod
-    def extract_initial_state(html: str) -> Optional[Dict]:
+    def extract_initial_state(html: str, paths: Optional[Iterable[Tuple[str, ...]]] = None) -> Optional[Dict]:
         """
         Extract initialState JSON from 2GIS HTML page
 
         Args:
             html: Raw HTML content from 2GIS page
+            paths: Only decode these key paths (e.g. SEARCH_STATE_PATHS); the
+                rest of the state is skipped without being built. None decodes everything.
 
         Returns:
             Parsed JSON dictionary or None if extraction fails
         """
         try:
             # Pattern 1: var initialState = JSON.parse('...');
-            pattern1 = r'var initialState = JSON\.parse\(\'(.+?)\'\);'
-            match = re.search(pattern1, html, re.DOTALL)
+            json_string = scan_initial_state(html)
 
-            if match:
-                # Decode escaped JSON string
-                json_string = match.group(1)
-                # Handle Unicode escape sequences (original working code)
-                json_string = json_string.encode().decode('unicode_escape')
-                # Parse JSON
-                data = json.loads(json_string)
+            if json_string is not None:
+                data = decode_subtrees(json_string, paths) if paths else json_backend.loads(json_string)
                 logger.debug("Successfully extracted initialState using pattern 1")
                 return data
 
@@ -45,14 +267,14 @@ class TwoGISParser:
 
             if match:
                 json_string = match.group(1)
-                data = json.loads(json_string)
+                data = json_backend.loads(json_string)
                 logger.debug("Successfully extracted initialState using pattern 2")
                 return data
 
             logger.warning("Could not find initialState in HTML")
             return None
 
-        except json.JSONDecodeError as e:
+        except json_backend.JSONDecodeError as e:
             logger.error(f"JSON parsing error: {e}")
             return None
         except Exception as e:
@@ -60,15 +282,60 @@ class TwoGISParser:
             return None
 
     @staticmethod
-    def extract_businesses(initial_state: Dict) -> List[Dict]:
+    def parse_search_page(html: str) -> SearchPageResult:
+        """
+        Parse a search results page once: businesses and pagination together
+
+        Args:
+            html: Raw HTML content of a search page
+
+        Returns:
+            SearchPageResult (empty with a warning if the page has no initialState)
+        """
+        initial_state = TwoGISParser.extract_initial_state(html, SEARCH_STATE_PATHS)
+        if initial_state is None:
+            return SearchPageResult(warnings=['initialState not found'])
+
+        warnings = []
+        businesses = TwoGISParser.extract_businesses(initial_state, warnings)
+        total_items, items_per_page, total_pages = TwoGISParser._pagination_from_state(initial_state)
+
+        if total_pages is None:
+            total_pages = TwoGISParser._pages_from_links(html)
+            if total_pages is not None:
+                warnings.append('No result totals in initialState; page count taken from pagination links')
+
+        return SearchPageResult(businesses, total_items, items_per_page, total_pages, warnings)
+
+    @staticmethod
+    def parse_catalog_payload(payload: Dict) -> SearchPageResult:
+        """
+        Parse a captured catalog API payload into a SearchPageResult
+
+        Args:
+            payload: Catalog API JSON captured from the network
+
+        Returns:
+            SearchPageResult
+        """
+        businesses = TwoGISParser.extract_businesses_from_catalog(payload)
+        result = payload.get('result') if isinstance(payload, dict) else None
+        total_items = result.get('total') if isinstance(result, dict) else None
+        items_per_page = len(TwoGISParser.catalog_items(payload)) or None
+        total_pages = TwoGISParser.detect_total_pages_from_catalog(payload)
+        return SearchPageResult(businesses, total_items, items_per_page, total_pages)
+
+    @staticmethod
+    def extract_businesses(initial_state: Dict, warnings: Optional[List[str]] = None) -> List[Business]:
         """
         Extract business listings from initialState JSON
 
         Args:
             initial_state: Parsed initialState dictionary
+            warnings: List that receives a message per profile that failed to parse
 
         Returns:
-            List of business dictionaries with extracted data
+            List of Business records (dict-compatible) with extracted data
         """
         businesses = []
 
@@ -88,6 +355,8 @@ class TwoGISParser:
                     businesses.append(business)
                 except Exception as e:
                     logger.warning(f"Error parsing business {firm_id}: {e}")
+                    if warnings is not None:
+                        warnings.append(f"Could not parse business {firm_id}: {e}")
                     continue
 
             return businesses
@@ -97,7 +366,72 @@ class TwoGISParser:
             return businesses
 
     @staticmethod
-    def _parse_business_profile(firm_id: str, profile: Dict) -> Dict:
+    def catalog_items(payload: Dict) -> List[Dict]:
+        """
+        Get item list from a captured catalog API payload
+
+        Args:
+            payload: Catalog API JSON ({"meta": ..., "result": {"items": [...]}})
+
+        Returns:
+            List of item dictionaries (empty if none)
+        """
+        result = payload.get('result') if isinstance(payload, dict) else None
+        items = result.get('items') if isinstance(result, dict) else None
+        return [item for item in items if isinstance(item, dict)] if isinstance(items, list) else []
+
+    @staticmethod
+    def catalog_item_id(item: Dict) -> str:
+        """Firm ID of a catalog item ('70000001020693734_abc...' -> '70000001020693734')"""
+        return str(item.get('id', '')).split('_', 1)[0]
+
+    @staticmethod
+    def extract_businesses_from_catalog(payload: Dict) -> List[Business]:
+        """
+        Extract business listings from a captured catalog API payload
+
+        Args:
+            payload: Catalog API JSON captured from the network
+
+        Returns:
+            List of Business records (same shape as extract_businesses)
+        """
+        businesses = []
+
+        for item in TwoGISParser.catalog_items(payload):
+            firm_id = TwoGISParser.catalog_item_id(item)
+            try:
+                businesses.append(TwoGISParser._parse_business_profile(firm_id, item))
+            except Exception as e:
+                logger.warning(f"Error parsing catalog item {firm_id}: {e}")
+
+        logger.info(f"Extracted {len(businesses)} businesses from catalog payload")
+        return businesses
+
+    @staticmethod
+    def detect_total_pages_from_catalog(payload: Dict) -> Optional[int]:
+        """
+        Detect total page count from a captured catalog API payload
+
+        Args:
+            payload: Catalog API JSON of the first search page
+
+        Returns:
+            Total page count or None if not available
+        """
+        result = payload.get('result') if isinstance(payload, dict) else None
+        total_items = result.get('total') if isinstance(result, dict) else None
+        items_per_page = len(TwoGISParser.catalog_items(payload))
+
+        if total_items and items_per_page:
+            total_pages = (total_items + items_per_page - 1) // items_per_page
+            logger.info(f"Detected {total_pages} total pages ({total_items} items)")
+            return total_pages
+
+        return None
+
+    @staticmethod
+    def _parse_business_profile(firm_id: str, profile: Dict) -> Business:
         """
         Parse individual business profile into structured data
 
@@ -106,355 +440,132 @@ class TwoGISParser:
             profile: Profile dictionary from initialState
 
         Returns:
-            Structured business data dictionary
+            Business record
         """
         # Extract the actual data - profile has {data: {...}, meta: {...}}
         profile_data = profile.get('data', profile)
 
-        # Fix double-encoded UTF-8 text
-        def fix_encoding(text):
-            if not text or not isinstance(text, str):
-                return text
-            try:
-                # Text is UTF-8 bytes incorrectly decoded as latin-1, re-encode and decode properly
-                return text.encode('latin-1').decode('utf-8')
-            except (UnicodeDecodeError, UnicodeEncodeError, AttributeError):
-                return text
-
-        business = {
-            'id': firm_id,
-            'name': fix_encoding(profile_data.get('name', '')),
-            'address': fix_encoding(TwoGISParser._extract_address(profile_data)),
-            'coordinates': TwoGISParser._extract_coordinates(profile_data),
-            'phone': TwoGISParser._extract_phone(profile_data),
-            'website': TwoGISParser._extract_website(profile_data),
-            'rating': TwoGISParser._extract_rating(profile_data),
-            'review_count': TwoGISParser._extract_review_count(profile_data),
-            'rubric': fix_encoding(TwoGISParser._extract_rubric(profile_data)),
-            'schedule': TwoGISParser._extract_schedule(profile_data),
-            'attributes': TwoGISParser._extract_attributes(profile_data),
-        }
-
+        business = Business(firm_id, *_extract_business_slots(profile_data))
+        for name, extract in _EXTRA_EXTRACTORS:
+            business[name] = extract(profile_data)
         return business
 
     @staticmethod
     def _extract_address(profile: Dict) -> str:
         """Extract formatted address"""
-        # Try multiple address fields
-        address = profile.get('address_name', '')
-        if not address:
-            address = profile.get('address', {}).get('name', '')
-        if not address:
-            # Build from components in adm_div
-            adm_div = profile.get('adm_div', [])
-            components = []
-            for div in adm_div:
-                if isinstance(div, dict):
-                    name = div.get('name')
-                    div_type = div.get('type')
-                    # Skip country, include city and more specific
-                    if name and div_type in ['city', 'district', 'division', 'district_area']:
-                        components.append(name)
-
-            # Also try address.components
-            addr_obj = profile.get('address', {})
-            if isinstance(addr_obj, dict):
-                addr_components = addr_obj.get('components', [])
-                for comp in addr_components:
-                    if isinstance(comp, dict) and comp.get('type') != 'location':
-                        comment = comp.get('comment')
-                        if comment and comment not in components:
-                            components.append(comment)
-
-            address = ', '.join(components) if components else ''
-
-        return address
+        return PROFILE_EXTRACTORS['address'](profile)
 
     @staticmethod
-    def _extract_coordinates(profile: Dict) -> Optional[Dict[str, float]]:
+    def _extract_coordinates(profile: Dict) -> Optional[Coordinates]:
         """Extract latitude and longitude"""
-        # Check point field first (most common in search results)
-        point = profile.get('point', {})
-        if isinstance(point, dict) and 'lat' in point and 'lon' in point:
-            return {
-                'lat': point.get('lat'),
-                'lon': point.get('lon')
-            }
-
-        # Fallback to geometry field
-        geometry = profile.get('geometry', {})
-        if isinstance(geometry, dict):
-            # Handle different geometry formats
-            if 'centroid' in geometry:
-                centroid = geometry['centroid']
-                if isinstance(centroid, dict):
-                    return {
-                        'lat': centroid.get('lat'),
-                        'lon': centroid.get('lon')
-                    }
-            elif 'lat' in geometry and 'lon' in geometry:
-                return {
-                    'lat': geometry.get('lat'),
-                    'lon': geometry.get('lon')
-                }
-
-        return None
+        return PROFILE_EXTRACTORS['coordinates'](profile)
 
     @staticmethod
     def _extract_phone(profile: Dict) -> Optional[str]:
         """Extract primary phone number"""
-        # Note: Phone data is often NOT available on search result pages
-        # It's typically only available on the full business profile page
-
-        # Check contacts array
-        contacts = profile.get('contacts', [])
-        if isinstance(contacts, list):
-            for contact in contacts:
-                if isinstance(contact, dict) and contact.get('type') == 'phone':
-                    return contact.get('text', contact.get('value'))
-
-        # Check direct phone field
-        phone = profile.get('phone')
-        if phone and isinstance(phone, str):
-            return phone
-
-        # Check org.contact_groups
-        org = profile.get('org', {})
-        if isinstance(org, dict):
-            contact_groups = org.get('contact_groups', [])
-            if isinstance(contact_groups, list):
-                for group in contact_groups:
-                    if isinstance(group, dict):
-                        group_contacts = group.get('contacts', [])
-                        if isinstance(group_contacts, list):
-                            for contact in group_contacts:
-                                if isinstance(contact, dict) and contact.get('type') == 'phone':
-                                    return contact.get('text', contact.get('value'))
-
-        return None
+        return PROFILE_EXTRACTORS['phone'](profile)
 
     @staticmethod
     def _extract_website(profile: Dict) -> Optional[str]:
         """Extract website URL"""
-        # Note: Website data is often NOT available on search result pages
-        # It's typically only available on the full business profile page
-
-        # Blacklist of 2GIS partner/affiliate sites that aren't real business websites
-        BLACKLISTED_DOMAINS = [
-            'otello.ru',
-            '2gis.ru',
-            '2gis.ae',
-            '2gis.kz',
-            '2gis.kg',
-            '2gis.cz',
-            '2gis.cl',
-            '2gis.it',
-        ]
-
-        def is_valid_website(url: str) -> bool:
-            """Check if URL is a real business website (not 2GIS partner site)"""
-            if not url:
-                return False
-            url_lower = url.lower()
-            # Skip blacklisted domains
-            for domain in BLACKLISTED_DOMAINS:
-                if domain in url_lower:
-                    return False
-            return True
-
-        # Check contacts array
-        contacts = profile.get('contacts', [])
-        if isinstance(contacts, list):
-            for contact in contacts:
-                if isinstance(contact, dict) and contact.get('type') in ['website', 'url']:
-                    url = contact.get('text', contact.get('value'))
-                    if is_valid_website(url):
-                        return url
-
-        # Check direct website field
-        website = profile.get('website')
-        if website and isinstance(website, str) and is_valid_website(website):
-            return website
-
-        # Check org.contact_groups
-        org = profile.get('org', {})
-        if isinstance(org, dict):
-            contact_groups = org.get('contact_groups', [])
-            if isinstance(contact_groups, list):
-                for group in contact_groups:
-                    if isinstance(group, dict):
-                        group_contacts = group.get('contacts', [])
-                        if isinstance(group_contacts, list):
-                            for contact in group_contacts:
-                                if isinstance(contact, dict) and contact.get('type') in ['website', 'url']:
-                                    url = contact.get('text', contact.get('value'))
-                                    if is_valid_website(url):
-                                        return url
-
-        # Check links array
-        links = profile.get('links', [])
-        if isinstance(links, list):
-            for link in links:
-                if isinstance(link, dict) and link.get('type') == 'website':
-                    url = link.get('url')
-                    if is_valid_website(url):
-                        return url
-
-        return None
+        return PROFILE_EXTRACTORS['website'](profile)
 
     @staticmethod
     def _extract_rating(profile: Dict) -> Optional[float]:
         """Extract rating score"""
-        reviews = profile.get('reviews', {})
-        rating = reviews.get('general_rating')
-
-        if rating is not None:
-            try:
-                return float(rating)
-            except (ValueError, TypeError):
-                return None
-
-        return None
+        return PROFILE_EXTRACTORS['rating'](profile)
 
     @staticmethod
     def _extract_review_count(profile: Dict) -> Optional[int]:
         """Extract review count"""
-        reviews = profile.get('reviews', {})
-        count = reviews.get('general_review_count')
-
-        if count is not None:
-            try:
-                return int(count)
-            except (ValueError, TypeError):
-                return None
-
-        return None
+        return PROFILE_EXTRACTORS['review_count'](profile)
 
     @staticmethod
     def _extract_rubric(profile: Dict) -> List[str]:
         """Extract business categories/rubrics"""
-        rubrics = []
-
-        # Note: field is 'rubrics' (plural) not 'rubric'
-        rubric_data = profile.get('rubrics', [])
-        for rubric in rubric_data:
-            if isinstance(rubric, dict):
-                name = rubric.get('name')
-                if name:
-                    rubrics.append(name)
-            elif isinstance(rubric, str):
-                rubrics.append(rubric)
-
-        # Also check attribute_groups for rubric info
-        if not rubrics:
-            attr_groups = profile.get('attribute_groups', [])
-            for group in attr_groups:
-                if isinstance(group, dict) and group.get('is_primary'):
-                    name = group.get('name')
-                    if name:
-                        rubrics.append(name)
-
-        return rubrics
+        return PROFILE_EXTRACTORS['rubric'](profile)
 
     @staticmethod
-    def _extract_schedule(profile: Dict) -> Optional[Dict]:
+    def _extract_schedule(profile: Dict) -> Optional[Schedule]:
         """Extract working hours schedule"""
-        schedule = profile.get('schedule', {})
-
-        if not schedule:
-            return None
-
-        # Check if 24/7
-        is_24_7 = schedule.get('is_24_7', False)
-
-        if is_24_7:
-            return {'type': '24/7', 'hours': 'Open 24 hours'}
-
-        # Extract working hours by day
-        working_hours = {}
-        comments = schedule.get('comment', '')
-
-        # Try to get structured schedule
-        if 'working_hours' in schedule:
-            working_hours = schedule['working_hours']
-
-        return {
-            'type': 'regular',
-            'hours': working_hours,
-            'comments': comments,
-            'is_24_7': is_24_7
-        }
+        return PROFILE_EXTRACTORS['schedule'](profile)
 
     @staticmethod
-    def _extract_attributes(profile: Dict) -> List[Dict[str, Any]]:
+    def _extract_attributes(profile: Dict) -> List[Attribute]:
         """Extract business attributes (WiFi, parking, delivery, etc.)"""
-        attributes = []
-
-        # Get attribute groups
-        attribute_groups = profile.get('attribute_groups', [])
-
-        for group in attribute_groups:
-            group_name = group.get('name', 'General')
-            items = group.get('attributes', [])
-
-            for item in items:
-                if isinstance(item, dict):
-                    attributes.append({
-                        'category': group_name,
-                        'name': item.get('name', ''),
-                        'value': item.get('tag', item.get('value', True))
-                    })
-
-        # Also check direct attributes field
-        direct_attrs = profile.get('attributes', [])
-        for attr in direct_attrs:
-            if isinstance(attr, dict):
-                attributes.append({
-                    'category': 'General',
-                    'name': attr.get('name', ''),
-                    'value': attr.get('tag', attr.get('value', True))
-                })
-
-        return attributes
+        return PROFILE_EXTRACTORS['attributes'](profile)
 
     @staticmethod
-    def detect_total_pages(html: str) -> Optional[int]:
+    def detect_total_pages(html: str, initial_state: Optional[Dict] = None) -> Optional[int]:
         """
         Detect total number of pages from pagination
 
         Args:
             html: Raw HTML content
+            initial_state: Already extracted initialState (saves parsing it again)
 
         Returns:
             Total page count or None if not detected
         """
         try:
             # Look for pagination data in initialState
-            initial_state = TwoGISParser.extract_initial_state(html)
-            if not initial_state:
+            if initial_state is None:
+                initial_state = TwoGISParser.extract_initial_state(html, SEARCH_STATE_PATHS)
+            if initial_state is None:
                 return None
 
-            # Check search context for total results
-            context = initial_state.get('data', {}).get('context', {})
-            total_items = context.get('total_items')
-            items_per_page = context.get('items_per_page', 20)
-
-            if total_items and items_per_page:
-                total_pages = (total_items + items_per_page - 1) // items_per_page
-                logger.info(f"Detected {total_pages} total pages ({total_items} items)")
+            total_pages = TwoGISParser._pagination_from_state(initial_state)[2]
+            if total_pages is not None:
                 return total_pages
 
             # Fallback: parse pagination HTML
-            pagination_pattern = r'/page/(\d+)'
-            page_numbers = re.findall(pagination_pattern, html)
-
-            if page_numbers:
-                max_page = max(int(p) for p in page_numbers)
-                logger.info(f"Detected {max_page} pages from pagination links")
-                return max_page
-
-            return None
+            return TwoGISParser._pages_from_links(html)
 
         except Exception as e:
             logger.warning(f"Error detecting total pages: {e}")
             return None
+
+    @staticmethod
+    def _pagination_from_state(initial_state: Dict) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """
+        Read result totals from initialState
+
+        Checks data.context first, then the search results block
+        (data.search.profile.<search id>.data) that current pages carry.
+
+        Returns:
+            Tuple of (total_items, items_per_page, total_pages), None where unknown
+        """
+        data = initial_state.get('data') or {}
+
+        # Check search context for total results
+        context = data.get('context') or {}
+        total_items = context.get('total_items')
+        items_per_page = context.get('items_per_page', 20)
+        if total_items and items_per_page:
+            total_pages = (total_items + items_per_page - 1) // items_per_page
+            logger.info(f"Detected {total_pages} total pages ({total_items} items)")
+            return total_items, items_per_page, total_pages
+
+        searches = (data.get('search') or {}).get('profile') or {}
+        for search in searches.values():
+            search_data = search.get('data') if isinstance(search, dict) else None
+            if not isinstance(search_data, dict) or not search_data.get('total'):
+                continue
+            total_items = search_data['total']
+            total_pages = search_data.get('pages')
+            items_per_page = -(-total_items // total_pages) if total_pages else None
+            logger.info(f"Detected {total_pages} total pages ({total_items} items)")
+            return total_items, items_per_page, total_pages
+
+        return None, None, None
+
+    @staticmethod
+    def _pages_from_links(html: str) -> Optional[int]:
+        """Highest /page/N link in the HTML, or None"""
+        page_numbers = re.findall(r'/page/(\d+)', html)
+        if not page_numbers:
+            return None
+        max_page = max(int(p) for p in page_numbers)
+        logger.info(f"Detected {max_page} pages from pagination links")
+        return max_page
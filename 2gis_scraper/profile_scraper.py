@@ -4,33 +4,71 @@ Profile page scraper for enriching business data with contact information
 
 import asyncio
 import logging
-import re
-import json
 import random
+import time
 from typing import List, Dict, Optional
+from urllib.parse import urlparse
 from playwright.async_api import async_playwright, Browser, Page
 
 from parser import TwoGISParser
+from cache_manager import CacheManager
+from link_scanner import extract_link_contacts
+from enrichment_planner import EnrichmentPlan, plan_enrichment
+from readiness import ReadinessMetrics, wait_until_ready
+from network_capture import CatalogResponseMatcher, capture_catalog
+from resource_blocker import ResourceBlocker
+from rate_limiter import get_rate_limiter
+from adaptive_pacer import get_pacer
 import config
+import json_backend
 
 logger = logging.getLogger(__name__)
 
+# initialState branches that can hold a profile page's firm
+PROFILE_STATE_PATHS = (('data', 'entity', 'profile'), ('data', 'profile'))
+
 
 class ProfileEnricher:
     """Enriches business data by visiting individual profile pages"""
 
-    def __init__(self, headless: bool = True, delay: float = None):
+    def __init__(
+        self,
+        headless: bool = True,
+        delay: float = None,
+        concurrency: int = None,
+        capture_network: bool = None,
+        cache_enabled: bool = True
+    ):
         """
         Initialize profile enricher
 
         Args:
             headless: Run browser in headless mode
             delay: Delay between requests (default from config)
+            concurrency: Number of worker pages enriching in parallel (default from config)
+            capture_network: Read contacts from the catalog API response instead
+                of the rendered page (default from config)
+            cache_enabled: Reuse contact info fetched within CACHE_TTL_PROFILE
         """
         self.headless = headless
         self.delay = delay if delay is not None else config.DEFAULT_DELAY
+        self.concurrency = max(1, concurrency or config.ENRICH_CONCURRENCY)
+        self.capture_network = capture_network if capture_network is not None else config.NETWORK_CAPTURE
         self.parser = TwoGISParser()
         self.browser: Optional[Browser] = None
+        self._playwright = None
+        self._rate_limiter = get_rate_limiter()
+        self.pacer = get_pacer()
+        self.readiness_metrics = ReadinessMetrics()
+        self.resource_blocker = ResourceBlocker() if config.BLOCK_RESOURCES else None
+        # Decisions of the most recent enrich_businesses() call
+        self.last_plan: Optional[EnrichmentPlan] = None
+        # Contact info per firm ID - phones/websites rarely change
+        self.contact_cache = CacheManager(
+            cache_dir=config.PROFILE_CACHE_DIR,
+            enabled=cache_enabled,
+            ttl=config.CACHE_TTL_PROFILE
+        )
 
     async def __aenter__(self):
         """Async context manager entry"""
@@ -43,10 +81,10 @@ class ProfileEnricher:
 
     async def start(self):
         """Start browser"""
-        playwright = await async_playwright().start()
+        self._playwright = await async_playwright().start()
 
         # Launch with anti-detection settings
-        self.browser = await playwright.chromium.launch(
+        self.browser = await self._playwright.chromium.launch(
             headless=self.headless,
             args=[
                 '--disable-blink-features=AutomationControlled',
@@ -58,10 +96,15 @@ class ProfileEnricher:
         logger.info("Browser started")
 
     async def close(self):
-        """Close browser"""
+        """Close browser and persist pacing state"""
+        if self.pacer is not None:
+            self.pacer.save()
         if self.browser:
             await self.browser.close()
             logger.info("Browser closed")
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
 
     def _build_profile_url(self, city: str, business_id: str, tld: str = None) -> str:
         """
@@ -82,6 +125,18 @@ class ProfileEnricher:
         city_encoded = city.lower().replace('_', ' ')
         return f'https://2gis.{tld}/{city_encoded}/firm/{business_id}'
 
+    async def _throttle(self, url: str):
+        """Wait for the shared rate limit of the URL's host (±25% jitter to look more human)"""
+        host = urlparse(url).hostname
+        delay = self.pacer.get_delay(host, self.delay) if self.pacer else self.delay
+        await self._rate_limiter.acquire(host, delay, jitter=delay * 0.25)
+
+    def _observe(self, url: str, status: Optional[int], latency: float, html: Optional[str] = None) -> Optional[str]:
+        """Report a response to the adaptive pacer; returns the backoff reason, if any"""
+        if self.pacer is None:
+            return None
+        return self.pacer.observe(urlparse(url).hostname, self.delay, status, latency, html)
+
     async def _fetch_profile_page(self, page: Page, url: str, max_retries: int = 2) -> Optional[str]:
         """
         Fetch individual profile page with retry logic
@@ -102,21 +157,34 @@ class ProfileEnricher:
                     logger.info(f"Retry {attempt}/{max_retries} for {url} after {wait_time}s...")
                     await asyncio.sleep(wait_time)
 
+                # Shared with all workers and the search scraper (per 2GIS host)
+                await self._throttle(url)
+
                 logger.debug(f"Fetching profile: {url}")
 
                 # Navigate to page with longer timeout (60 seconds)
+                start = time.monotonic()
                 response = await page.goto(url, wait_until='load', timeout=60000)
+                latency = time.monotonic() - start
 
                 if not response or response.status != 200:
+                    self._observe(url, response.status if response else None, latency)
                     logger.warning(f"Failed to load profile: {url} (status: {response.status if response else 'None'})")
                     continue  # Retry
 
-                # Wait for JavaScript to execute and render the initialState
-                # The page uses client-side rendering, so we need to wait
-                await page.wait_for_timeout(5000)  # Give it 5 seconds to render
+                # The page uses client-side rendering, so wait until the
+                # profile data or contact block is there (capped)
+                await wait_until_ready(
+                    page,
+                    config.READINESS_MAX_WAIT_MS_PROFILE,
+                    self.readiness_metrics
+                )
 
                 # Get HTML after JavaScript execution
                 html = await page.content()
+                if self._observe(url, response.status, latency, html) == 'captcha':
+                    logger.warning(f"Block page for {url} (attempt {attempt + 1}/{max_retries + 1})")
+                    continue
                 logger.debug(f"Fetched profile: {url} ({len(html)} bytes)")
 
                 return html
@@ -133,6 +201,42 @@ class ProfileEnricher:
 
         return None
 
+    async def _capture_contact_info(self, page: Page, url: str, business_id: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Get contact info from the profile's catalog API response
+
+        Args:
+            page: Playwright page instance
+            url: Profile URL
+            business_id: Business ID (used to pick the right API response)
+
+        Returns:
+            Dictionary with phone, website, profile_found and the raw catalog
+            item (payload), or None if no captured item is this firm's
+        """
+        await self._throttle(url)
+
+        matcher = CatalogResponseMatcher(url_contains=business_id)
+        start = time.monotonic()
+        payload = await capture_catalog(page, url, matcher)
+        if not payload:
+            return None
+        self._observe(url, 200, time.monotonic() - start)
+
+        # Only this firm's item: another firm's contacts must not be cached under its ID
+        items = self.parser.catalog_items(payload)
+        item = next((i for i in items if self.parser.catalog_item_id(i) == business_id), None)
+        if item is None:
+            logger.debug(f"No catalog item for business {business_id} in the captured response")
+            return None
+
+        return {
+            'phone': self.parser._extract_phone(item),
+            'website': self.parser._extract_website(item),
+            'profile_found': True,
+            'payload': item
+        }
+
     def _extract_contact_info(self, html: str) -> Dict[str, Optional[str]]:
         """
         Extract contact information from profile page HTML
@@ -141,20 +245,21 @@ class ProfileEnricher:
             html: HTML content of profile page
 
         Returns:
-            Dictionary with phone and website
+            Dictionary with phone, website and profile_found (the page had
+            the firm's profile data and extraction ran to the end, so missing
+            contacts really are missing)
         """
-        from bs4 import BeautifulSoup
-
         contact_info = {
             'phone': None,
-            'website': None
+            'website': None,
+            'profile_found': False
         }
 
         try:
             # Method 1: Try JSON extraction first
-            initial_state = self.parser.extract_initial_state(html)
+            initial_state = self.parser.extract_initial_state(html, PROFILE_STATE_PATHS)
 
-            if initial_state:
+            if initial_state is not None:
                 logger.debug("Found initial state JSON in HTML")
                 # Navigate to profile data
                 profiles = initial_state.get('data', {}).get('entity', {}).get('profile', {})
@@ -164,6 +269,7 @@ class ProfileEnricher:
                     profile_data = initial_state.get('data', {}).get('profile', {})
                     if profile_data:
                         logger.debug("Using alternative profile path")
+                        contact_info['profile_found'] = True
                         contact_info['phone'] = self.parser._extract_phone(profile_data)
                         contact_info['website'] = self.parser._extract_website(profile_data)
                         if contact_info['phone'] or contact_info['website']:
@@ -176,6 +282,7 @@ class ProfileEnricher:
                     profile_data = profile.get('data', profile)
 
                     logger.debug(f"Extracting from profile {profile_id}")
+                    contact_info['profile_found'] = True
                     contact_info['phone'] = self.parser._extract_phone(profile_data)
                     contact_info['website'] = self.parser._extract_website(profile_data)
                     if contact_info['phone'] or contact_info['website']:
@@ -183,46 +290,44 @@ class ProfileEnricher:
             else:
                 logger.debug("No initial state JSON found, will try HTML parsing")
 
-            # Method 2: Parse rendered HTML directly (fallback)
-            soup = BeautifulSoup(html, 'html.parser')
-
-            # Find phone numbers in links or text
-            phone_patterns = [
-                r'\+?\d[\d\s\-\(\)]{7,}',  # Phone number pattern
-            ]
-
-            # Look for phone links
-            phone_links = soup.find_all('a', href=re.compile(r'tel:'))
-            if phone_links:
-                phone = phone_links[0].get('href', '').replace('tel:', '').strip()
-                if phone:
-                    contact_info['phone'] = phone
-                    logger.debug(f"Found phone via tel: link: {phone}")
-
-            # Look for website links
-            # Find links that are external (not 2gis.* or partner sites)
-            SKIP_DOMAINS = ['2gis.', 'javascript:', '#', 'tel:', 'mailto:', 'otello.ru']
-
-            all_links = soup.find_all('a', href=True)
-            for link in all_links:
-                href = link.get('href', '')
-                # Skip internal 2gis links and partner sites
-                if href and not any(x in href for x in SKIP_DOMAINS):
-                    if href.startswith('http'):
-                        contact_info['website'] = href
-                        logger.debug(f"Found website link: {href}")
-                        break
+            # Method 2: Links in the rendered HTML (fallback)
+            contact_info.update(extract_link_contacts(html))
+            if contact_info['phone']:
+                logger.debug(f"Found phone via tel: link: {contact_info['phone']}")
+            if contact_info['website']:
+                logger.debug(f"Found website link: {contact_info['website']}")
 
         except Exception as e:
             logger.error(f"Error extracting contact info: {e}")
+            contact_info['profile_found'] = False
 
         return contact_info
 
+    async def _open_page(self) -> Page:
+        """
+        Open a page in its own browser context with proper headers
+
+        Returns:
+            Playwright page (close it with page.context.close())
+        """
+        context = await self.browser.new_context(
+            user_agent=random.choice(config.USER_AGENTS) if hasattr(config, 'USER_AGENTS') else 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
+            viewport={'width': 1920, 'height': 1080},
+            extra_http_headers={
+                'Accept-Language': 'en-US,en;q=0.9',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            }
+        )
+        if self.resource_blocker is not None:
+            await self.resource_blocker.apply(context)
+        return await context.new_page()
+
     async def enrich_business(
         self,
         business: Dict,
         city: str,
-        tld: str = None
+        tld: str = None,
+        page: Optional[Page] = None
     ) -> Dict:
         """
         Enrich single business with contact information
@@ -231,6 +336,7 @@ class ProfileEnricher:
             business: Business dictionary from search results
             city: City name
             tld: TLD override
+            page: Reusable worker page (a temporary page is opened if omitted)
 
         Returns:
             Business dictionary with updated phone/website
@@ -241,56 +347,136 @@ class ProfileEnricher:
             logger.warning("Business has no ID, cannot enrich")
             return business
 
+        cached = self._get_cached_contacts(business_id)
+        if cached is not None:
+            return self._apply_contact_info(business, cached)
+
         # Build profile URL
         url = self._build_profile_url(city, business_id, tld)
 
-        # Create new page for this request with proper headers
-        page = await self.browser.new_page(
-            user_agent=random.choice(config.USER_AGENTS) if hasattr(config, 'USER_AGENTS') else 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
-            viewport={'width': 1920, 'height': 1080}
-        )
-
-        # Set extra headers
-        await page.set_extra_http_headers({
-            'Accept-Language': 'en-US,en;q=0.9',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        })
+        owns_page = page is None
+        if owns_page:
+            page = await self._open_page()
 
         try:
-            # Fetch profile page
-            html = await self._fetch_profile_page(page, url)
+            contact_info = None
+            if self.capture_network:
+                contact_info = await self._capture_contact_info(page, url, business_id)
 
-            if not html:
-                logger.warning(f"Failed to fetch profile for business {business_id}")
-                return business
+            if contact_info is None:
+                # Fetch profile page
+                html = await self._fetch_profile_page(page, url)
 
-            # Extract contact info
-            contact_info = self._extract_contact_info(html)
+                if not html:
+                    logger.warning(f"Failed to fetch profile for business {business_id}")
+                    return business
 
-            # Update business dictionary
-            business_name = business.get('name', business_id)
+                # Extract contact info
+                contact_info = self._extract_contact_info(html)
 
-            if contact_info['phone']:
-                business['phone'] = contact_info['phone']
-                logger.info(f"✓ {business_name}: Found phone {contact_info['phone']}")
+            if contact_info.get('phone') or contact_info.get('website') or contact_info.get('profile_found'):
+                self._cache_contacts(business_id, contact_info)
             else:
-                logger.info(f"✗ {business_name}: No phone found")
+                # A failed or unrecognised page is not a "no contacts" result
+                logger.warning(f"No profile data for business {business_id}, not caching")
 
-            if contact_info['website']:
-                business['website'] = contact_info['website']
-                logger.info(f"✓ {business_name}: Found website {contact_info['website']}")
-            else:
-                logger.info(f"✗ {business_name}: No website found")
+        finally:
+            if owns_page:
+                await page.context.close()
 
-            # Rate limiting with random jitter (±25% to look more human)
-            jitter = random.uniform(0.75, 1.25)
-            await asyncio.sleep(self.delay * jitter)
+        return self._apply_contact_info(business, contact_info)
 
-        finally:
-            await page.close()
+    def _get_cached_contacts(self, business_id: str) -> Optional[Dict]:
+        """Get fresh cached contact info for a firm, or None"""
+        cached = self.contact_cache.get(f'firm:{business_id}')
+        if not cached:
+            return None
+        try:
+            entry = json_backend.loads(cached)
+        except json_backend.JSONDecodeError:
+            return None
+        # Entries without contacts only count when they came from a real profile
+        # (older caches stored failed extractions too)
+        if not entry.get('phone') and not entry.get('website') and not entry.get('profile_found'):
+            return None
+        return entry
+
+    def _cache_contacts(self, business_id: str, contact_info: Dict):
+        """Cache contact info for a firm (also when the profile has none - that's a result too)"""
+        entry = {
+            'phone': contact_info.get('phone'),
+            'website': contact_info.get('website'),
+            'profile_found': bool(contact_info.get('profile_found'))
+        }
+        if config.PROFILE_CACHE_STORE_PAYLOAD and contact_info.get('payload'):
+            entry['payload'] = contact_info['payload']
+        self.contact_cache.set(f'firm:{business_id}', json_backend.dumps(entry))
+
+    @staticmethod
+    def _apply_contact_info(business: Dict, contact_info: Dict) -> Dict:
+        """Copy found phone/website into the business dictionary"""
+        business_name = business.get('name', business.get('id'))
+
+        if contact_info.get('phone'):
+            business['phone'] = contact_info['phone']
+            logger.info(f"✓ {business_name}: Found phone {contact_info['phone']}")
+        else:
+            logger.info(f"✗ {business_name}: No phone found")
+
+        if contact_info.get('website'):
+            business['website'] = contact_info['website']
+            logger.info(f"✓ {business_name}: Found website {contact_info['website']}")
+        else:
+            logger.info(f"✗ {business_name}: No website found")
 
         return business
 
+    async def _enrich_worker(
+        self,
+        worker_id: int,
+        queue: asyncio.Queue,
+        results: List[Optional[Dict]],
+        city: str,
+        tld: Optional[str]
+    ):
+        """
+        Enrich businesses from the shared queue using one reusable page
+
+        Args:
+            worker_id: Worker number (for logging)
+            queue: Queue of (index, business) tuples
+            results: Output list, filled in at each business's original index
+            city: City name
+            tld: TLD override
+        """
+        page = await self._open_page()
+        total = len(results)
+
+        try:
+            while True:
+                try:
+                    index, business = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+
+                logger.info(f"[{index+1}/{total}] Processing: {business.get('name', business.get('id'))}")
+
+                try:
+                    results[index] = await self.enrich_business(business, city, tld, page=page)
+                except Exception as e:
+                    # Keep the business as-is and give the worker a fresh page
+                    logger.error(f"Worker {worker_id}: error enriching {business.get('id')}: {e}")
+                    results[index] = business
+                    try:
+                        await page.context.close()
+                    except Exception:
+                        pass
+                    page = await self._open_page()
+                finally:
+                    queue.task_done()
+        finally:
+            await page.context.close()
+
     async def enrich_businesses(
         self,
         businesses: List[Dict],
@@ -300,6 +486,12 @@ class ProfileEnricher:
         """
         Enrich multiple businesses with contact information
 
+        Only businesses the enrichment planner flags (a contact field
+        missing and no fresh cache entry) get a profile visit; the plan is
+        kept in self.last_plan. They are processed by up to `concurrency`
+        worker pages while the shared rate limiter keeps the overall request
+        rate at one request per `delay` seconds. Results keep the input order.
+
         Args:
             businesses: List of business dictionaries
             city: City name
@@ -308,14 +500,33 @@ class ProfileEnricher:
         Returns:
             List of enriched businesses
         """
-        logger.info(f"Starting enrichment for {len(businesses)} businesses...")
+        results: List[Optional[Dict]] = [None] * len(businesses)
+
+        # Complete search data and firms seen within the profile TTL need no page visit
+        plan = plan_enrichment(businesses, self._get_cached_contacts)
+        self.last_plan = plan
+        for index, cached in plan.cached:
+            results[index] = self._apply_contact_info(businesses[index], cached)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for index in plan.visit:
+            queue.put_nowait((index, businesses[index]))
+
+        workers = min(self.concurrency, queue.qsize())
+        logger.info(f"Enrichment plan for {plan.summary()}")
+        logger.info(f"Starting enrichment with {workers} workers...")
+
+        outcomes = await asyncio.gather(*(
+            self._enrich_worker(i, queue, results, city, tld)
+            for i in range(workers)
+        ), return_exceptions=True)
 
-        enriched = []
-        for i, business in enumerate(businesses):
-            logger.info(f"[{i+1}/{len(businesses)}] Processing: {business.get('name', business.get('id'))}")
+        for worker_id, outcome in enumerate(outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"Worker {worker_id} stopped: {outcome}")
 
-            enriched_business = await self.enrich_business(business, city, tld)
-            enriched.append(enriched_business)
+        # Anything a worker could not pick up (e.g. page creation failed) stays unchanged
+        enriched = [r if r is not None else b for r, b in zip(results, businesses)]
 
         # Count results
         with_phone = sum(1 for b in enriched if b.get('phone'))
@@ -323,6 +534,12 @@ class ProfileEnricher:
         without_website = sum(1 for b in enriched if not b.get('website'))
 
         logger.info(f"Enrichment complete: {with_phone} with phone, {with_website} with website, {without_website} without website")
+        logger.info(f"Profile visits saved: {plan.visits_saved}/{plan.total}")
+        logger.info(f"Page readiness: {self.readiness_metrics.summary()}")
+        if self.resource_blocker is not None:
+            logger.info(f"Resource blocking: {self.resource_blocker.get_stats()}")
+        if self.pacer is not None:
+            logger.info(f"Request pacing: {self.pacer.get_stats()}")
 
         return enriched
 
@@ -331,7 +548,9 @@ async def enrich_businesses_async(
     businesses: List[Dict],
     city: str,
     headless: bool = True,
-    delay: float = None
+    delay: float = None,
+    concurrency: int = None,
+    cache_enabled: bool = True
 ) -> List[Dict]:
     """
     Convenience function to enrich businesses
@@ -341,11 +560,18 @@ async def enrich_businesses_async(
         city: City name
         headless: Run browser in headless mode
         delay: Delay between requests
+        concurrency: Number of parallel worker pages
+        cache_enabled: Reuse recently fetched contact info
 
     Returns:
         List of enriched businesses
     """
-    async with ProfileEnricher(headless=headless, delay=delay) as enricher:
+    async with ProfileEnricher(
+        headless=headless,
+        delay=delay,
+        concurrency=concurrency,
+        cache_enabled=cache_enabled
+    ) as enricher:
         return await enricher.enrich_businesses(businesses, city)
 
 
@@ -353,7 +579,9 @@ def enrich_businesses(
     businesses: List[Dict],
     city: str,
     headless: bool = True,
-    delay: float = None
+    delay: float = None,
+    concurrency: int = None,
+    cache_enabled: bool = True
 ) -> List[Dict]:
     """
     Synchronous wrapper for enriching businesses
@@ -363,8 +591,10 @@ def enrich_businesses(
         city: City name
         headless: Run browser in headless mode
         delay: Delay between requests
+        concurrency: Number of parallel worker pages
+        cache_enabled: Reuse recently fetched contact info
 
     Returns:
         List of enriched businesses
     """
-    return asyncio.run(enrich_businesses_async(businesses, city, headless, delay))
+    return asyncio.run(enrich_businesses_async(businesses, city, headless, delay, concurrency, cache_enabled))
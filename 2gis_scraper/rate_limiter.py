@@ -0,0 +1,189 @@
+"""
+Per-host token-bucket rate limiting shared across threads and processes
+
+Every scraper and enricher in a process draws from one limiter (see
+get_rate_limiter), keyed by 2GIS host (2gis.ru, 2gis.ae, ...). With the
+SQLite backend all processes on a node share the same buckets.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import random
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+def _refill(state: Optional[Tuple[float, float]], now: float, rate: float, capacity: float) -> float:
+    """
+    Take one token from a bucket, allowing the balance to go negative
+
+    A negative balance means the caller queued behind earlier
+    reservations and has to wait for the bucket to refill.
+
+    Args:
+        state: (tokens, updated) or None for a new, full bucket
+        now: Current wall-clock time
+        rate: Refill rate in tokens per second
+        capacity: Bucket size (burst allowance)
+
+    Returns:
+        New token balance
+    """
+    if state is None:
+        tokens = capacity
+    else:
+        tokens, updated = state
+        tokens = min(capacity, tokens + max(0.0, now - updated) * rate)
+    return tokens - 1
+
+
+class MemoryBucketStore:
+    """Token buckets held in process memory"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+
+    def reserve(self, host: str, rate: float, capacity: float) -> float:
+        """Reserve one request for host and return seconds to wait"""
+        with self._lock:
+            now = time.time()
+            tokens = _refill(self._buckets.get(host), now, rate, capacity)
+            self._buckets[host] = (tokens, now)
+        return max(0.0, -tokens / rate)
+
+
+class SQLiteBucketStore:
+    """Token buckets in a SQLite file so every process on a node shares them"""
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path: SQLite database file (created if missing)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        # Autocommit connection; closing() closes it (sqlite3's own context manager doesn't)
+        with contextlib.closing(self._connect()) as conn:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS buckets '
+                '(host TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)'
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def reserve(self, host: str, rate: float, capacity: float) -> float:
+        """Reserve one request for host and return seconds to wait"""
+        conn = self._connect()
+        try:
+            # IMMEDIATE takes the write lock up front, serializing reservations
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute(
+                'SELECT tokens, updated FROM buckets WHERE host = ?', (host,)
+            ).fetchone()
+            now = time.time()
+            tokens = _refill(row, now, rate, capacity)
+            conn.execute(
+                'INSERT OR REPLACE INTO buckets (host, tokens, updated) VALUES (?, ?, ?)',
+                (host, tokens, now)
+            )
+            conn.execute('COMMIT')
+        except Exception:
+            # BEGIN itself may have failed (database is locked); don't mask that error
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            raise
+        finally:
+            conn.close()
+        return max(0.0, -tokens / rate)
+
+
+class HostRateLimiter:
+    """
+    Token-bucket rate limiter keyed by host
+
+    Each acquire() takes one token from the host's bucket. Buckets refill
+    at 1/delay tokens per second and hold up to `burst` tokens.
+    """
+
+    def __init__(self, store=None, burst: float = None):
+        """
+        Initialize rate limiter
+
+        Args:
+            store: MemoryBucketStore or SQLiteBucketStore (default in-memory)
+            burst: Bucket capacity (default from config)
+        """
+        self.store = store or MemoryBucketStore()
+        self.burst = burst if burst is not None else config.RATE_LIMIT_BURST
+
+    def _reserve(self, host: str, delay: float, jitter: float) -> float:
+        if not host or delay <= 0:
+            return 0.0
+
+        wait = self.store.reserve(host, 1.0 / delay, self.burst)
+        if wait > 0 and jitter > 0:
+            # Small random variation to avoid pattern detection
+            wait += random.uniform(0, jitter)
+        return wait
+
+    def acquire_sync(self, host: str, delay: float, jitter: float = 0.0) -> float:
+        """
+        Block until a request to host is allowed
+
+        Args:
+            host: Target host (e.g. '2gis.ae')
+            delay: Average seconds between requests to this host
+            jitter: Extra random wait (seconds) when throttled
+
+        Returns:
+            Seconds waited
+        """
+        wait = self._reserve(host, delay, jitter)
+        if wait > 0:
+            logger.debug(f"Rate limit {host}: sleeping {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    async def acquire(self, host: str, delay: float, jitter: float = 0.0) -> float:
+        """Asynchronous version of acquire_sync"""
+        # The SQLite store can wait up to its busy timeout for the write lock
+        wait = await asyncio.to_thread(self._reserve, host, delay, jitter)
+        if wait > 0:
+            logger.debug(f"Rate limit {host}: sleeping {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+
+_shared_limiter: Optional[HostRateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """
+    Get the process-wide rate limiter (backend chosen by config.RATE_LIMIT_BACKEND)
+
+    Returns:
+        Shared HostRateLimiter instance
+    """
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            if config.RATE_LIMIT_BACKEND == 'sqlite':
+                store = SQLiteBucketStore(config.RATE_LIMIT_DB_PATH)
+                logger.info(f"Rate limiter: shared SQLite buckets at {config.RATE_LIMIT_DB_PATH}")
+            else:
+                store = MemoryBucketStore()
+            _shared_limiter = HostRateLimiter(store)
+        return _shared_limiter
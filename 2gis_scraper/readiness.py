@@ -0,0 +1,153 @@
+"""
+Readiness detection for rendered 2GIS pages
+
+Replaces fixed post-load sleeps: we return as soon as the page has the
+data we extract (initialState profiles, a rendered contact block, or a
+completed catalog API request), up to a maximum wait.
+"""
+
+import logging
+import threading
+import time
+from typing import Dict, List, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+try:
+    from playwright.sync_api import TimeoutError as PlaywrightTimeoutError
+except ImportError:
+    PlaywrightTimeoutError = TimeoutError
+
+# Returns the readiness reason, or null while the page is still loading.
+# Catalog XHRs are detected through Resource Timing entries, so no
+# Python-side response listener has to be attached to the page.
+READY_PREDICATE_JS = """(patterns) => {
+    const state = window.initialState;
+    const profiles = state && state.data && state.data.entity && state.data.entity.profile;
+    if (profiles && Object.values(profiles).some(p => p && p.data)) {
+        return 'initial_state';
+    }
+    if (document.querySelector('a[href^="tel:"]')) {
+        return 'contacts';
+    }
+    const regexes = patterns.map(p => new RegExp(p));
+    const entries = performance.getEntriesByType('resource');
+    if (entries.some(e => regexes.some(r => r.test(e.name)))) {
+        return 'catalog_xhr';
+    }
+    return null;
+}"""
+
+
+class ReadinessMetrics:
+    """Thread-safe record of how long pages needed to become ready"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._samples: List[float] = []
+        self._reasons: Dict[str, int] = {}
+
+    def record(self, elapsed_ms: float, reason: str):
+        with self._lock:
+            self._samples.append(elapsed_ms)
+            self._reasons[reason] = self._reasons.get(reason, 0) + 1
+
+    def summary(self) -> Dict:
+        """
+        Summarize recorded waits
+
+        Returns:
+            Dictionary with count, mean/p50/p95/max wait in ms and reason counts
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+            reasons = dict(self._reasons)
+
+        if not samples:
+            return {'count': 0, 'reasons': reasons}
+
+        def percentile(p: float) -> float:
+            return samples[min(len(samples) - 1, int(p * len(samples)))]
+
+        return {
+            'count': len(samples),
+            'mean_ms': round(sum(samples) / len(samples), 1),
+            'p50_ms': round(percentile(0.5), 1),
+            'p95_ms': round(percentile(0.95), 1),
+            'max_ms': round(samples[-1], 1),
+            'reasons': reasons
+        }
+
+
+def _finish(started: float, reason: str, metrics: Optional[ReadinessMetrics]) -> str:
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    if metrics is not None:
+        metrics.record(elapsed_ms, reason)
+    logger.debug(f"Page ready after {elapsed_ms:.0f} ms ({reason})")
+    return reason
+
+
+def wait_until_ready_sync(
+    page,
+    max_wait_ms: int,
+    metrics: Optional[ReadinessMetrics] = None
+) -> str:
+    """
+    Wait until a (sync Playwright) page has extractable data
+
+    Args:
+        page: Playwright sync page, already navigated
+        max_wait_ms: Upper bound on the wait
+        metrics: Optional metrics collector
+
+    Returns:
+        Readiness reason ('initial_state', 'contacts', 'catalog_xhr', 'timeout' or 'error')
+    """
+    started = time.perf_counter()
+    try:
+        handle = page.wait_for_function(
+            READY_PREDICATE_JS,
+            arg=config.CATALOG_API_PATTERNS,
+            polling=config.READINESS_POLL_MS,
+            timeout=max_wait_ms
+        )
+        return _finish(started, handle.json_value(), metrics)
+    except PlaywrightTimeoutError:
+        return _finish(started, 'timeout', metrics)
+    except Exception as e:
+        logger.debug(f"Readiness check failed: {e}")
+        return _finish(started, 'error', metrics)
+
+
+async def wait_until_ready(
+    page,
+    max_wait_ms: int,
+    metrics: Optional[ReadinessMetrics] = None
+) -> str:
+    """
+    Wait until an (async Playwright) page has extractable data
+
+    Args:
+        page: Playwright async page, already navigated
+        max_wait_ms: Upper bound on the wait
+        metrics: Optional metrics collector
+
+    Returns:
+        Readiness reason ('initial_state', 'contacts', 'catalog_xhr', 'timeout' or 'error')
+    """
+    started = time.perf_counter()
+    try:
+        handle = await page.wait_for_function(
+            READY_PREDICATE_JS,
+            arg=config.CATALOG_API_PATTERNS,
+            polling=config.READINESS_POLL_MS,
+            timeout=max_wait_ms
+        )
+        return _finish(started, await handle.json_value(), metrics)
+    except PlaywrightTimeoutError:
+        return _finish(started, 'timeout', metrics)
+    except Exception as e:
+        logger.debug(f"Readiness check failed: {e}")
+        return _finish(started, 'error', metrics)
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+Re-parse cached search pages offline
+
+Regenerates business output from what is already in the search cache (no
+network): every cached page is parsed on a process pool and businesses are
+streamed to a JSON Lines or CSV file, deduplicated by ID.
+
+Usage:
+    python reparse.py
+    python reparse.py --city dubai --query restaurant --format csv
+    python reparse.py /path/to/cache/search other/cache/search --workers 8
+"""
+
+import argparse
+import csv
+import logging
+import multiprocessing
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from cache_index import CacheIndex, parse_search_url
+from cache_manager import CACHE_SUFFIXES, read_cache_file, recover_url
+from exporter import CSV_COLUMNS, DataExporter
+from models import to_dicts
+from parser import TwoGISParser
+import config
+import json_backend
+
+logger = logging.getLogger(__name__)
+
+
+def iter_cached_pages(cache_dir: Path, city: Optional[str] = None, query: Optional[str] = None) -> Iterator[Path]:
+    """
+    List the payload files of one search cache directory
+
+    Uses the cache index when there is one, otherwise walks the directory.
+    Files of the old flat layout are not in the index and always come last;
+    for city/query filters their URL is recovered from the page.
+
+    Args:
+        cache_dir: Search cache directory
+        city: Only pages for this city (as in the URL)
+        query: Only pages for this query
+
+    Yields:
+        Payload file paths
+    """
+    suffixes = tuple(CACHE_SUFFIXES.values())
+    flat_files = sorted(f for f in cache_dir.glob('*.html*') if f.name.endswith(suffixes))
+
+    index_path = cache_dir / config.CACHE_INDEX_FILE
+    if index_path.exists():
+        index = CacheIndex(str(index_path))
+        try:
+            entries = index.find(city, query)
+        finally:
+            index.close()
+        for entry in entries:
+            yield cache_dir / entry['path']
+    else:
+        sharded = sorted(f for f in cache_dir.rglob('*.html*') if f.name.endswith(suffixes) and f.parent != cache_dir)
+        if sharded and (city is not None or query is not None):
+            raise ValueError(f"{cache_dir} has no {config.CACHE_INDEX_FILE}; --city/--query need the cache index")
+        yield from sharded
+
+    for path in flat_files:
+        if (city is None and query is None) or _flat_file_matches(path, city, query):
+            yield path
+
+
+def _flat_file_matches(path: Path, city: Optional[str], query: Optional[str]) -> bool:
+    """Whether a flat-layout file's page was fetched for city/query"""
+    url = recover_url(path.name.split('.', 1)[0], read_cache_file(path))
+    page_city, page_query, _ = parse_search_url(url) if url else (None, None, None)
+    return (city is None or page_city == city) and (query is None or page_query == query)
+
+
+def parse_cached_page(path: Path) -> Tuple[Path, List[Dict], Optional[str]]:
+    """
+    Parse one cached payload (runs in a worker process)
+
+    Args:
+        path: Payload file (search page HTML or captured catalog JSON)
+
+    Returns:
+        Tuple of (path, business dictionaries, error or None)
+    """
+    try:
+        content = read_cache_file(path)
+    except (OSError, ValueError, RuntimeError) as e:
+        return path, [], f"unreadable: {e}"
+
+    # Network capture mode caches the catalog API JSON next to the pages
+    if content.lstrip().startswith('{'):
+        try:
+            result = TwoGISParser.parse_catalog_payload(json_backend.loads(content))
+        except json_backend.JSONDecodeError as e:
+            return path, [], f"invalid catalog JSON: {e}"
+    else:
+        result = TwoGISParser.parse_search_page(content)
+
+    error = '; '.join(result.warnings) if not result.businesses and result.warnings else None
+    return path, to_dicts(result.businesses), error
+
+
+class JsonLinesSink:
+    """One JSON object per line"""
+
+    def __init__(self, path: Path):
+        self._file = open(path, 'w', encoding='utf-8')
+
+    def write(self, business: Dict):
+        self._file.write(json_backend.dumps(business))
+        self._file.write('\n')
+
+    def close(self):
+        self._file.close()
+
+
+class CsvSink:
+    """Flattened rows, same columns as DataExporter.export_csv"""
+
+    def __init__(self, path: Path):
+        # UTF-8 BOM for Excel, like DataExporter
+        self._file = open(path, 'w', encoding='utf-8-sig', newline='')
+        self._writer = csv.DictWriter(self._file, fieldnames=CSV_COLUMNS)
+        self._writer.writeheader()
+
+    def write(self, business: Dict):
+        self._writer.writerow(DataExporter.flatten_business(business))
+
+    def close(self):
+        self._file.close()
+
+
+SINKS = {'jsonl': JsonLinesSink, 'csv': CsvSink}
+
+
+def _init_worker(log_level: int):
+    # Per-page INFO messages from the parser would drown the progress log
+    logging.basicConfig(format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s')
+    logging.getLogger().setLevel(max(log_level, logging.WARNING))
+
+
+def reparse(
+    cache_dirs: List[Path],
+    output: Path,
+    output_format: str = 'jsonl',
+    workers: Optional[int] = None,
+    city: Optional[str] = None,
+    query: Optional[str] = None,
+    chunksize: int = 8
+) -> Dict[str, float]:
+    """
+    Parse every cached page and stream unique businesses to a file
+
+    Args:
+        cache_dirs: Search cache directories
+        output: Output file
+        output_format: 'jsonl' or 'csv'
+        workers: Worker processes (default: all cores)
+        city: Only pages for this city (needs the cache index)
+        query: Only pages for this query (needs the cache index)
+        chunksize: Pages handed to a worker at a time
+
+    Returns:
+        Run statistics
+    """
+    pages = [path for cache_dir in cache_dirs for path in iter_cached_pages(cache_dir, city, query)]
+    workers = workers or os.cpu_count() or 1
+    logger.info(f"Re-parsing {len(pages)} cached pages with {workers} workers -> {output}")
+
+    output.parent.mkdir(parents=True, exist_ok=True)
+    sink = SINKS[output_format](output)
+    seen_ids = set()
+    stats = {'pages': len(pages), 'failed_pages': 0, 'businesses': 0, 'duplicates': 0}
+    start = time.monotonic()
+
+    try:
+        with multiprocessing.Pool(workers, initializer=_init_worker, initargs=(logger.getEffectiveLevel(),)) as pool:
+            # imap keeps page order, so the output (and which duplicate wins) is deterministic
+            for done, (path, businesses, error) in enumerate(pool.imap(parse_cached_page, pages, chunksize), 1):
+                if error:
+                    stats['failed_pages'] += 1
+                    logger.warning(f"{path}: {error}")
+                for business in businesses:
+                    business_id = business.get('id')
+                    if business_id in seen_ids:
+                        stats['duplicates'] += 1
+                        continue
+                    seen_ids.add(business_id)
+                    sink.write(business)
+                    stats['businesses'] += 1
+                if done % 1000 == 0:
+                    logger.info(f"{done}/{len(pages)} pages, {stats['businesses']} businesses")
+    finally:
+        sink.close()
+
+    stats['seconds'] = round(time.monotonic() - start, 2)
+    stats['pages_per_second'] = round(len(pages) / stats['seconds'], 1) if stats['seconds'] else 0.0
+    return stats
+
+
+def main():
+    """Reparse CLI"""
+    parser = argparse.ArgumentParser(
+        description='Re-parse cached 2GIS search pages into a business file (no network)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__.split('Usage:', 1)[1]
+    )
+    parser.add_argument(
+        'cache_dirs',
+        nargs='*',
+        type=Path,
+        default=[Path(config.DEFAULT_CACHE_DIR)],
+        help=f'Search cache directories (default: {config.DEFAULT_CACHE_DIR})'
+    )
+    parser.add_argument('--city', help='Only pages for this city (as in the URL, e.g. dubai)')
+    parser.add_argument('--query', help='Only pages for this search query')
+    parser.add_argument(
+        '--format',
+        choices=sorted(SINKS),
+        default='jsonl',
+        help='Output format (default: jsonl)'
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        help=f'Output file (default: {config.DEFAULT_OUTPUT_DIR}/reparsed.<format>)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=None,
+        help='Worker processes (default: all cores)'
+    )
+    parser.add_argument(
+        '--log-level',
+        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+        default=config.LOG_LEVEL,
+        help=f'Logging level (default: {config.LOG_LEVEL})'
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=getattr(logging, args.log_level),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    output = args.output or Path(config.DEFAULT_OUTPUT_DIR) / f'reparsed.{args.format}'
+
+    try:
+        stats = reparse(args.cache_dirs, output, args.format, args.workers, args.city, args.query)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    print(f"\nRe-parsed {stats['pages']} pages in {stats['seconds']}s ({stats['pages_per_second']} pages/s)")
+    print(f"  {stats['businesses']} unique businesses, {stats['duplicates']} duplicates, "
+          f"{stats['failed_pages']} pages without businesses")
+    print(f"  Output: {output}")
+
+
+if __name__ == '__main__':
+    main()
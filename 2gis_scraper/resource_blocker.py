@@ -0,0 +1,117 @@
+"""
+Request-routing policy that blocks resources we never extract data from
+"""
+
+import logging
+import re
+import threading
+from typing import Dict, List, Optional
+
+import config
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceBlocker:
+    """
+    Aborts map tiles, images, fonts, analytics, CSS, etc. in browser contexts
+
+    The allowlist wins over both block rules, so the document, scripts
+    and catalog API requests the extraction depends on always load.
+    """
+
+    def __init__(
+        self,
+        blocked_types: Optional[List[str]] = None,
+        blocked_patterns: Optional[List[str]] = None,
+        allowed_patterns: Optional[List[str]] = None
+    ):
+        """
+        Initialize resource blocker (defaults from config)
+
+        Args:
+            blocked_types: Playwright resource types to abort (image, font, ...)
+            blocked_patterns: URL regexes to abort regardless of type
+            allowed_patterns: URL regexes that are never aborted
+        """
+        self.blocked_types = set(
+            blocked_types if blocked_types is not None else config.BLOCKED_RESOURCE_TYPES
+        )
+        self.blocked_patterns = [
+            re.compile(p) for p in
+            (blocked_patterns if blocked_patterns is not None else config.BLOCKED_URL_PATTERNS)
+        ]
+        self.allowed_patterns = [
+            re.compile(p) for p in
+            (allowed_patterns if allowed_patterns is not None else config.ALLOWED_URL_PATTERNS)
+        ]
+
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.blocked_by_type: Dict[str, int] = {}
+
+    def should_block(self, resource_type: str, url: str) -> bool:
+        """
+        Decide whether a request should be aborted
+
+        Args:
+            resource_type: Playwright resource type (document, script, image, ...)
+            url: Request URL
+
+        Returns:
+            True if the request should be aborted
+        """
+        if any(p.search(url) for p in self.allowed_patterns):
+            return False
+        if resource_type in self.blocked_types:
+            return True
+        return any(p.search(url) for p in self.blocked_patterns)
+
+    def _record(self, resource_type: str, blocked: bool):
+        with self._lock:
+            if blocked:
+                self.blocked_by_type[resource_type] = self.blocked_by_type.get(resource_type, 0) + 1
+            else:
+                self.allowed += 1
+
+    def handle_route_sync(self, route):
+        """Route handler for sync Playwright contexts"""
+        request = route.request
+        blocked = self.should_block(request.resource_type, request.url)
+        self._record(request.resource_type, blocked)
+        if blocked:
+            route.abort()
+        else:
+            route.continue_()
+
+    async def handle_route(self, route):
+        """Route handler for async Playwright contexts"""
+        request = route.request
+        blocked = self.should_block(request.resource_type, request.url)
+        self._record(request.resource_type, blocked)
+        if blocked:
+            await route.abort()
+        else:
+            await route.continue_()
+
+    def apply_sync(self, context):
+        """Install the policy on a sync Playwright browser context"""
+        context.route('**/*', self.handle_route_sync)
+
+    async def apply(self, context):
+        """Install the policy on an async Playwright browser context"""
+        await context.route('**/*', self.handle_route)
+
+    def get_stats(self) -> Dict:
+        """
+        Get request counts
+
+        Returns:
+            Dictionary with allowed/blocked totals and blocked counts per type
+        """
+        with self._lock:
+            return {
+                'allowed': self.allowed,
+                'blocked': sum(self.blocked_by_type.values()),
+                'blocked_by_type': dict(self.blocked_by_type)
+            }
@@ -2,17 +2,28 @@
 Core scraping engine for 2GIS
 """
 
-import time
 import random
 import logging
-import requests
+import asyncio
+import concurrent.futures
 import os
-from typing import List, Dict, Optional
-from urllib.parse import quote
+import threading
+import time
+from typing import List, Dict, Optional, Set
+from urllib.parse import quote, urlparse
 
-from parser import TwoGISParser
+from parser import PARSER_VERSION, SearchPageResult, TwoGISParser
 from cache_manager import CacheManager
+from browser_pool import PLAYWRIGHT_AVAILABLE, BrowserPool
+from readiness import ReadinessMetrics, wait_until_ready_sync
+from network_capture import CatalogResponseMatcher, capture_catalog_sync
+from resource_blocker import ResourceBlocker
+from rate_limiter import get_rate_limiter
+from adaptive_pacer import get_pacer
+from async_fetcher import AsyncFetchEngine, FetchError
+from page_classifier import PAGE_EMPTY, PAGE_OK, classify_page
 import config
+import json_backend
 
 logger = logging.getLogger(__name__)
 
@@ -30,16 +41,13 @@ logger.info(f"USE_PLAYWRIGHT environment variable: '{USE_PLAYWRIGHT_ENV}' (raw)"
 logger.info(f"After strip().lower(): '{USE_PLAYWRIGHT_ENV.strip().lower()}'")
 logger.info(f"Playwright mode: {'ENABLED' if USE_PLAYWRIGHT else 'DISABLED'}")
 
-# Always try to import Playwright (might be needed at runtime)
-try:
-    from playwright.sync_api import sync_playwright
-    PLAYWRIGHT_AVAILABLE = True
+# Playwright itself is imported by the browser pool (might be needed at runtime)
+if PLAYWRIGHT_AVAILABLE:
     print("[SCRAPER MODULE] ✓ Playwright successfully imported")
     logger.info("✓ Playwright successfully imported")
-except ImportError as e:
-    PLAYWRIGHT_AVAILABLE = False
-    print(f"[SCRAPER MODULE] ✗ Playwright import failed: {e}")
-    logger.error(f"✗ Playwright import failed: {e}")
+else:
+    print("[SCRAPER MODULE] ✗ Playwright import failed")
+    logger.error("✗ Playwright import failed")
     logger.warning("Playwright not available - will use requests only")
 
 
@@ -51,7 +59,8 @@ class TwoGISScraper:
         cache_enabled: bool = True,
         delay: float = None,
         timeout: int = None,
-        max_retries: int = None
+        max_retries: int = None,
+        capture_network: bool = None
     ):
         """
         Initialize 2GIS scraper
@@ -61,31 +70,53 @@ class TwoGISScraper:
             delay: Delay between requests in seconds (default from config)
             timeout: Request timeout in seconds (default from config)
             max_retries: Maximum retry attempts (default from config)
+            capture_network: In Playwright mode, capture catalog API JSON
+                instead of parsing rendered HTML (default from config)
         """
         self.cache = CacheManager(
             cache_dir=config.DEFAULT_CACHE_DIR,
-            enabled=cache_enabled
+            enabled=cache_enabled,
+            ttl=config.CACHE_TTL_SEARCH
+        )
+        # Second tier: extraction results, so warm runs skip HTML parsing
+        self.parsed_cache = CacheManager(
+            cache_dir=config.PARSED_CACHE_DIR,
+            enabled=cache_enabled,
+            ttl=config.CACHE_TTL_SEARCH
         )
+        # Negative cache: genuinely empty result pages, kept only briefly
+        self.empty_cache = CacheManager(
+            cache_dir=config.EMPTY_CACHE_DIR,
+            enabled=cache_enabled,
+            ttl=config.CACHE_TTL_EMPTY,
+            stale_window=0
+        )
+        self._revalidator: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._revalidating = set()
+        self._revalidations: Set[concurrent.futures.Future] = set()
+        self._revalidate_lock = threading.Lock()
         self.delay = delay if delay is not None else config.DEFAULT_DELAY
         self.timeout = timeout if timeout is not None else config.DEFAULT_TIMEOUT
         self.max_retries = max_retries if max_retries is not None else config.MAX_RETRIES
+        self.capture_network = capture_network if capture_network is not None else config.NETWORK_CAPTURE
         self.parser = TwoGISParser()
-        self.session = self._create_session()
+        self.rate_limiter = get_rate_limiter()
+        self.pacer = get_pacer()
+        self._browser_pool: Optional[BrowserPool] = None
+        self.readiness_metrics = ReadinessMetrics()
+        self.resource_blocker = ResourceBlocker() if config.BLOCK_RESOURCES else None
 
         logger.info(f"Scraper initialized (delay={self.delay}s, cache={cache_enabled})")
 
-    def _create_session(self) -> requests.Session:
-        """Create and configure requests session"""
-        session = requests.Session()
-        session.headers.update({
+    @staticmethod
+    def _default_headers() -> Dict[str, str]:
+        """Default request headers (compression and keep-alive are left to the client)"""
+        return {
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'gzip, deflate, br',
             'DNT': '1',
-            'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1'
-        })
-        return session
+        }
 
     def _get_user_agent(self) -> str:
         """Get random User-Agent from pool"""
@@ -130,9 +161,42 @@ class TwoGISScraper:
 
         return url
 
+    def _get_browser_pool(self) -> BrowserPool:
+        """Get the scraper's browser pool, creating it on first use"""
+        if self._browser_pool is None:
+            self._browser_pool = BrowserPool(user_agent_factory=self._get_user_agent)
+            if self.resource_blocker is not None:
+                self._browser_pool.add_context_hook(self.resource_blocker.apply_sync)
+        return self._browser_pool
+
+    def _render_search_page(self, page, url: str) -> str:
+        """
+        Navigate a leased page to a search URL and return rendered HTML
+
+        Args:
+            page: Playwright page from the browser pool
+            url: URL to fetch
+
+        Returns:
+            HTML content
+        """
+        # Use 'load' instead of 'networkidle' - faster and more reliable
+        logger.info(f"[PLAYWRIGHT] Navigating to {url}")
+        page.goto(url, wait_until='load', timeout=60000)
+
+        # Wait until the data is there rather than a fixed amount
+        reason = wait_until_ready_sync(
+            page,
+            config.READINESS_MAX_WAIT_MS_SEARCH,
+            self.readiness_metrics
+        )
+        logger.info(f"[PLAYWRIGHT] Page ready ({reason})")
+
+        return page.content()
+
     def _fetch_page_playwright_sync(self, url: str) -> Optional[str]:
         """
-        Fetch HTML using Playwright (synchronous version for thread execution)
+        Fetch HTML using the scraper's long-lived browser pool
 
         Args:
             url: URL to fetch
@@ -141,57 +205,166 @@ class TwoGISScraper:
             HTML content or None if failed
         """
         try:
-            with sync_playwright() as p:
-                browser = p.chromium.launch(
-                    headless=True,
-                    args=[
-                        '--no-sandbox',
-                        '--disable-setuid-sandbox',
-                        '--disable-dev-shm-usage',
-                        '--disable-blink-features=AutomationControlled'
-                    ]
-                )
+            host = urlparse(url).hostname
+            # Pool workers own their browsers, so this is safe from async code too
+            html = self._get_browser_pool().run(
+                host,
+                self._render_search_page,
+                url,
+                timeout=self.timeout + 30
+            )
+            logger.info(f"✓ Fetched with Playwright: {url} ({len(html)} bytes)")
+            return html
+        except Exception as e:
+            logger.error(f"Playwright fetch failed: {e}")
+            return None
 
-                context = browser.new_context(
-                    user_agent=self._get_user_agent(),
-                    viewport={'width': 1920, 'height': 1080},
-                    locale='ru-RU',
-                    timezone_id='Europe/Moscow'
-                )
+    @staticmethod
+    def _playwright_enabled() -> bool:
+        """Whether USE_PLAYWRIGHT is set at runtime and Playwright is importable"""
+        use_playwright = os.getenv('USE_PLAYWRIGHT', 'false').strip().lower() == 'true'
+        return use_playwright and PLAYWRIGHT_AVAILABLE
 
-                page = context.new_page()
+    def _get_cached_catalog(self, url: str) -> Optional[Dict]:
+        """Get a previously captured catalog payload for a search URL"""
+        cached = self.cache.get(f'{url}#catalog')
+        if not cached:
+            return None
+        try:
+            return json_backend.loads(cached)
+        except json_backend.JSONDecodeError:
+            return None
 
-                # Use 'load' instead of 'networkidle' - faster and more reliable
-                logger.info(f"[PLAYWRIGHT] Navigating to {url}")
-                page.goto(url, wait_until='load', timeout=60000)
+    def _fetch_catalog_payload(self, url: str) -> Optional[Dict]:
+        """
+        Fetch the catalog API JSON for a search URL via network capture
 
-                # Wait a bit for dynamic content to render
-                logger.info("[PLAYWRIGHT] Waiting for dynamic content...")
-                page.wait_for_timeout(3000)
+        Args:
+            url: Search page URL
 
-                html = page.content()
-                browser.close()
-                logger.info(f"✓ Fetched with Playwright: {url} ({len(html)} bytes)")
-                return html
+        Returns:
+            Catalog payload or None if capture failed (caller falls back to HTML)
+        """
+        payload = self._get_cached_catalog(url)
+        if payload:
+            return payload
+
+        try:
+            payload = self._get_browser_pool().run(
+                urlparse(url).hostname,
+                capture_catalog_sync,
+                url,
+                CatalogResponseMatcher(),
+                timeout=self.timeout + 30
+            )
         except Exception as e:
-            logger.error(f"Playwright fetch failed: {e}")
+            logger.error(f"Network capture failed: {e}")
             return None
 
-    def _fetch_page(self, url: str) -> Optional[str]:
+        if payload:
+            self.cache.set(f'{url}#catalog', json_backend.dumps(payload))
+        return payload
+
+    def _open_engine(self) -> AsyncFetchEngine:
+        """Create an async fetch engine (use with `async with`)"""
+        return AsyncFetchEngine(headers=self._default_headers(), timeout=self.timeout)
+
+    @staticmethod
+    def _run_sync(coro):
+        """
+        Run a coroutine to completion from synchronous code
+
+        Uses a helper thread when called while an event loop is already
+        running (e.g. from a FastAPI endpoint).
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coro).result()
+
+    def _current_delay(self, host: str) -> float:
+        """Delay between requests to host (adaptive when pacing is enabled)"""
+        if self.pacer is None:
+            return self.delay
+        return self.pacer.get_delay(host, self.delay)
+
+    async def _throttle(self, host: str):
+        """Wait for the shared per-host rate limit (only network fetches draw from it)"""
+        await self.rate_limiter.acquire(host, self._current_delay(host), jitter=0.5)
+
+    def _observe(self, host: str, status: Optional[int], latency: float, html: Optional[str] = None) -> Optional[str]:
+        """Report a response to the adaptive pacer; returns the backoff reason, if any"""
+        if self.pacer is None:
+            return None
+        return self.pacer.observe(host, self.delay, status, latency, html)
+
+    async def _fetch_page_async(self, url: str, engine: AsyncFetchEngine, use_cache: bool = True) -> Optional[str]:
         """
         Fetch HTML page with caching and retries
 
         Args:
             url: URL to fetch
+            engine: Open fetch engine
+            use_cache: Serve from cache if possible (False forces a refetch)
 
         Returns:
             HTML content or None if failed
         """
+        if not use_cache or not self.cache.enabled:
+            return await self._fetch_page_uncached(url, engine)
+
         # Check cache first
-        cached_html = self.cache.get(url)
+        cached_html = self._cached_page(url)
         if cached_html:
             return cached_html
 
+        # Single-flight: when several workers (threads or processes sharing
+        # the cache) miss on the same URL, one fetches and the rest reuse it
+        lock = self.cache.fill_lock(url)
+        acquired = await lock.acquire_async(timeout=config.CACHE_LOCK_TIMEOUT)
+        if not acquired:
+            logger.warning(f"Timed out waiting for another worker to fetch {url}")
+        try:
+            if acquired:
+                cached_html = self.cache.get(url) or self.empty_cache.get(url)
+                if cached_html:
+                    logger.info(f"Fetched by another worker: {url}")
+                    return cached_html
+            return await self._fetch_page_uncached(url, engine)
+        finally:
+            lock.release()
+
+    def _cached_page(self, url: str) -> Optional[str]:
+        """Cached HTML for url from the page cache or the negative (empty result) cache"""
+        return self._cache_lookup(self.cache, url, url) or self.empty_cache.get(url)
+
+    def _store_page(self, url: str, html: str, verdict: str):
+        """Cache a good page; empty result pages go to the short-lived negative cache"""
+        if verdict == PAGE_OK:
+            self.cache.set(url, html)
+        elif verdict == PAGE_EMPTY:
+            logger.info(f"No results on {url}, caching for {config.CACHE_TTL_EMPTY}s only")
+            self.empty_cache.set(url, html)
+            # A stale good copy (e.g. being revalidated) would otherwise keep
+            # shadowing the negative cache and be revalidated over and over
+            self.cache.delete(url)
+
+    async def _fetch_page_uncached(self, url: str, engine: AsyncFetchEngine) -> Optional[str]:
+        """
+        Fetch HTML page from the network (Playwright or HTTP) with retries, then cache it
+
+        Args:
+            url: URL to fetch
+            engine: Open fetch engine
+
+        Returns:
+            HTML content or None if failed
+        """
+        host = urlparse(url).hostname
+
         # Debug: Check USE_PLAYWRIGHT value at runtime
         use_playwright_env_raw = os.getenv('USE_PLAYWRIGHT', 'false')
         use_playwright_runtime = use_playwright_env_raw.strip().lower() == 'true'
@@ -204,179 +377,408 @@ class TwoGISScraper:
         if use_playwright_runtime:
             if not PLAYWRIGHT_AVAILABLE:
                 logger.error("[FETCH_PAGE] ❌ Playwright requested but not available!")
-                logger.warning("Falling back to requests")
+                logger.warning("Falling back to HTTP")
             else:
                 logger.info("[FETCH_PAGE] ✅ Playwright mode ACTIVE - attempting browser fetch")
                 try:
-                    # Run sync Playwright in a thread to avoid asyncio loop conflict
-                    import asyncio
-                    import concurrent.futures
-
-                    try:
-                        # Check if we're in an async context
-                        loop = asyncio.get_event_loop()
-                        if loop.is_running():
-                            # We're in an async context - use thread pool
-                            logger.info("[FETCH_PAGE] Running Playwright in thread pool (async context detected)")
-                            with concurrent.futures.ThreadPoolExecutor() as executor:
-                                future = executor.submit(self._fetch_page_playwright_sync, url)
-                                html = future.result(timeout=60)
-                        else:
-                            # Not in async context - call directly
-                            html = self._fetch_page_playwright_sync(url)
-                    except RuntimeError:
-                        # No event loop - call directly
-                        html = self._fetch_page_playwright_sync(url)
+                    await self._throttle(host)
+                    # The browser pool blocks, so wait for it off the event loop
+                    start = time.monotonic()
+                    html = await asyncio.to_thread(self._fetch_page_playwright_sync, url)
 
                     if html:
-                        self.cache.set(url, html)
-                        return html
-                    # Fall through to requests if Playwright fails
-                    logger.warning("Playwright failed, falling back to requests")
+                        self._observe(host, 200, time.monotonic() - start, html)
+                        verdict = classify_page(html)
+                        if verdict in (PAGE_OK, PAGE_EMPTY):
+                            self._store_page(url, html, verdict)
+                            return html
+                        logger.warning(f"Playwright got a {verdict} page for {url}")
+                    # Fall through to HTTP if Playwright fails
+                    logger.warning("Playwright failed, falling back to HTTP")
                 except Exception as e:
                     logger.error(f"Playwright error: {e}")
-                    logger.warning("Falling back to requests")
+                    logger.warning("Falling back to HTTP")
         else:
-            logger.info("[FETCH_PAGE] ❌ Playwright mode DISABLED - using requests library")
+            logger.info("[FETCH_PAGE] ❌ Playwright mode DISABLED - using HTTP client")
 
-        # Fetch from web using requests
+        # Fetch from web over HTTP
         for attempt in range(self.max_retries):
+            await self._throttle(host)
+            start = time.monotonic()
             try:
                 headers = {'User-Agent': self._get_user_agent()}
-                response = self.session.get(
-                    url,
-                    headers=headers,
-                    timeout=self.timeout
-                )
-                response.raise_for_status()
+                html = await engine.get_text(url, headers=headers)
 
-                # Explicitly set encoding to UTF-8 for Russian content
-                response.encoding = 'utf-8'
-                html = response.text
+                self._observe(host, 200, time.monotonic() - start, html)
+
+                # A 200 can still be a captcha or a broken page - never cache
+                # those; retry (the pacer has already slowed down for captchas)
+                verdict = classify_page(html)
+                if verdict not in (PAGE_OK, PAGE_EMPTY):
+                    logger.warning(f"Got a {verdict} page for {url} (attempt {attempt + 1}/{self.max_retries})")
+                    if attempt < self.max_retries - 1:
+                        await asyncio.sleep(2 ** attempt)  # Exponential backoff
+                    continue
 
                 # Cache the response
-                self.cache.set(url, html)
+                self._store_page(url, html, verdict)
 
                 logger.info(f"Fetched: {url} ({len(html)} bytes)")
                 return html
 
-            except requests.exceptions.RequestException as e:
+            except FetchError as e:
+                self._observe(host, e.status, time.monotonic() - start)
                 logger.warning(f"Request failed (attempt {attempt + 1}/{self.max_retries}): {e}")
                 if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
+                    await asyncio.sleep(2 ** attempt)  # Exponential backoff
                 continue
 
         logger.error(f"Failed to fetch {url} after {self.max_retries} attempts")
         return None
 
-    def _rate_limit(self):
-        """Apply rate limiting delay"""
-        if self.delay > 0:
-            # Add small random variation to avoid pattern detection
-            jitter = random.uniform(-0.5, 0.5)
-            sleep_time = max(0, self.delay + jitter)
-            logger.debug(f"Sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
+    def _fetch_page(self, url: str) -> Optional[str]:
+        """
+        Fetch HTML page with caching and retries (sync wrapper)
 
-    def scrape_page(self, city: str, query: str, page: int = 1) -> List[Dict]:
+        Args:
+            url: URL to fetch
+
+        Returns:
+            HTML content or None if failed
         """
-        Scrape single page of results
+        async def fetch():
+            async with self._open_engine() as engine:
+                return await self._fetch_page_async(url, engine)
+
+        return self._run_sync(fetch())
+
+    def _cache_lookup(self, cache: CacheManager, key: str, url: str) -> Optional[str]:
+        """
+        Read a cache entry, serving stale entries while url is refreshed in the background
+
+        Args:
+            cache: Cache tier to read
+            key: Cache key
+            url: Search URL to revalidate if the entry is stale
+
+        Returns:
+            Cached content or None
+        """
+        if not config.CACHE_STALE_WHILE_REVALIDATE:
+            return cache.get(key)
+
+        content, stale = cache.lookup(key)
+        if content and stale:
+            self._schedule_revalidation(url)
+        return content
+
+    def _schedule_revalidation(self, url: str):
+        """Refetch a stale search URL in the background (once per URL at a time)"""
+        with self._revalidate_lock:
+            if url in self._revalidating:
+                return
+            self._revalidating.add(url)
+            if self._revalidator is None:
+                self._revalidator = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='cache-revalidate'
+                )
+        logger.info(f"Serving stale cache, revalidating in background: {url}")
+        future = self._revalidator.submit(self._revalidate, url)
+        self._revalidations.add(future)
+        future.add_done_callback(self._revalidations.discard)
+
+    def _revalidate(self, url: str):
+        """Fetch a fresh copy of url into the HTML cache and drop its parsed entry"""
+        async def refresh():
+            async with self._open_engine() as engine:
+                return await self._fetch_page_async(url, engine, use_cache=False)
+
+        # Another worker is already fetching this URL
+        lock = self.cache.fill_lock(url)
+        if not lock.acquire(timeout=0):
+            with self._revalidate_lock:
+                self._revalidating.discard(url)
+            return
+
+        try:
+            if asyncio.run(refresh()):
+                # Re-extracted from the fresh HTML on next use
+                self.parsed_cache.delete(f'{url}#parsed-v{PARSER_VERSION}')
+        except Exception as e:
+            logger.warning(f"Background revalidation failed for {url}: {e}")
+        finally:
+            lock.release()
+            with self._revalidate_lock:
+                self._revalidating.discard(url)
+
+    def _get_parsed(self, url: str) -> Optional[SearchPageResult]:
+        """Get cached extraction result for a search URL (current parser version only)"""
+        cached = self._cache_lookup(self.parsed_cache, f'{url}#parsed-v{PARSER_VERSION}', url)
+        if not cached:
+            return None
+        try:
+            return SearchPageResult.from_dict(json_backend.loads(cached))
+        except (json_backend.JSONDecodeError, TypeError, AttributeError):
+            return None
+
+    def _set_parsed(self, url: str, result: SearchPageResult):
+        """Cache extraction result for a search URL"""
+        self.parsed_cache.set(f'{url}#parsed-v{PARSER_VERSION}', json_backend.dumps(result.to_dict()))
+
+    async def scrape_search_page_async(
+        self,
+        city: str,
+        query: str,
+        page: int = 1,
+        engine: Optional[AsyncFetchEngine] = None
+    ) -> SearchPageResult:
+        """
+        Scrape single page of results, including result totals
+
+        The page is parsed once; businesses and pagination come from the same pass.
 
         Args:
             city: City name
             query: Search query
             page: Page number (1-indexed)
+            engine: Open fetch engine to reuse (a temporary one is opened if omitted)
 
         Returns:
-            List of business dictionaries
+            SearchPageResult for the page
         """
+        if engine is None:
+            async with self._open_engine() as engine:
+                return await self.scrape_search_page_async(city, query, page, engine)
+
         url = self._build_url(city, query, page)
         logger.info(f"Scraping page {page}: {query} in {city}")
 
+        parsed = self._get_parsed(url)
+        if parsed is not None:
+            logger.info(f"Parsed cache hit: {len(parsed.businesses)} businesses from page {page}")
+            return parsed
+
+        # Network capture mode: use the catalog JSON, skip HTML entirely
+        if self.capture_network and self._playwright_enabled():
+            payload = self._get_cached_catalog(url)
+            if not payload:
+                host = urlparse(url).hostname
+                await self._throttle(host)
+                start = time.monotonic()
+                payload = await asyncio.to_thread(self._fetch_catalog_payload, url)
+                if payload:
+                    self._observe(host, 200, time.monotonic() - start)
+            if payload:
+                result = self.parser.parse_catalog_payload(payload)
+                logger.info(f"Extracted {len(result.businesses)} businesses from page {page}")
+                self._set_parsed(url, result)
+                return result
+            logger.warning("No catalog payload captured, falling back to HTML")
+
         # Fetch HTML
-        html = self._fetch_page(url)
+        html = await self._fetch_page_async(url, engine)
         if not html:
             logger.error(f"Failed to fetch page {page}")
-            return []
+            return SearchPageResult(warnings=['Page could not be fetched'])
 
-        # Extract initialState
-        initial_state = self.parser.extract_initial_state(html)
-        if not initial_state:
-            logger.error(f"Failed to extract initialState from page {page}")
-            return []
+        # One pass over initialState: businesses and result totals
+        result = self.parser.parse_search_page(html)
+        if not result.businesses and result.warnings:
+            logger.error(f"Failed to extract businesses from page {page}: {'; '.join(result.warnings)}")
+        logger.info(f"Extracted {len(result.businesses)} businesses from page {page}")
 
-        # Extract businesses
-        businesses = self.parser.extract_businesses(initial_state)
-        logger.info(f"Extracted {len(businesses)} businesses from page {page}")
+        # Empty pages live only in the short-lived negative cache
+        if result.businesses:
+            self._set_parsed(url, result)
+        return result
 
-        return businesses
+    async def scrape_page_async(
+        self,
+        city: str,
+        query: str,
+        page: int = 1,
+        engine: Optional[AsyncFetchEngine] = None
+    ) -> List[Dict]:
+        """
+        Scrape single page of results
 
-    def scrape(
+        Args:
+            city: City name
+            query: Search query
+            page: Page number (1-indexed)
+            engine: Open fetch engine to reuse (a temporary one is opened if omitted)
+
+        Returns:
+            List of business dictionaries
+        """
+        if engine is None:
+            async with self._open_engine() as engine:
+                return await self.scrape_page_async(city, query, page, engine)
+
+        result = await self.scrape_search_page_async(city, query, page, engine)
+        return result.businesses
+
+    def scrape_page(self, city: str, query: str, page: int = 1) -> List[Dict]:
+        """
+        Scrape single page of results (sync wrapper around scrape_page_async)
+
+        Args:
+            city: City name
+            query: Search query
+            page: Page number (1-indexed)
+
+        Returns:
+            List of business dictionaries
+        """
+        return self._run_sync(self.scrape_page_async(city, query, page))
+
+    def scrape_search_page(self, city: str, query: str, page: int = 1) -> SearchPageResult:
+        """
+        Scrape single page of results with totals (sync wrapper around scrape_search_page_async)
+
+        Args:
+            city: City name
+            query: Search query
+            page: Page number (1-indexed)
+
+        Returns:
+            SearchPageResult for the page
+        """
+        return self._run_sync(self.scrape_search_page_async(city, query, page))
+
+    async def scrape_async(
         self,
         city: str,
         query: str,
         max_pages: Optional[int] = None,
-        auto_detect_pages: bool = True
+        auto_detect_pages: bool = True,
+        engine: Optional[AsyncFetchEngine] = None,
+        first_page: Optional[SearchPageResult] = None
     ) -> List[Dict]:
         """
         Scrape multiple pages of results
 
+        Page 1 is fetched first to detect pagination; the remaining pages
+        are then fetched in order, up to SEARCH_CONCURRENCY at a time under
+        the shared rate limiter. The first empty page ends the crawl: no
+        later page is scheduled and the ones in flight are cancelled.
+
         Args:
             city: City name
             query: Search query
             max_pages: Maximum number of pages to scrape (None for all)
             auto_detect_pages: Auto-detect total pages from first page
+            engine: Open fetch engine to reuse (a temporary one is opened if omitted)
+            first_page: Page 1 result the caller already has (e.g. to report totals)
 
         Returns:
             List of all business dictionaries across pages
         """
+        if engine is None:
+            async with self._open_engine() as engine:
+                return await self.scrape_async(city, query, max_pages, auto_detect_pages, engine, first_page)
+
         all_businesses = []
         total_pages = max_pages
 
         # Fetch first page
         logger.info(f"Starting scrape: '{query}' in {city}")
-        page1_businesses = self.scrape_page(city, query, page=1)
-        all_businesses.extend(page1_businesses)
+        page1 = first_page or await self.scrape_search_page_async(city, query, 1, engine)
+        all_businesses.extend(page1.businesses)
 
-        # Auto-detect total pages if requested
+        # Auto-detect total pages if requested (found while parsing page 1)
         if auto_detect_pages and not max_pages:
-            url = self._build_url(city, query, page=1)
-            html = self.cache.get(url)  # Should be cached from scrape_page
-            if html:
-                detected_pages = self.parser.detect_total_pages(html)
-                if detected_pages:
-                    total_pages = detected_pages
-                    logger.info(f"Auto-detected {total_pages} total pages")
+            detected_pages = page1.total_pages
+            if detected_pages:
+                total_pages = detected_pages
+                logger.info(f"Auto-detected {total_pages} total pages ({page1.total_items} results)")
+                if config.AUTO_MAX_PAGES and total_pages > config.AUTO_MAX_PAGES:
+                    total_pages = config.AUTO_MAX_PAGES
+                    logger.info(f"Scraping the first {total_pages} pages (AUTO_MAX_PAGES; set max_pages for more)")
+        elif max_pages and page1.total_pages and page1.total_pages < max_pages:
+            # Don't request pages the search doesn't have
+            total_pages = page1.total_pages
+            logger.info(f"Search has only {total_pages} pages")
 
         # If no pages detected and no max_pages set, default to 1 page only
         if total_pages is None:
             logger.info("No pagination detected, scraping first page only")
             return all_businesses
 
-        # Scrape remaining pages
-        for page in range(2, total_pages + 1):
-            self._rate_limit()  # Rate limiting between pages
+        # Scrape remaining pages through a sliding window (the rate limiter paces requests)
+        results: Dict[int, List[Dict]] = {}
+        in_flight: Dict[asyncio.Task, int] = {}
+        abandoned: List[asyncio.Task] = []
+        next_page, last_page = 2, total_pages
+        try:
+            while in_flight or next_page <= last_page:
+                while next_page <= last_page and len(in_flight) < config.SEARCH_CONCURRENCY:
+                    task = asyncio.ensure_future(self.scrape_page_async(city, query, next_page, engine))
+                    in_flight[task] = next_page
+                    next_page += 1
+
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    page = in_flight.pop(task)
+                    businesses = task.result()
+                    if page > last_page:
+                        continue
+                    if businesses:
+                        results[page] = businesses
+                        continue
+
+                    # Reached the end: later pages are not needed
+                    logger.info(f"No results on page {page}, stopping")
+                    last_page = page - 1
+                    for other, other_page in list(in_flight.items()):
+                        if other_page > last_page:
+                            other.cancel()
+                            abandoned.append(in_flight.pop(other))
+        finally:
+            # Also on errors: nothing keeps fetching after we return
+            for task in in_flight:
+                task.cancel()
+            pending = list(in_flight) + abandoned
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        for page in range(2, last_page + 1):
+            all_businesses.extend(results[page])
 
-            businesses = self.scrape_page(city, query, page)
+        logger.info(f"Scraping complete: {len(all_businesses)} total businesses")
+        return all_businesses
 
-            # Stop if no results found (reached end)
-            if not businesses:
-                logger.info(f"No results on page {page}, stopping")
-                break
+    def scrape(
+        self,
+        city: str,
+        query: str,
+        max_pages: Optional[int] = None,
+        auto_detect_pages: bool = True
+    ) -> List[Dict]:
+        """
+        Scrape multiple pages of results (sync wrapper around scrape_async)
 
-            all_businesses.extend(businesses)
+        Args:
+            city: City name
+            query: Search query
+            max_pages: Maximum number of pages to scrape (None for all)
+            auto_detect_pages: Auto-detect total pages from first page
 
-        logger.info(f"Scraping complete: {len(all_businesses)} total businesses")
-        return all_businesses
+        Returns:
+            List of all business dictionaries across pages
+        """
+        return self._run_sync(self.scrape_async(city, query, max_pages, auto_detect_pages))
 
-    def scrape_multiple_queries(
+    async def scrape_multiple_queries_async(
         self,
         city: str,
         queries: List[str],
         max_pages_per_query: Optional[int] = None
     ) -> Dict[str, List[Dict]]:
         """
-        Scrape multiple queries for the same city
+        Scrape multiple queries for the same city concurrently
+
+        All queries share one fetch engine and the scraper's rate limiter.
 
         Args:
             city: City name
@@ -386,29 +788,89 @@ class TwoGISScraper:
         Returns:
             Dictionary mapping query to list of businesses
         """
-        results = {}
-
-        for i, query in enumerate(queries):
-            logger.info(f"Processing query {i + 1}/{len(queries)}: {query}")
+        async with self._open_engine() as engine:
+            results = await asyncio.gather(*(
+                self.scrape_async(
+                    city=city,
+                    query=query,
+                    max_pages=max_pages_per_query,
+                    engine=engine
+                )
+                for query in queries
+            ))
 
-            businesses = self.scrape(
-                city=city,
-                query=query,
-                max_pages=max_pages_per_query
-            )
+        return dict(zip(queries, results))
 
-            results[query] = businesses
+    def scrape_multiple_queries(
+        self,
+        city: str,
+        queries: List[str],
+        max_pages_per_query: Optional[int] = None
+    ) -> Dict[str, List[Dict]]:
+        """
+        Scrape multiple queries for the same city (sync wrapper)
 
-            # Rate limit between queries
-            if i < len(queries) - 1:
-                self._rate_limit()
+        Args:
+            city: City name
+            queries: List of search queries
+            max_pages_per_query: Max pages per query
 
-        return results
+        Returns:
+            Dictionary mapping query to list of businesses
+        """
+        return self._run_sync(
+            self.scrape_multiple_queries_async(city, queries, max_pages_per_query)
+        )
 
     def get_cache_stats(self) -> dict:
-        """Get cache statistics"""
-        return self.cache.get_stats()
+        """Get cache statistics (HTML tier, plus parsed-result file count)"""
+        stats = self.cache.get_stats()
+        stats['parsed_files'] = self.parsed_cache.get_stats()['total_files']
+        stats['empty_files'] = self.empty_cache.get_stats()['total_files']
+        return stats
+
+    def get_readiness_stats(self) -> dict:
+        """Get Playwright page readiness timings"""
+        return self.readiness_metrics.summary()
+
+    def get_resource_stats(self) -> dict:
+        """Get Playwright request blocking counts"""
+        if self.resource_blocker is None:
+            return {'allowed': 0, 'blocked': 0, 'blocked_by_type': {}}
+        return self.resource_blocker.get_stats()
+
+    def get_pacing_stats(self) -> dict:
+        """Get current adaptive request rate per host"""
+        if self.pacer is None:
+            return {}
+        return self.pacer.get_stats()
 
     def clear_cache(self) -> int:
-        """Clear cache and return number of files deleted"""
-        return self.cache.clear()
+        """Clear all cache tiers and return number of files deleted"""
+        return self.cache.clear() + self.parsed_cache.clear() + self.empty_cache.clear()
+
+    def close(self):
+        """Stop background revalidation, release the browser pool and persist pacing state"""
+        if self._revalidator is not None:
+            # Queued refreshes are dropped (the stale entries are served again next
+            # time); one already fetching gets a bounded wait to finish
+            self._revalidator.shutdown(wait=False, cancel_futures=True)
+            running = list(self._revalidations)
+            if running:
+                _, unfinished = concurrent.futures.wait(running, timeout=config.REVALIDATE_SHUTDOWN_TIMEOUT)
+                if unfinished:
+                    logger.warning(f"Closing with {len(unfinished)} background revalidation(s) still running")
+            self._revalidator = None
+            with self._revalidate_lock:
+                self._revalidating.clear()
+        if self.pacer is not None:
+            self.pacer.save()
+        if self._browser_pool is not None:
+            self._browser_pool.close()
+            self._browser_pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
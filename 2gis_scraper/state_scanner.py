@@ -0,0 +1,188 @@
+"""
+Locate, unescape and partially decode the initialState of 2GIS pages
+
+Index searches instead of a DOTALL regex over the whole page, one
+JavaScript-correct unescape pass instead of unicode_escape (which decodes
+UTF-8 text as latin-1), and subtree-only decoding so callers that need two
+branches of a ~500 KB state don't materialize the rest of it.
+"""
+
+import json
+import re
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+INITIAL_STATE_MARKER = 'var initialState'
+JSON_PARSE_OPEN = "JSON.parse('"
+
+# One JS string escape: \u{...}, \uXXXX, \xHH or any single character
+_JS_ESCAPE = re.compile(r'\\(u\{[0-9a-fA-F]+\}|u[0-9a-fA-F]{4}|x[0-9a-fA-F]{2}|[\s\S])')
+
+# \uD800-\uDFFF: half of a UTF-16 surrogate pair
+_SURROGATE_ESCAPE = re.compile(r'\\u[dD][89a-fA-F]')
+
+_SIMPLE_ESCAPES = {
+    'n': '\n', 'r': '\r', 't': '\t', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+    # Line continuations disappear
+    '\n': '', '\r': '', '\u2028': '', '\u2029': '',
+}
+
+# JSON string token and insignificant whitespace
+_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+
+# The C scanner finds where a value ends; discarding every object as soon as
+# it is built keeps skipped branches from ever being held in memory together
+_DECODER = json.JSONDecoder()
+_SKIPPER = json.JSONDecoder(object_pairs_hook=lambda pairs: None)
+
+
+def _replace_escape(match) -> str:
+    escape = match.group(1)
+    if len(escape) == 1:
+        return _SIMPLE_ESCAPES.get(escape, escape)
+    if escape[0] == 'x':
+        return chr(int(escape[1:], 16))
+    if escape[1] == '{':
+        return chr(int(escape[2:-1], 16))
+    return chr(int(escape[1:], 16))
+
+
+def js_unescape(literal: str) -> str:
+    """
+    Decode the body of a single-quoted JavaScript string literal
+
+    Args:
+        literal: Text between the quotes, escapes intact
+
+    Returns:
+        The string value JavaScript would produce
+    """
+    if '\\' not in literal:
+        return literal
+    value = _JS_ESCAPE.sub(_replace_escape, literal)
+    # \uD83D\uDE00-style pairs decode to two surrogates; join them
+    if _SURROGATE_ESCAPE.search(literal):
+        value = value.encode('utf-16', 'surrogatepass').decode('utf-16', 'replace')
+    return value
+
+
+def find_initial_state_literal(html: str) -> Optional[Tuple[int, int]]:
+    """
+    Find the initialState JSON.parse string literal
+
+    Args:
+        html: Raw HTML content
+
+    Returns:
+        (start, end) of the literal body (between the quotes), or None
+    """
+    marker = html.find(INITIAL_STATE_MARKER)
+    if marker == -1:
+        return None
+    open_pos = html.find(JSON_PARSE_OPEN, marker)
+    # The call must belong to this assignment, not a later script
+    if open_pos == -1 or html.find(';', marker, open_pos) != -1:
+        return None
+
+    start = open_pos + len(JSON_PARSE_OPEN)
+    pos = start
+    while True:
+        quote = html.find("'", pos)
+        if quote == -1:
+            return None
+        # The quote is escaped if preceded by an odd number of backslashes
+        backslashes = 0
+        while html[quote - 1 - backslashes] == '\\':
+            backslashes += 1
+        if backslashes % 2 == 0:
+            return start, quote
+        pos = quote + 1
+
+
+def scan_initial_state(html: str) -> Optional[str]:
+    """
+    Extract the initialState JSON text from a 2GIS page
+
+    Args:
+        html: Raw HTML content
+
+    Returns:
+        JSON text ready for json.loads, or None if the page has no initialState literal
+    """
+    span = find_initial_state_literal(html)
+    if span is None:
+        return None
+    return js_unescape(html[span[0]:span[1]])
+
+
+def _decode_members(text: str, pos: int, tree: Dict[str, Any], out: Dict[str, Any]) -> int:
+    """
+    Walk the object at pos, decoding only the members named in tree
+
+    Args:
+        text: JSON text
+        pos: Index of the object's opening brace
+        tree: Wanted keys; a value of None means "decode this member whole"
+        out: Dictionary receiving the decoded members
+
+    Returns:
+        Index just past the object's closing brace
+    """
+    pos = _WHITESPACE.match(text, pos + 1).end()
+    if text[pos] == '}':
+        return pos + 1
+    while True:
+        key_end = _STRING.match(text, pos).end()
+        raw_key = text[pos + 1:key_end - 1]
+        key = json.loads(text[pos:key_end]) if '\\' in raw_key else raw_key
+        pos = _WHITESPACE.match(text, key_end).end() + 1  # past ':'
+        pos = _WHITESPACE.match(text, pos).end()
+
+        if key in tree and tree[key] is None:
+            out[key], pos = _DECODER.raw_decode(text, pos)
+        elif key in tree and text[pos] == '{':
+            pos = _decode_members(text, pos, tree[key], out.setdefault(key, {}))
+        else:
+            pos = _SKIPPER.raw_decode(text, pos)[1]
+
+        pos = _WHITESPACE.match(text, pos).end()
+        if text[pos] == '}':
+            return pos + 1
+        pos = _WHITESPACE.match(text, pos + 1).end()  # past ','
+
+
+def decode_subtrees(json_text: str, paths: Iterable[Tuple[str, ...]]) -> Dict[str, Any]:
+    """
+    Decode only selected branches of a JSON object
+
+    Sibling branches are scanned but discarded object by object, so peak
+    memory is roughly the size of the requested branches.
+
+    Args:
+        json_text: JSON document whose root is an object
+        paths: Key paths to decode, e.g. [('data', 'entity', 'profile'), ('data', 'context')]
+
+    Returns:
+        Dictionary with the same nesting as the full document, holding only the
+        requested branches that exist
+
+    Raises:
+        json.JSONDecodeError: If the document is malformed
+    """
+    tree: Dict[str, Any] = {}
+    for path in paths:
+        node = tree
+        for key in path[:-1]:
+            node = node.setdefault(key, {})
+        node[path[-1]] = None
+
+    result: Dict[str, Any] = {}
+    pos = _WHITESPACE.match(json_text).end()
+    if pos >= len(json_text) or json_text[pos] != '{':
+        raise json.JSONDecodeError('Expected an object', json_text, pos)
+    try:
+        _decode_members(json_text, pos, tree, result)
+    except (AttributeError, IndexError):
+        # A regex failed to match or the text ended early
+        raise json.JSONDecodeError('Malformed JSON', json_text, pos)
+    return result
@@ -16,6 +16,7 @@ sys.path.insert(0, str(scraper_dir))
 from scraper import TwoGISScraper
 from exporter import DataExporter
 from profile_scraper import enrich_businesses
+from models import to_dicts
 import config
 
 # Configure logging to show in terminal
@@ -55,7 +56,8 @@ def scrape_with_progress(
         - status: str description
         - count: int total businesses found
         - current_page: int current page number
-        - total_pages: int total pages to scrape
+        - total_pages: int total pages to scrape (capped at the search's real page count)
+        - total_available: int results the search reports (once page 1 is parsed)
         - qualified_count: int businesses without websites (if filtering)
         - businesses: List[Dict] final results (only in last yield)
 
@@ -86,40 +88,54 @@ def scrape_with_progress(
         exporter = DataExporter()
 
         all_businesses = []
+        total_available = None
 
-        # Scrape pages with progress tracking
-        for page in range(1, max_pages + 1):
-            yield {
-                'progress': (page - 1) / max_pages * 0.5,  # First 50% for search
-                'status': f'Scraping page {page}/{max_pages}...',
-                'count': len(all_businesses),
-                'current_page': page,
-                'total_pages': max_pages
-            }
-
-            # Scrape single page
-            page_businesses = scraper.scrape_page(city, query, page)
+        # The browser pool (if any) is released even if a page fails or the caller stops early
+        try:
+            # Scrape pages with progress tracking
+            for page in range(1, max_pages + 1):
+                if page > max_pages:
+                    # Page 1 showed the search has fewer pages
+                    break
 
-            if not page_businesses:
-                # No more results
                 yield {
-                    'progress': 0.5,
-                    'status': f'No more results found on page {page}',
+                    'progress': (page - 1) / max_pages * 0.5,  # First 50% for search
+                    'status': f'Scraping page {page}/{max_pages}...',
                     'count': len(all_businesses),
                     'current_page': page,
-                    'total_pages': page
+                    'total_pages': max_pages
                 }
-                break
 
-            all_businesses.extend(page_businesses)
+                # Scrape single page (page 1 also reports the search's real totals)
+                result = scraper.scrape_search_page(city, query, page)
+                page_businesses = result.businesses
+                if page == 1 and result.total_pages:
+                    total_available = result.total_items
+                    max_pages = min(max_pages, result.total_pages)
+
+                if not page_businesses:
+                    # No more results
+                    yield {
+                        'progress': 0.5,
+                        'status': f'No more results found on page {page}',
+                        'count': len(all_businesses),
+                        'current_page': page,
+                        'total_pages': page
+                    }
+                    break
+
+                all_businesses.extend(page_businesses)
 
-            yield {
-                'progress': page / max_pages * 0.5,
-                'status': f'Found {len(page_businesses)} businesses on page {page}',
-                'count': len(all_businesses),
-                'current_page': page,
-                'total_pages': max_pages
-            }
+                yield {
+                    'progress': page / max_pages * 0.5,
+                    'status': f'Found {len(page_businesses)} businesses on page {page}',
+                    'count': len(all_businesses),
+                    'current_page': page,
+                    'total_pages': max_pages,
+                    'total_available': total_available
+                }
+        finally:
+            scraper.close()
 
         # Stage 2: Enrich with contact info if requested
         if enrich_contacts and all_businesses:
@@ -185,7 +201,7 @@ def scrape_with_progress(
             'status': f'Complete! Found {len(all_businesses)} businesses',
             'count': len(all_businesses),
             'qualified_count': qualified_count,
-            'businesses': all_businesses
+            'businesses': to_dicts(all_businesses)
         }
 
     except Exception as e:
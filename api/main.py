@@ -11,6 +11,7 @@ from pathlib import Path
 from collections import deque
 import logging
 import io
+import asyncio
 
 # Add scraper to path
 sys.path.insert(0, str(Path(__file__).parent.parent / '2gis_scraper'))
@@ -18,6 +19,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / '2gis_scraper'))
 from scraper import TwoGISScraper
 from profile_scraper import ProfileEnricher
 from exporter import DataExporter
+from models import to_dicts
 
 app = FastAPI(title="2GIS Lead Scraper API")
 
@@ -95,24 +97,31 @@ async def scrape_businesses(request: ScrapeRequest):
 
         # Search businesses
         logger.info(f"Searching {request.pages} pages...")
-        businesses = []
-        for page in range(1, request.pages + 1):
-            logger.info(f"Scraping page {page}/{request.pages}...")
-            results = scraper.scrape_page(request.city, request.query, page=page)
-            if not results:
-                logger.info(f"No results on page {page}, stopping")
-                break
-            logger.info(f"Found {len(results)} businesses on page {page}")
-            businesses.extend(results)
+        try:
+            # Page 1 reports the search totals; pages 2..N are fetched a few
+            # at a time and no page after the first empty one is requested
+            first_page = await scraper.scrape_search_page_async(request.city, request.query, 1)
+            logger.info(f"Search reports {first_page.total_items} results over {first_page.total_pages} pages")
+            businesses = await scraper.scrape_async(
+                request.city,
+                request.query,
+                max_pages=request.pages,
+                first_page=first_page
+            )
+        finally:
+            # close() may wait for a background cache refresh; keep the event loop free
+            await asyncio.to_thread(scraper.close)
 
         logger.info(f"Total businesses found: {len(businesses)}")
 
-        # Enrich with contacts if requested
+        # Enrich with contacts if requested (only firms the search data left incomplete)
+        enrichment = None
         if request.enrich_contacts and businesses:
             logger.info(f"Starting contact enrichment for {len(businesses)} businesses...")
             async with ProfileEnricher() as enricher:
                 businesses = await enricher.enrich_businesses(businesses, request.city)
-            logger.info(f"Contact enrichment completed")
+                enrichment = enricher.last_plan.get_stats()
+            logger.info(f"Contact enrichment completed ({enrichment['visits_saved']} profile visits saved)")
 
         # Apply filters
         if request.no_website_only:
@@ -137,13 +146,16 @@ async def scrape_businesses(request: ScrapeRequest):
         return {
             "success": True,
             "total": len(businesses),
+            "total_available": first_page.total_items,
+            "total_pages": first_page.total_pages,
             "stats": {
                 "with_phone": with_phone,
                 "with_website": with_website,
                 "no_website": len(businesses) - with_website,
                 "avg_rating": round(avg_rating, 1)
             },
-            "businesses": businesses
+            "enrichment": enrichment,
+            "businesses": to_dicts(businesses)
         }
 
     except Exception as e: